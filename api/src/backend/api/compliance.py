@@ -158,6 +158,29 @@ def generate_scan_compliance(
                 compliance_overview[compliance_id]["requirements_status"]["failed"] += 1
 
 
+def generate_compliance_requirements_by_check(
+    compliance_overview: dict,
+) -> dict[str, list[tuple[str, str]]]:
+    """
+    Generate an index of the requirements of a compliance overview by check.
+
+    Args:
+        compliance_overview (dict): The compliance overview of a provider, as generated by
+            `generate_compliance_overview_template`.
+
+    Returns:
+        dict: A dictionary mapping each check ID to the (compliance ID, requirement ID) that include it.
+    """
+    requirements_by_check = {}
+    for compliance_id, compliance in compliance_overview.items():
+        for requirement_id, requirement in compliance["requirements"].items():
+            for check_id in requirement.get("checks", {}):
+                requirements_by_check.setdefault(check_id, []).append(
+                    (compliance_id, requirement_id)
+                )
+    return requirements_by_check
+
+
 def generate_compliance_overview_template(prowler_compliance: dict):
     """
     Generate a compliance overview template for all provider types.
@@ -27,6 +27,7 @@ from api.models import (
     Finding,
     Integration,
     Invitation,
+    LatestScanSummary,
     Membership,
     PermissionChoices,
     Processor,
@@ -37,7 +38,6 @@ from api.models import (
     ResourceTag,
     Role,
     Scan,
-    ScanSummary,
     SeverityChoices,
     StateChoices,
     StatusChoices,
@@ -731,26 +731,26 @@ class ComplianceOverviewFilter(FilterSet):
         }
 
 
-class ScanSummaryFilter(FilterSet):
+class LatestScanSummaryFilter(FilterSet):
     inserted_at = DateFilter(field_name="inserted_at", lookup_expr="date")
-    provider_id = UUIDFilter(field_name="scan__provider__id", lookup_expr="exact")
+    provider_id = UUIDFilter(field_name="provider__id", lookup_expr="exact")
     provider_type = ChoiceFilter(
-        field_name="scan__provider__provider", choices=Provider.ProviderChoices.choices
+        field_name="provider__provider", choices=Provider.ProviderChoices.choices
     )
     provider_type__in = ChoiceInFilter(
-        field_name="scan__provider__provider", choices=Provider.ProviderChoices.choices
+        field_name="provider__provider", choices=Provider.ProviderChoices.choices
     )
     region = CharFilter(field_name="region")
 
     class Meta:
-        model = ScanSummary
+        model = LatestScanSummary
         fields = {
             "inserted_at": ["date", "gte", "lte"],
             "region": ["exact", "icontains", "in"],
         }
 
 
-class ServiceOverviewFilter(ScanSummaryFilter):
+class ServiceOverviewFilter(LatestScanSummaryFilter):
     def is_valid(self):
         # Check if at least one of the inserted_at filters is present
         inserted_at_filters = [
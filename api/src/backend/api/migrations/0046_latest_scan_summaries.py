@@ -0,0 +1,171 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max, Sum
+
+import api.db_utils
+import api.rls
+from api.db_router import MainRouter
+
+SUMMARY_COUNTERS = [
+    "fail",
+    "_pass",
+    "muted",
+    "total",
+    "new",
+    "changed",
+    "unchanged",
+    "fail_new",
+    "fail_changed",
+    "pass_new",
+    "pass_changed",
+    "muted_new",
+    "muted_changed",
+]
+
+
+def populate_latest_scan_summaries(apps, schema_editor):
+    Scan = apps.get_model("api", "Scan")
+    ScanSummary = apps.get_model("api", "ScanSummary")
+    LatestScanSummary = apps.get_model("api", "LatestScanSummary")
+
+    latest_scans = (
+        Scan.objects.using(MainRouter.admin_db)
+        .filter(state="completed")
+        .order_by("provider_id", "-inserted_at")
+        .distinct("provider_id")
+        .values_list("id", "tenant_id", "provider_id")
+    )
+    for scan_id, tenant_id, provider_id in latest_scans.iterator():
+        summaries = (
+            ScanSummary.objects.using(MainRouter.admin_db)
+            .filter(tenant_id=tenant_id, scan_id=scan_id)
+            .values("service", "severity", "region")
+            .annotate(
+                summary_inserted_at=Max("inserted_at"),
+                **{f"{counter}_sum": Sum(counter) for counter in SUMMARY_COUNTERS},
+            )
+        )
+        LatestScanSummary.objects.using(MainRouter.admin_db).bulk_create(
+            [
+                LatestScanSummary(
+                    tenant_id=tenant_id,
+                    provider_id=provider_id,
+                    scan_id=scan_id,
+                    inserted_at=summary["summary_inserted_at"],
+                    service=summary["service"],
+                    severity=summary["severity"],
+                    region=summary["region"],
+                    **{
+                        counter: summary[f"{counter}_sum"]
+                        for counter in SUMMARY_COUNTERS
+                    },
+                )
+                for summary in summaries
+            ],
+            batch_size=3000,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0045_alter_scan_output_location"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LatestScanSummary",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("inserted_at", models.DateTimeField(editable=False)),
+                ("service", models.TextField()),
+                (
+                    "severity",
+                    api.db_utils.SeverityEnumField(
+                        choices=[
+                            ("critical", "Critical"),
+                            ("high", "High"),
+                            ("medium", "Medium"),
+                            ("low", "Low"),
+                            ("informational", "Informational"),
+                        ]
+                    ),
+                ),
+                ("region", models.TextField()),
+                ("_pass", models.IntegerField(db_column="pass", default=0)),
+                ("fail", models.IntegerField(default=0)),
+                ("muted", models.IntegerField(default=0)),
+                ("total", models.IntegerField(default=0)),
+                ("new", models.IntegerField(default=0)),
+                ("changed", models.IntegerField(default=0)),
+                ("unchanged", models.IntegerField(default=0)),
+                ("fail_new", models.IntegerField(default=0)),
+                ("fail_changed", models.IntegerField(default=0)),
+                ("pass_new", models.IntegerField(default=0)),
+                ("pass_changed", models.IntegerField(default=0)),
+                ("muted_new", models.IntegerField(default=0)),
+                ("muted_changed", models.IntegerField(default=0)),
+                (
+                    "provider",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_scan_summaries",
+                        related_query_name="latest_scan_summary",
+                        to="api.provider",
+                    ),
+                ),
+                (
+                    "scan",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_summaries",
+                        related_query_name="latest_summary",
+                        to="api.scan",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.tenant"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "latest_scan_summaries",
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["tenant_id", "provider_id"],
+                        name="lss_tenant_provider_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="latestscansummary",
+            constraint=models.UniqueConstraint(
+                fields=("tenant", "provider", "service", "severity", "region"),
+                name="unique_latest_scan_summary",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="latestscansummary",
+            constraint=api.rls.RowLevelSecurityConstraint(
+                "tenant_id",
+                name="rls_on_latestscansummary",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ),
+        migrations.RunPython(
+            populate_latest_scan_summaries, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,36 @@
+from functools import partial
+
+from django.db import migrations
+
+from api.db_utils import create_index_on_partitions, drop_index_on_partitions
+
+KEYSET_INDEXES = {
+    "find_tenant_status_id_idx": "tenant_id, status, id",
+    "find_tenant_severity_id_idx": "tenant_id, severity, id",
+    "find_tenant_check_id_idx": "tenant_id, check_id, id",
+}
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("api", "0046_latest_scan_summaries"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            partial(
+                create_index_on_partitions,
+                parent_table="findings",
+                index_name=index_name,
+                columns=columns,
+            ),
+            reverse_code=partial(
+                drop_index_on_partitions,
+                parent_table="findings",
+                index_name=index_name,
+            ),
+        )
+        for index_name, columns in KEYSET_INDEXES.items()
+    ]
@@ -811,6 +811,17 @@ class Finding(PostgresPartitionedModel, RowLevelSecurityProtectedModel):
                 fields=["tenant_id", "scan_id", "check_id"],
                 name="find_tenant_scan_check_idx",
             ),
+            # Keyset pagination of the most common filters
+            models.Index(
+                fields=["tenant_id", "status", "id"], name="find_tenant_status_id_idx"
+            ),
+            models.Index(
+                fields=["tenant_id", "severity", "id"],
+                name="find_tenant_severity_id_idx",
+            ),
+            models.Index(
+                fields=["tenant_id", "check_id", "id"], name="find_tenant_check_id_idx"
+            ),
         ]
 
     class JSONAPIMeta:
@@ -1344,6 +1355,76 @@ class ScanSummary(RowLevelSecurityProtectedModel):
         resource_name = "scan-summaries"
 
 
+class LatestScanSummary(RowLevelSecurityProtectedModel):
+    """
+    Summary of the latest completed scan of every provider, by service, severity and region.
+
+    It is refreshed once the summary of a scan is stored, so the overviews read a few rows per
+    provider instead of looking for the latest scans and aggregating their summaries per request.
+    """
+
+    objects = ActiveProviderManager()
+    all_objects = models.Manager()
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    # When the summary of the scan was stored
+    inserted_at = models.DateTimeField(editable=False)
+    service = models.TextField(blank=False)
+    severity = SeverityEnumField(choices=SeverityChoices)
+    region = models.TextField(blank=False)
+    _pass = models.IntegerField(db_column="pass", default=0)
+    fail = models.IntegerField(default=0)
+    muted = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    new = models.IntegerField(default=0)
+    changed = models.IntegerField(default=0)
+    unchanged = models.IntegerField(default=0)
+
+    fail_new = models.IntegerField(default=0)
+    fail_changed = models.IntegerField(default=0)
+    pass_new = models.IntegerField(default=0)
+    pass_changed = models.IntegerField(default=0)
+    muted_new = models.IntegerField(default=0)
+    muted_changed = models.IntegerField(default=0)
+
+    provider = models.ForeignKey(
+        Provider,
+        on_delete=models.CASCADE,
+        related_name="latest_scan_summaries",
+        related_query_name="latest_scan_summary",
+    )
+    scan = models.ForeignKey(
+        Scan,
+        on_delete=models.CASCADE,
+        related_name="latest_summaries",
+        related_query_name="latest_summary",
+    )
+
+    class Meta(RowLevelSecurityProtectedModel.Meta):
+        db_table = "latest_scan_summaries"
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=("tenant", "provider", "service", "severity", "region"),
+                name="unique_latest_scan_summary",
+            ),
+            RowLevelSecurityConstraint(
+                field="tenant_id",
+                name="rls_on_%(class)s",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["tenant_id", "provider_id"],
+                name="lss_tenant_provider_idx",
+            ),
+        ]
+
+    class JSONAPIMeta:
+        resource_name = "latest-scan-summaries"
+
+
 class Integration(RowLevelSecurityProtectedModel):
     class IntegrationChoices(models.TextChoices):
         AMAZON_S3 = "amazon_s3", _("Amazon S3")
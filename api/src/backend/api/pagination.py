@@ -1,6 +1,131 @@
 from drf_spectacular_jsonapi.schemas.pagination import JsonApiPageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework_json_api.serializers import ValidationError
+from uuid6 import UUID
+
+from api.uuid_utils import transform_into_uuid7
 
 
 class ComplianceOverviewPagination(JsonApiPageNumberPagination):
     page_size = 50
     max_page_size = 100
+
+
+class FindingPagination(JsonApiPageNumberPagination):
+    """
+    Page number pagination with a keyset mode on the UUIDv7 `id` of the findings.
+
+    The keyset mode is enabled with the `page[cursor]` query parameter, empty for the first page and set to
+    the `next_cursor` of the previous page for the following ones. Each page is read with `id < cursor`, so
+    PostgreSQL skips the partitions newer than the timestamp embedded in the cursor and reads the rows from
+    the index instead of counting and skipping the previous pages. UUIDv7 ids are ordered by creation time,
+    so in this mode the findings can only be sorted by `inserted_at`.
+    """
+
+    cursor_query_param = "page[cursor]"
+    cursor_ordering = {
+        "-inserted_at": "-id",
+        "inserted_at": "id",
+    }
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        ordering = self.get_cursor_ordering(request)
+        cursor = self.get_cursor(request)
+        if cursor:
+            if ordering.startswith("-"):
+                queryset = queryset.filter(id__lt=cursor)
+            else:
+                queryset = queryset.filter(id__gt=cursor)
+
+        page_size = self.get_page_size(request)
+        # Fetch one more row to know whether there is a next page without counting
+        rows = list(queryset.order_by(ordering)[: page_size + 1])
+        self.cursor = cursor
+        self.next_cursor = (
+            getattr(rows[page_size - 1], "pk", rows[page_size - 1])
+            if len(rows) > page_size
+            else None
+        )
+        return rows[:page_size]
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        url = self.request.build_absolute_uri()
+        return Response(
+            {
+                "results": data,
+                "meta": {
+                    "pagination": {
+                        "cursor": str(self.cursor) if self.cursor else None,
+                        "next_cursor": (
+                            str(self.next_cursor) if self.next_cursor else None
+                        ),
+                    }
+                },
+                "links": {
+                    "first": replace_query_param(url, self.cursor_query_param, ""),
+                    "next": (
+                        replace_query_param(
+                            url, self.cursor_query_param, str(self.next_cursor)
+                        )
+                        if self.next_cursor
+                        else None
+                    ),
+                    "prev": None,
+                },
+            }
+        )
+
+    def get_cursor(self, request) -> UUID | None:
+        value = request.query_params.get(self.cursor_query_param)
+        if not value:
+            return None
+        try:
+            return transform_into_uuid7(UUID(value))
+        except (ValueError, ValidationError):
+            raise ValidationError(
+                [
+                    {
+                        "detail": "Invalid cursor, it must be the UUIDv7 of a finding.",
+                        "status": 400,
+                        "source": {"parameter": self.cursor_query_param},
+                        "code": "invalid",
+                    }
+                ]
+            )
+
+    def get_cursor_ordering(self, request) -> str:
+        sort = request.query_params.get("sort") or "-inserted_at"
+        if sort not in self.cursor_ordering:
+            raise ValidationError(
+                [
+                    {
+                        "detail": "Cursor pagination only supports sorting by inserted_at.",
+                        "status": 400,
+                        "source": {"parameter": "sort"},
+                        "code": "invalid",
+                    }
+                ]
+            )
+        return self.cursor_ordering[sort]
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Enables keyset pagination. Leave it empty for the first page and use the "
+                "`next_cursor` of the previous page for the following ones. Only sorting by `inserted_at` "
+                "is supported in this mode.",
+                "schema": {"type": "string"},
+            }
+        ]
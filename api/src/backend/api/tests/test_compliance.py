@@ -2,6 +2,7 @@ from unittest.mock import MagicMock, patch
 
 from api.compliance import (
     generate_compliance_overview_template,
+    generate_compliance_requirements_by_check,
     generate_scan_compliance,
     get_prowler_provider_checks,
     get_prowler_provider_compliance,
@@ -208,6 +209,29 @@ class TestCompliance:
             is None
         )
 
+    def test_generate_compliance_requirements_by_check(self):
+        compliance_overview = {
+            "compliance1": {
+                "requirements": {
+                    "requirement1": {"checks": {"check1": None, "check2": None}},
+                    "requirement2": {"checks": {}},
+                },
+            },
+            "compliance2": {
+                "requirements": {
+                    "requirement1": {"checks": {"check2": None}},
+                },
+            },
+        }
+
+        assert generate_compliance_requirements_by_check(compliance_overview) == {
+            "check1": [("compliance1", "requirement1")],
+            "check2": [
+                ("compliance1", "requirement1"),
+                ("compliance2", "requirement1"),
+            ],
+        }
+
     @patch("api.models.Provider.ProviderChoices")
     def test_generate_compliance_overview_template(self, mock_provider_choices):
         mock_provider_choices.values = ["aws"]
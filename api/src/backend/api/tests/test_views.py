@@ -3381,6 +3381,62 @@ class TestFindingViewSet:
             == findings_fixture[0].status
         )
 
+    def test_findings_list_cursor(self, authenticated_client, findings_fixture):
+        expected_ids = sorted(
+            (str(finding.id) for finding in findings_fixture), reverse=True
+        )
+
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": "", "page[size]": 1},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == expected_ids[:1]
+        pagination = response.json()["meta"]["pagination"]
+        assert pagination["cursor"] is None
+        assert pagination["next_cursor"] == expected_ids[0]
+        assert response.json()["links"]["next"] is not None
+
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {
+                "filter[inserted_at]": TODAY,
+                "page[cursor]": pagination["next_cursor"],
+                "page[size]": 1,
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == expected_ids[1:2]
+        assert response.json()["meta"]["pagination"]["next_cursor"] is None
+        assert response.json()["links"]["next"] is None
+
+    def test_findings_list_cursor_ascending(
+        self, authenticated_client, findings_fixture
+    ):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": "", "sort": "inserted_at"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["data"]] == sorted(
+            str(finding.id) for finding in findings_fixture
+        )
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"page[cursor]": "not-a-uuid"},
+            {"page[cursor]": "d3b4b1b0-5c5c-4c4c-8c8c-1b1b1b1b1b1b"},
+            {"page[cursor]": "", "sort": "severity"},
+        ],
+    )
+    def test_findings_list_cursor_invalid(self, authenticated_client, params):
+        response = authenticated_client.get(
+            reverse("finding-list"), {"filter[inserted_at]": TODAY, **params}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["errors"][0]["code"] == "invalid"
+
     @pytest.mark.parametrize(
         "include_values, expected_resources",
         [
@@ -80,6 +80,7 @@ from api.filters import (
     InvitationFilter,
     LatestFindingFilter,
     LatestResourceFilter,
+    LatestScanSummaryFilter,
     MembershipFilter,
     ProcessorFilter,
     ProviderFilter,
@@ -88,7 +89,6 @@ from api.filters import (
     ResourceFilter,
     RoleFilter,
     ScanFilter,
-    ScanSummaryFilter,
     ServiceOverviewFilter,
     TaskFilter,
     TenantFilter,
@@ -99,6 +99,7 @@ from api.models import (
     Finding,
     Integration,
     Invitation,
+    LatestScanSummary,
     LighthouseConfiguration,
     Membership,
     Processor,
@@ -116,14 +117,13 @@ from api.models import (
     SAMLDomainIndex,
     SAMLToken,
     Scan,
-    ScanSummary,
     SeverityChoices,
     StateChoices,
     Task,
     User,
     UserRoleRelationship,
 )
-from api.pagination import ComplianceOverviewPagination
+from api.pagination import ComplianceOverviewPagination, FindingPagination
 from api.rbac.permissions import Permissions, get_providers, get_role
 from api.rls import Tenant
 from api.utils import (
@@ -2304,6 +2304,7 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
     queryset = Finding.all_objects.all()
     serializer_class = FindingSerializer
     filterset_class = FindingFilter
+    pagination_class = FindingPagination
     http_method_names = ["get"]
     ordering = ["-inserted_at"]
     ordering_fields = [
@@ -3496,7 +3497,7 @@ class ComplianceOverviewViewSet(BaseRLSViewSet, TaskManagementMixin):
 )
 @method_decorator(CACHE_DECORATOR, name="list")
 class OverviewViewSet(BaseRLSViewSet):
-    queryset = ScanSummary.objects.all()
+    queryset = LatestScanSummary.objects.all()
     http_method_names = ["get"]
     ordering = ["-inserted_at"]
     # RBAC required permissions (implicit -> MANAGE_PROVIDERS enable unlimited visibility or check the visibility of
@@ -3505,12 +3506,16 @@ class OverviewViewSet(BaseRLSViewSet):
 
     def get_queryset(self):
         role = get_role(self.request.user)
-        providers = get_providers(role)
+        # The summaries of the latest completed scan of every provider, refreshed when a scan completes
+        queryset = LatestScanSummary.all_objects.filter(
+            tenant_id=self.request.tenant_id
+        )
 
         if not role.unlimited_visibility:
-            self.allowed_providers = providers
+            self.allowed_providers = get_providers(role)
+            queryset = queryset.filter(provider__in=self.allowed_providers)
 
-        return ScanSummary.all_objects.filter(tenant_id=self.request.tenant_id)
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "providers":
@@ -3527,7 +3532,7 @@ class OverviewViewSet(BaseRLSViewSet):
         if self.action == "providers":
             return None
         elif self.action in ["findings", "findings_severity"]:
-            return ScanSummaryFilter
+            return LatestScanSummaryFilter
         elif self.action == "services":
             return ServiceOverviewFilter
         return None
@@ -3544,33 +3549,15 @@ class OverviewViewSet(BaseRLSViewSet):
     def providers(self, request):
         tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
 
-        findings_aggregated = (
-            queryset.filter(scan_id__in=latest_scan_ids)
-            .values(
-                "scan__provider_id",
-                provider=F("scan__provider__provider"),
-            )
-            .annotate(
-                findings_passed=Coalesce(Sum("_pass"), 0),
-                findings_failed=Coalesce(Sum("fail"), 0),
-                findings_muted=Coalesce(Sum("muted"), 0),
-                total_findings=Coalesce(Sum("total"), 0),
-            )
+        findings_aggregated = queryset.values(
+            "provider_id",
+            provider_type=F("provider__provider"),
+        ).annotate(
+            findings_passed=Coalesce(Sum("_pass"), 0),
+            findings_failed=Coalesce(Sum("fail"), 0),
+            findings_muted=Coalesce(Sum("muted"), 0),
+            total_findings=Coalesce(Sum("total"), 0),
         )
 
         resources_aggregated = (
@@ -3586,8 +3573,8 @@ class OverviewViewSet(BaseRLSViewSet):
         for row in findings_aggregated:
             overview.append(
                 {
-                    "provider": row["provider"],
-                    "total_resources": resource_map.get(row["scan__provider_id"], 0),
+                    "provider": row["provider_type"],
+                    "total_resources": resource_map.get(row["provider_id"], 0),
                     "total_findings": row["total_findings"],
                     "findings_passed": row["findings_passed"],
                     "findings_failed": row["findings_failed"],
@@ -3602,26 +3589,8 @@ class OverviewViewSet(BaseRLSViewSet):
 
     @action(detail=False, methods=["get"], url_name="findings")
     def findings(self, request):
-        tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
 
         aggregated_totals = filtered_queryset.aggregate(
             _pass=Sum("_pass") or 0,
@@ -3648,26 +3617,8 @@ class OverviewViewSet(BaseRLSViewSet):
 
     @action(detail=False, methods=["get"], url_name="findings_severity")
     def findings_severity(self, request):
-        tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
 
         severity_counts = (
             filtered_queryset.values("severity")
@@ -3685,26 +3636,8 @@ class OverviewViewSet(BaseRLSViewSet):
 
     @action(detail=False, methods=["get"], url_name="services")
     def services(self, request):
-        tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
 
         services_data = (
             filtered_queryset.values("service")
@@ -258,6 +258,8 @@ DJANGO_TMP_OUTPUT_DIRECTORY = env.str(
     "DJANGO_TMP_OUTPUT_DIRECTORY", "/tmp/prowler_api_output"
 )
 DJANGO_FINDINGS_BATCH_SIZE = env.str("DJANGO_FINDINGS_BATCH_SIZE", 1000)
+# Output writers running at the same time while generating the outputs of a scan
+DJANGO_OUTPUT_WRITERS_MAX_WORKERS = env.int("DJANGO_OUTPUT_WRITERS_MAX_WORKERS", 4)
 
 DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = env.str("DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET", "")
 DJANGO_OUTPUT_S3_AWS_ACCESS_KEY_ID = env.str("DJANGO_OUTPUT_S3_AWS_ACCESS_KEY_ID", "")
@@ -274,6 +276,9 @@ SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 
 DJANGO_DELETION_BATCH_SIZE = env.int("DJANGO_DELETION_BATCH_SIZE", 5000)
 
+# Findings written to the database at once while a scan is running
+DJANGO_SCAN_INGESTION_BATCH_SIZE = env.int("DJANGO_SCAN_INGESTION_BATCH_SIZE", 1000)
+
 # SAML requirement
 CSRF_COOKIE_SECURE = True
 SESSION_COOKIE_SECURE = True
@@ -1,17 +1,192 @@
+from celery import current_task
 from celery.utils.log import get_task_logger
-from django.db import DatabaseError
+from django.db import DatabaseError, connections, transaction
 
 from api.db_router import MainRouter
 from api.db_utils import batch_delete, rls_transaction
-from api.models import Finding, Provider, Resource, Scan, ScanSummary, Tenant
+from api.models import (
+    Finding,
+    LatestScanSummary,
+    Provider,
+    Resource,
+    ResourceFindingMapping,
+    Scan,
+    ScanSummary,
+    Tenant,
+)
+from api.uuid_utils import transform_into_uuid7, uuid7_start
 
 logger = get_task_logger(__name__)
 
+# Maximum time to wait for the locks of the findings tables before deleting a partition in batches
+PARTITION_LOCK_TIMEOUT = "5s"
+
+
+def _add_to_summary(deletion_summary: dict, step_summary: dict):
+    for model_label, count in step_summary.items():
+        deletion_summary[model_label] = deletion_summary.get(model_label, 0) + count
+
+
+def _report_progress(
+    step: str, completed_steps: int, total_steps: int, deletion_summary: dict
+):
+    """
+    Store the progress of the deletion in the result of the running task, so it is shown by the tasks endpoint.
+
+    Nothing is stored when the deletion does not run within a Celery task.
+    """
+    if current_task is None or current_task.request.called_directly:
+        return
+    current_task.update_state(
+        state="PROGRESS",
+        meta={
+            "step": step,
+            "completed_steps": completed_steps,
+            "total_steps": total_steps,
+            "deleted": deletion_summary,
+        },
+    )
+
+
+def _get_partitions(cursor, parent_table: str) -> dict[str, str]:
+    """Return the partitions of `parent_table` by their bounds, leaving out the default partition."""
+    cursor.execute(
+        """
+        SELECT pg_get_expr(c.relpartbound, c.oid), i.inhrelid::regclass::text
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = %s::regclass
+        """,
+        [parent_table],
+    )
+    return {
+        bound: partition for bound, partition in cursor.fetchall() if bound != "DEFAULT"
+    }
+
+
+def _is_exclusive_partition(
+    cursor, partition: str, tenant_id: str, scan_ids: list | None
+) -> bool:
+    """
+    Check whether all the findings in the partition belong to the tenant and, if `scan_ids` is given, to those scans.
+
+    The tenant is checked with two range scans on the tenant index that stop at the first row of another tenant.
+    """
+    cursor.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {partition} WHERE tenant_id < %s) "
+        f"OR EXISTS (SELECT 1 FROM {partition} WHERE tenant_id > %s)",
+        [tenant_id, tenant_id],
+    )
+    if cursor.fetchone()[0]:
+        return False
+    if scan_ids is not None:
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {partition} "
+            "WHERE tenant_id = %s AND scan_id <> ALL(%s::uuid[]))",
+            [tenant_id, scan_ids],
+        )
+        if cursor.fetchone()[0]:
+            return False
+    return True
+
+
+def _count_rows(cursor, table: str) -> int:
+    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def truncate_findings_partitions(tenant_id: str, scan_ids: list | None = None) -> dict:
+    """
+    Empty the `Finding` and `ResourceFindingMapping` partitions that only hold findings of the deleted entity.
+
+    Both tables are partitioned by the UUIDv7 of the finding with the same bounds, so a mappings partition only
+    references the findings of the partition with its bounds. For every findings partition that only holds findings
+    of the tenant (and of `scan_ids`, when deleting a provider), the mappings partition is truncated and the findings
+    partition is detached, truncated and attached back, since a partition referenced by a foreign key cannot be
+    truncated while attached. The partitions holding findings of other tenants or providers, the default one, and
+    the ones whose locks cannot be acquired in time are left to the batched deletes.
+
+    Args:
+        tenant_id (str): Tenant ID the findings belong to.
+        scan_ids (list | None): Scans of the deleted provider, or None when deleting the whole tenant.
+
+    Returns:
+        dict: The count of deleted objects per model.
+    """
+    deletion_summary = {}
+    if scan_ids is not None:
+        if not scan_ids:
+            return deletion_summary
+        scan_ids = [str(scan_id) for scan_id in scan_ids]
+    tenant_id = str(tenant_id)
+
+    findings_table = Finding._meta.db_table
+    mappings_table = ResourceFindingMapping._meta.db_table
+    with connections[MainRouter.admin_db].cursor() as cursor:
+        findings_partitions = _get_partitions(cursor, findings_table)
+        mappings_partitions = _get_partitions(cursor, mappings_table)
+
+    for bound, partition in findings_partitions.items():
+        mappings_partition = mappings_partitions.get(bound)
+        if mappings_partition is None:
+            continue
+
+        # Cheap check without locks, most partitions are discarded here
+        with connections[MainRouter.admin_db].cursor() as cursor:
+            if not _is_exclusive_partition(cursor, partition, tenant_id, scan_ids):
+                continue
+            findings_count = _count_rows(cursor, partition)
+            if not findings_count:
+                continue
+            mappings_count = _count_rows(cursor, mappings_partition)
+
+        try:
+            with transaction.atomic(using=MainRouter.admin_db):
+                with connections[MainRouter.admin_db].cursor() as cursor:
+                    cursor.execute(
+                        f"SET LOCAL lock_timeout = '{PARTITION_LOCK_TIMEOUT}'"
+                    )
+                    cursor.execute(
+                        f"LOCK TABLE {mappings_table}, {findings_table} IN ACCESS EXCLUSIVE MODE"
+                    )
+                    # New findings could have been stored before getting the locks
+                    if not _is_exclusive_partition(
+                        cursor, partition, tenant_id, scan_ids
+                    ):
+                        continue
+                    cursor.execute(f"TRUNCATE TABLE {mappings_partition}")
+                    cursor.execute(
+                        f"ALTER TABLE {findings_table} DETACH PARTITION {partition}"
+                    )
+                    cursor.execute(f"TRUNCATE TABLE {partition}")
+                    cursor.execute(
+                        f"ALTER TABLE {findings_table} ATTACH PARTITION {partition} {bound}"
+                    )
+        except DatabaseError as db_error:
+            logger.warning(
+                f"Unable to truncate the partition {partition}, its findings will be deleted in batches: {db_error}"
+            )
+            continue
+
+        logger.info(f"Truncated the partitions {partition} and {mappings_partition}")
+        _add_to_summary(
+            deletion_summary,
+            {
+                Finding._meta.label: findings_count,
+                ResourceFindingMapping._meta.label: mappings_count,
+            },
+        )
+
+    return deletion_summary
+
 
 def delete_provider(tenant_id: str, pk: str):
     """
     Gracefully deletes an instance of a provider along with its related data.
 
+    The findings partitions that only hold findings of the provider are truncated first. The rest of the findings
+    are deleted in batches scan by scan, bounded by the date of the scan so only the partitions from then on are read.
+
     Args:
         tenant_id (str): Tenant ID the resources belong to.
         pk (str): The primary key of the Provider instance to delete.
@@ -25,26 +200,56 @@ def delete_provider(tenant_id: str, pk: str):
     """
     with rls_transaction(tenant_id):
         instance = Provider.all_objects.get(pk=pk)
+        scan_ids = list(
+            Scan.all_objects.filter(provider=instance).values_list("id", flat=True)
+        )
         deletion_summary = {}
         deletion_steps = [
+            (
+                "Latest Scan Summaries",
+                LatestScanSummary.all_objects.filter(provider=instance),
+            ),
             ("Scan Summaries", ScanSummary.all_objects.filter(scan__provider=instance)),
+            *(
+                (
+                    "Findings",
+                    Finding.all_objects.filter(
+                        scan_id=scan_id,
+                        id__gte=uuid7_start(transform_into_uuid7(scan_id)),
+                    ),
+                )
+                for scan_id in scan_ids
+            ),
+            # Findings stored before the scan started, if any
             ("Findings", Finding.all_objects.filter(scan__provider=instance)),
             ("Resources", Resource.all_objects.filter(provider=instance)),
             ("Scans", Scan.all_objects.filter(provider=instance)),
         ]
+    total_steps = len(deletion_steps) + 2
+
+    _report_progress("Findings Partitions", 0, total_steps, deletion_summary)
+    try:
+        _add_to_summary(
+            deletion_summary, truncate_findings_partitions(tenant_id, scan_ids)
+        )
+    except DatabaseError as db_error:
+        logger.error(f"Error truncating the Findings partitions: {db_error}")
+        raise
 
-    for step_name, queryset in deletion_steps:
+    for completed_steps, (step_name, queryset) in enumerate(deletion_steps, start=1):
+        _report_progress(step_name, completed_steps, total_steps, deletion_summary)
         try:
             _, step_summary = batch_delete(tenant_id, queryset)
-            deletion_summary.update(step_summary)
+            _add_to_summary(deletion_summary, step_summary)
         except DatabaseError as db_error:
             logger.error(f"Error deleting {step_name}: {db_error}")
             raise
 
+    _report_progress("Provider", total_steps - 1, total_steps, deletion_summary)
     try:
         with rls_transaction(tenant_id):
             _, provider_summary = instance.delete()
-        deletion_summary.update(provider_summary)
+        _add_to_summary(deletion_summary, provider_summary)
     except DatabaseError as db_error:
         logger.error(f"Error deleting Provider: {db_error}")
         raise
@@ -55,6 +260,8 @@ def delete_tenant(pk: str):
     """
     Gracefully deletes an instance of a tenant along with its related data.
 
+    The findings partitions that only hold findings of the tenant are truncated before deleting its providers.
+
     Args:
         pk (str): The primary key of the Tenant instance to delete.
 
@@ -62,11 +269,11 @@ def delete_tenant(pk: str):
         dict: A dictionary with the count of deleted objects per model,
               including related models.
     """
-    deletion_summary = {}
+    deletion_summary = truncate_findings_partitions(pk)
 
     for provider in Provider.objects.using(MainRouter.admin_db).filter(tenant_id=pk):
         summary = delete_provider(pk, provider.id)
-        deletion_summary.update(summary)
+        _add_to_summary(deletion_summary, summary)
 
     Tenant.objects.using(MainRouter.admin_db).filter(id=pk).delete()
 
@@ -1,6 +1,11 @@
+import io
 import os
 import re
+import threading
+import time
 import zipfile
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import config.django.base as base
@@ -57,6 +62,9 @@ from prowler.lib.outputs.ocsf.ocsf import OCSF
 
 logger = get_task_logger(__name__)
 
+# Size of the parts of the outputs uploaded to S3, the minimum allowed by S3 is 5 MiB
+S3_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 COMPLIANCE_CLASS_MAP = {
     "aws": [
@@ -112,6 +120,94 @@ OUTPUT_FORMATS_MAPPING = {
 }
 
 
+class OutputWritersPool:
+    """
+    Run the output writers of a scan concurrently in a thread pool.
+
+    The findings of every batch are transformed once and handed to every writer. The batches of a
+    writer run in the order they were submitted and never at the same time, since every writer
+    keeps its own file, while different writers run in parallel. Each writer has at most
+    `max_pending_batches` batches queued, so submitting a batch waits for the slowest writer
+    instead of keeping the whole scan in memory.
+
+    Attributes:
+        timings (dict): Seconds spent by every writer.
+    """
+
+    def __init__(self, max_workers: int, max_pending_batches: int = 2):
+        self.max_pending_batches = max_pending_batches
+        self.timings = defaultdict(float)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prowler-outputs"
+        )
+        self._pending = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Let the running writers finish without raising their errors over the original one
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def submit(self, name: str, write, *args) -> None:
+        """
+        Queue a batch for the writer.
+
+        Args:
+            name (str): The name of the writer, its batches run in order.
+            write: The function writing the batch.
+            args: The arguments of the function.
+        """
+        pending = self._pending[name]
+        while len(pending) >= self.max_pending_batches:
+            pending.popleft().result()
+        previous = pending[-1] if pending else None
+        pending.append(self._executor.submit(self._write, name, previous, write, args))
+
+    def wait(self) -> dict[str, float]:
+        """
+        Wait for every queued batch, raising the first error of the writers.
+
+        Returns:
+            dict[str, float]: Seconds spent by every writer.
+        """
+        for pending in self._pending.values():
+            while pending:
+                pending.popleft().result()
+        return dict(self.timings)
+
+    def _write(self, name: str, previous, write, args) -> None:
+        # The executor runs the tasks in order, so the previous batch is already running
+        if previous is not None:
+            previous.result()
+        start = time.perf_counter()
+        try:
+            write(*args)
+        finally:
+            with self._lock:
+                self.timings[name] += time.perf_counter() - start
+
+
+def _get_output_files(output_directory: str, exclude: str = None):
+    """
+    Yield the path of every output file of the scan along with its path in the ZIP archive.
+
+    Args:
+        output_directory (str): The directory where the output files are located, its parent
+            directory is compressed along with the compliance outputs.
+        exclude (str, optional): A file to leave out, e.g. the ZIP archive itself.
+    """
+    parent_dir = os.path.dirname(output_directory)
+    exclude_abs = os.path.abspath(exclude) if exclude else None
+    for foldername, _, filenames in os.walk(parent_dir):
+        for filename in filenames:
+            file_path = os.path.join(foldername, filename)
+            if os.path.abspath(file_path) == exclude_abs:
+                continue
+            yield file_path, os.path.relpath(file_path, start=parent_dir)
+
+
 def _compress_output_files(output_directory: str) -> str:
     """
     Compress output files from all configured output formats into a ZIP archive.
@@ -123,21 +219,98 @@ def _compress_output_files(output_directory: str) -> str:
         str: The full path to the newly created ZIP archive.
     """
     zip_path = f"{output_directory}.zip"
-    parent_dir = os.path.dirname(output_directory)
-    zip_path_abs = os.path.abspath(zip_path)
 
     with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for foldername, _, filenames in os.walk(parent_dir):
-            for filename in filenames:
-                file_path = os.path.join(foldername, filename)
-                if os.path.abspath(file_path) == zip_path_abs:
-                    continue
-                arcname = os.path.relpath(file_path, start=parent_dir)
-                zipf.write(file_path, arcname)
+        for file_path, arcname in _get_output_files(output_directory, exclude=zip_path):
+            zipf.write(file_path, arcname)
 
     return zip_path
 
 
+class S3MultipartUpload(io.RawIOBase):
+    """
+    Writable stream uploading its content to an S3 object as it is written.
+
+    The content is buffered until a part of `part_size` bytes is filled and then uploaded as a part
+    of a multipart upload, so the object is never staged on disk nor fully kept in memory. Closing
+    the stream uploads the last part and completes the upload, while `abort` discards it. Objects
+    smaller than a part are uploaded with a single request.
+    """
+
+    def __init__(
+        self, s3_client, bucket: str, key: str, part_size: int = S3_MULTIPART_PART_SIZE
+    ):
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = None
+        self._aborted = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._aborted:
+                return
+            if self._upload_id is None:
+                self.s3_client.put_object(
+                    Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer)
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": self._parts},
+                )
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._buffer.clear()
+            super().close()
+
+    def abort(self) -> None:
+        """Discard the parts uploaded so far, nothing is uploaded once the stream is aborted."""
+        self._aborted = True
+        if self._upload_id is not None:
+            upload_id, self._upload_id = self._upload_id, None
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=upload_id
+            )
+
+    def _upload_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key
+            )["UploadId"]
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+
 def get_s3_client():
     """
     Create and return a boto3 S3 client using AWS credentials from environment variables.
@@ -171,20 +344,23 @@ def get_s3_client():
     return s3_client
 
 
-def _upload_to_s3(tenant_id: str, zip_path: str, scan_id: str) -> str | None:
+def _upload_to_s3(tenant_id: str, output_directory: str, scan_id: str) -> str | None:
     """
-    Upload the specified ZIP file to an S3 bucket.
+    Compress the output files of a scan straight into a ZIP archive in an S3 bucket.
+
+    The archive is streamed to S3 with a multipart upload while it is compressed, so it is never
+    written to disk and every output file is read once. The compliance outputs are also uploaded
+    on their own.
     If the S3 bucket environment variables are not configured,
     the function returns None without performing an upload.
     Args:
         tenant_id (str): The tenant identifier, used as part of the S3 key prefix.
-        zip_path (str): The local file system path to the ZIP file to be uploaded.
+        output_directory (str): The directory where the output files are located, the archive
+            is named after it.
         scan_id (str): The scan identifier, used as part of the S3 key prefix.
     Returns:
         str: The S3 URI of the uploaded file (e.g., "s3://<bucket>/<key>") if successful.
-        None: If the required environment variables for the S3 bucket are not set.
-    Raises:
-        botocore.exceptions.ClientError: If the upload attempt to S3 fails for any reason.
+        None: If the required environment variables for the S3 bucket are not set or the upload fails.
     """
     bucket = base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET
     if not bucket:
@@ -193,16 +369,20 @@ def _upload_to_s3(tenant_id: str, zip_path: str, scan_id: str) -> str | None:
     try:
         s3 = get_s3_client()
 
-        # Upload the ZIP file (outputs) to the S3 bucket
-        zip_key = f"{tenant_id}/{scan_id}/{os.path.basename(zip_path)}"
-        s3.upload_file(
-            Filename=zip_path,
-            Bucket=bucket,
-            Key=zip_key,
-        )
+        # Stream the ZIP file (outputs) to the S3 bucket
+        zip_key = f"{tenant_id}/{scan_id}/{os.path.basename(output_directory)}.zip"
+        upload = S3MultipartUpload(s3, bucket, zip_key)
+        try:
+            with zipfile.ZipFile(upload, "w", zipfile.ZIP_DEFLATED) as zipf:
+                for file_path, arcname in _get_output_files(output_directory):
+                    zipf.write(file_path, arcname)
+        except Exception:
+            upload.abort()
+            raise
+        upload.close()
 
         # Upload the compliance directory to the S3 bucket
-        compliance_dir = os.path.join(os.path.dirname(zip_path), "compliance")
+        compliance_dir = os.path.join(os.path.dirname(output_directory), "compliance")
         for filename in os.listdir(compliance_dir):
             local_path = os.path.join(compliance_dir, filename)
             if not os.path.isfile(local_path):
@@ -1,18 +1,32 @@
 import json
 import time
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
-from copy import deepcopy
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from hashlib import blake2b, md5
 
 from celery.utils.log import get_task_logger
 from config.settings.celery import CELERY_DEADLOCK_ATTEMPTS
-from django.db import IntegrityError, OperationalError
-from django.db.models import Case, Count, IntegerField, Prefetch, Sum, When
+from django.conf import settings
+from django.db import IntegrityError, OperationalError, connection
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    Max,
+    Prefetch,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import MD5, Coalesce, Concat
 from tasks.utils import CustomEncoder
 
 from api.compliance import (
     PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
-    generate_scan_compliance,
+    generate_compliance_requirements_by_check,
 )
 from api.db_utils import (
     create_objects_in_batches,
@@ -23,11 +37,14 @@ from api.exceptions import ProviderConnectionError
 from api.models import (
     ComplianceRequirementOverview,
     Finding,
+    LatestScanSummary,
     Processor,
     Provider,
     Resource,
+    ResourceFindingMapping,
     ResourceScanSummary,
     ResourceTag,
+    ResourceTagMapping,
     Scan,
     ScanSummary,
     StateChoices,
@@ -40,6 +57,61 @@ from prowler.lib.scan.scan import Scan as ProwlerScan
 
 logger = get_task_logger(__name__)
 
+# Fields of the existing resources updated when a scan stores them again
+RESOURCE_UPSERT_FIELDS = [
+    "region",
+    "service",
+    "type",
+    "metadata",
+    "details",
+    "partition",
+    "updated_at",
+]
+# Fields hashed to detect the resources whose content changed since they were stored
+RESOURCE_CONTENT_FIELDS = [
+    "region",
+    "service",
+    "type",
+    "metadata",
+    "details",
+    "partition",
+]
+RESOURCE_CONTENT_SEPARATOR = "\x1f"
+# The fields joined by the separator, dropping the leading one
+RESOURCE_CONTENT_HASH = MD5(
+    Concat(
+        *[
+            expression
+            for field in RESOURCE_CONTENT_FIELDS
+            for expression in (
+                Value(RESOURCE_CONTENT_SEPARATOR),
+                Coalesce(F(field), Value("")),
+            )
+        ][1:]
+    )
+)
+# Compact representation of the findings of the previous scan
+FINDING_STATUSES = list(FindingStatus.values)
+FINDING_STATUS_CODES = {status: code for code, status in enumerate(FINDING_STATUSES)}
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+NO_FIRST_SEEN_AT = -(2**63)
+# Counters of the ScanSummary rows
+SCAN_SUMMARY_COUNTERS = [
+    "fail",
+    "_pass",
+    "muted",
+    "total",
+    "new",
+    "changed",
+    "unchanged",
+    "fail_new",
+    "fail_changed",
+    "pass_new",
+    "pass_changed",
+    "muted_new",
+    "muted_changed",
+]
+
 
 def _create_finding_delta(
     last_status: FindingStatus | None | str, new_status: FindingStatus | None
@@ -107,6 +179,609 @@ def _store_resources(
     return resource_instance, (resource_instance.uid, resource_instance.region)
 
 
+def _get_resource_content_hash(resource: Resource) -> str:
+    """
+    Return the MD5 of the content fields of the resource, as `RESOURCE_CONTENT_HASH` computes it in PostgreSQL.
+
+    The values are converted as they are when stored, e.g. the details dictionaries into text.
+    """
+    values = (
+        Resource._meta.get_field(field).get_prep_value(getattr(resource, field))
+        for field in RESOURCE_CONTENT_FIELDS
+    )
+    content = RESOURCE_CONTENT_SEPARATOR.join(
+        "" if value is None else value for value in values
+    )
+    return md5(content.encode(), usedforsecurity=False).hexdigest()
+
+
+class PreviousScanFindings:
+    """
+    Status and first_seen_at of the findings of the previous completed scan of a provider, by UID.
+
+    The UIDs are stored as 64-bit hashes in a sorted array, along with the statuses and the
+    first_seen_at timestamps in the same order, so the findings of a large scan take a few bytes each
+    and their deltas are resolved in memory with a binary search instead of a query per finding.
+    """
+
+    def __init__(self):
+        self._hashes = array("q")
+        self._statuses = array("b")
+        self._first_seen_at = array("q")
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    @staticmethod
+    def _hash(uid: str) -> int:
+        return int.from_bytes(
+            blake2b(uid.encode(), digest_size=8).digest(), "big", signed=True
+        )
+
+    @classmethod
+    def load(cls, tenant_id: str, provider_id: str, scan_id: str):
+        """
+        Stream the findings of the last completed scan of the provider, other than the given scan.
+
+        It must be called within a transaction.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            provider_id (str): The ID of the provider.
+            scan_id (str): The ID of the current scan.
+
+        Returns:
+            PreviousScanFindings: The findings of the previous scan, empty if there is none.
+        """
+        previous_findings = cls()
+        previous_scan_id = (
+            Scan.all_objects.filter(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                state=StateChoices.COMPLETED,
+            )
+            .exclude(id=scan_id)
+            .order_by("-inserted_at")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if not previous_scan_id:
+            return previous_findings
+
+        hashes = array("q")
+        statuses = array("b")
+        first_seen_at = array("q")
+        # Ordered by their UUIDv7 so the most recent finding of a repeated UID is the last one
+        for uid, status, finding_first_seen_at in (
+            Finding.all_objects.filter(tenant_id=tenant_id, scan_id=previous_scan_id)
+            .order_by("id")
+            .values_list("uid", "status", "first_seen_at")
+            .iterator(chunk_size=settings.DJANGO_SCAN_INGESTION_BATCH_SIZE)
+        ):
+            hashes.append(cls._hash(uid))
+            statuses.append(FINDING_STATUS_CODES[status])
+            first_seen_at.append(
+                (finding_first_seen_at - EPOCH) // timedelta(microseconds=1)
+                if finding_first_seen_at
+                else NO_FIRST_SEEN_AT
+            )
+
+        # The sort is stable, so repeated UIDs keep their order
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        previous_findings._hashes = array("q", (hashes[i] for i in order))
+        previous_findings._statuses = array("b", (statuses[i] for i in order))
+        previous_findings._first_seen_at = array("q", (first_seen_at[i] for i in order))
+        logger.info(
+            f"Loaded {len(previous_findings)} findings of the previous scan {previous_scan_id}"
+        )
+        return previous_findings
+
+    def get(self, uid: str) -> tuple[str, datetime | None] | None:
+        """
+        Return the status and first_seen_at of the finding in the previous scan, or None if it was not there.
+        """
+        uid_hash = self._hash(uid)
+        index = bisect_right(self._hashes, uid_hash) - 1
+        if index < 0 or self._hashes[index] != uid_hash:
+            return None
+        first_seen_at = self._first_seen_at[index]
+        return (
+            FINDING_STATUSES[self._statuses[index]],
+            (
+                EPOCH + timedelta(microseconds=first_seen_at)
+                if first_seen_at != NO_FIRST_SEEN_AT
+                else None
+            ),
+        )
+
+
+class FindingsIngestion:
+    """
+    Store the findings of a scan, and their resources and tags, in batches.
+
+    Every batch is written in a single transaction with multi-row INSERT statements: resources and
+    tags are upserted with `ON CONFLICT`, and the findings and their resource mappings are inserted
+    at once, instead of several round trips per finding. The objects already stored during the scan
+    are cached, and the caches are only updated once the transaction of the batch is committed, so a
+    batch can be retried on deadlocks.
+
+    The deltas are resolved with the findings of the previous scan, and only the finding UIDs missing
+    there are looked up in the findings table.
+
+    Attributes:
+        resource_cache (dict): Resources stored during the scan, by UID.
+        resource_failed_findings_cache (dict): Number of failed and not muted findings, by resource UID.
+        unique_resources (set): (UID, region) of the resources of the scan.
+        scan_resource_cache (set): (ID, service, region, type) of the resources of the scan.
+        check_status_by_region (dict): Status of every check by region and check ID, from the
+            non-muted findings, to create the compliance overviews of the scan.
+        scan_summary (dict): Counters of the findings by (check ID, service, severity, region),
+            stored as the ScanSummary rows of the scan with `store_scan_summary`.
+    """
+
+    def __init__(
+        self,
+        tenant_id: str,
+        scan_instance: Scan,
+        provider_instance: Provider,
+        previous_findings: PreviousScanFindings | None = None,
+        batch_size: int = None,
+    ):
+        self.tenant_id = tenant_id
+        self.scan_instance = scan_instance
+        self.provider_instance = provider_instance
+        self.previous_findings = previous_findings or PreviousScanFindings()
+        self.batch_size = batch_size or settings.DJANGO_SCAN_INGESTION_BATCH_SIZE
+        self.resource_cache: dict[str, Resource] = {}
+        self.tag_cache: dict[tuple[str, str], ResourceTag] = {}
+        self.resource_tag_cache: set[tuple[str, tuple[str, str]]] = set()
+        self.last_status_cache: dict[str, tuple] = {}
+        self.resource_failed_findings_cache: dict[str, int] = defaultdict(int)
+        self.unique_resources: set[tuple[str, str]] = set()
+        self.scan_resource_cache: set[tuple[str, str, str, str]] = set()
+        self.check_status_by_region: dict[str, dict[str, str]] = {}
+        self.scan_summary: dict[tuple[str, str, str, str], dict[str, int]] = (
+            defaultdict(lambda: dict.fromkeys(SCAN_SUMMARY_COUNTERS, 0))
+        )
+
+    def ingest(self, findings: list[ProwlerFinding], progress: float) -> None:
+        """
+        Store the findings in batches of `batch_size` and the progress of the scan.
+
+        Args:
+            findings (list[ProwlerFinding]): The findings of a check.
+            progress (float): The progress of the scan once the check is completed.
+        """
+        valid_findings = []
+        for finding in findings:
+            if finding is None:
+                logger.error(f"None finding detected on scan {self.scan_instance.id}.")
+                continue
+            valid_findings.append(finding)
+
+        self.scan_instance.progress = progress
+        if not valid_findings:
+            with rls_transaction(self.tenant_id):
+                self.scan_instance.save(update_fields=["progress"])
+            return
+
+        for start in range(0, len(valid_findings), self.batch_size):
+            batch = valid_findings[start : start + self.batch_size]
+            is_last_batch = start + self.batch_size >= len(valid_findings)
+            for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
+                try:
+                    with rls_transaction(self.tenant_id):
+                        stored_batch = self._store_batch(batch)
+                        if is_last_batch:
+                            self.scan_instance.save(update_fields=["progress"])
+                    break
+                except (OperationalError, IntegrityError) as db_err:
+                    if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
+                        logger.warning(
+                            f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
+                            f"detected when storing {len(batch)} findings on scan {self.scan_instance.id}. Retrying..."
+                        )
+                        time.sleep(0.1 * (2**attempt))
+                        continue
+                    else:
+                        raise db_err
+            self._update_caches(stored_batch)
+
+    def _store_batch(self, findings: list[ProwlerFinding]) -> dict:
+        """Write the batch, it must be called within a transaction. It returns the objects to cache."""
+        resources, synced_resources = self._store_resources(findings)
+        new_tags, new_resource_tags = self._store_tags(findings, resources)
+        last_statuses, fetched_statuses = self._get_last_statuses(findings)
+
+        finding_instances = []
+        resource_finding_mappings = []
+        failed_findings = defaultdict(int)
+        check_statuses = []
+        summary_findings = []
+        for finding in findings:
+            resource_instance = resources[finding.resource_uid]
+            last_status, last_first_seen_at = last_statuses[finding.uid]
+            status = FindingStatus[finding.status]
+            delta = _create_finding_delta(last_status, status)
+            # For the findings prior to the change, when a first finding is found with delta!="new" it will be
+            # assigned a current date as first_seen_at and the successive findings with the same UID will
+            # always get the date of the previous finding.
+            # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
+            # attribute will be assigned the current date, the following findings will get that date.
+            if not last_first_seen_at:
+                last_first_seen_at = datetime.now(tz=timezone.utc)
+
+            finding_instance = Finding(
+                tenant_id=self.tenant_id,
+                uid=finding.uid,
+                delta=delta,
+                check_metadata=finding.get_metadata(),
+                status=status,
+                status_extended=finding.status_extended,
+                severity=finding.severity,
+                impact=finding.severity,
+                raw_result=finding.raw,
+                check_id=finding.check_id,
+                scan=self.scan_instance,
+                first_seen_at=last_first_seen_at,
+                muted=finding.muted,
+                # If the finding is muted at this time the reason must be the configured Mutelist
+                muted_reason="Muted by mutelist" if finding.muted else None,
+                compliance=finding.compliance,
+                # Denormalized resource data, as Finding.add_resources does
+                resource_regions=[resource_instance.region],
+                resource_services=[resource_instance.service],
+                resource_types=[resource_instance.type],
+            )
+            finding_instances.append(finding_instance)
+            resource_finding_mappings.append(
+                ResourceFindingMapping(
+                    tenant_id=self.tenant_id,
+                    resource=resource_instance,
+                    finding=finding_instance,
+                )
+            )
+
+            # Increment failed_findings_count cache if the finding status is FAIL and not muted
+            if status == FindingStatus.FAIL and not finding.muted:
+                failed_findings[finding.resource_uid] += 1
+
+            if not finding.muted:
+                check_statuses.append(
+                    (resource_instance.region, finding.check_id, status.value)
+                )
+            summary_findings.append(
+                (
+                    (
+                        finding.check_id,
+                        resource_instance.service,
+                        finding.severity,
+                        resource_instance.region,
+                    ),
+                    status,
+                    delta,
+                    finding.muted,
+                )
+            )
+
+        Finding.objects.bulk_create(finding_instances, batch_size=self.batch_size)
+        ResourceFindingMapping.objects.bulk_create(
+            resource_finding_mappings, batch_size=self.batch_size
+        )
+
+        return {
+            "resources": resources,
+            "synced_resources": synced_resources,
+            "new_tags": new_tags,
+            "new_resource_tags": new_resource_tags,
+            "fetched_statuses": fetched_statuses,
+            "failed_findings": failed_findings,
+            "check_statuses": check_statuses,
+            "summary_findings": summary_findings,
+        }
+
+    def _store_resources(
+        self, findings: list[ProwlerFinding]
+    ) -> tuple[dict[str, Resource], dict[str, Resource]]:
+        """
+        Sync the resources of the findings not synced yet during the scan.
+
+        All the findings of a resource within the scan are collapsed into the first one, so its metadata
+        is serialized once. The content hash of the resources already stored is computed by PostgreSQL
+        and compared with the one from the finding: the new resources are upserted and only the changed
+        ones are updated, with batched `UPDATE ... FROM (VALUES ...)` statements.
+
+        Returns:
+            tuple:
+                - dict[str, Resource]: The resources of the batch, by UID.
+                - dict[str, Resource]: The resources synced in this batch, by UID.
+        """
+        resources = {}
+        synced_resources = {}
+        for finding in findings:
+            resource_uid = finding.resource_uid
+            if resource_uid in resources:
+                continue
+            if resource_uid in self.resource_cache:
+                resources[resource_uid] = self.resource_cache[resource_uid]
+            else:
+                resources[resource_uid] = synced_resources[resource_uid] = Resource(
+                    tenant_id=self.tenant_id,
+                    provider=self.provider_instance,
+                    uid=resource_uid,
+                    name=finding.resource_name,
+                    region=finding.region,
+                    service=finding.service_name,
+                    type=finding.resource_type,
+                    metadata=json.dumps(finding.resource_metadata, cls=CustomEncoder),
+                    details=finding.resource_details,
+                    partition=finding.partition,
+                )
+        if not synced_resources:
+            return resources, synced_resources
+
+        stored_resources = {
+            stored_resource["uid"]: stored_resource
+            for stored_resource in Resource.objects.filter(
+                tenant_id=self.tenant_id,
+                provider=self.provider_instance,
+                uid__in=synced_resources.keys(),
+            )
+            .annotate(content_hash=RESOURCE_CONTENT_HASH)
+            .values("uid", "id", "region", "content_hash")
+        }
+        new_resources = []
+        changed_resources = []
+        for resource_uid, resource in synced_resources.items():
+            stored_resource = stored_resources.get(resource_uid)
+            if stored_resource is None:
+                new_resources.append(resource)
+                continue
+            # The existing resources keep their ID and name, and also their region if the finding has none
+            resource.id = stored_resource["id"]
+            if not resource.region:
+                resource.region = stored_resource["region"]
+            if _get_resource_content_hash(resource) != stored_resource["content_hash"]:
+                changed_resources.append(resource)
+
+        # Resources stored concurrently since they were read are updated on conflict
+        for with_region in (True, False):
+            upserted_resources = [
+                resource
+                for resource in new_resources
+                if bool(resource.region) == with_region
+            ]
+            if upserted_resources:
+                Resource.objects.bulk_create(
+                    upserted_resources,
+                    batch_size=self.batch_size,
+                    update_conflicts=True,
+                    unique_fields=["tenant_id", "provider_id", "uid"],
+                    update_fields=[
+                        field
+                        for field in RESOURCE_UPSERT_FIELDS
+                        if with_region or field != "region"
+                    ],
+                )
+
+        if changed_resources:
+            self._update_resources(changed_resources)
+
+        return resources, synced_resources
+
+    def _update_resources(self, resources: list[Resource]) -> None:
+        """Update the content fields of the resources with batched `UPDATE ... FROM (VALUES ...)` statements."""
+        assignments = ", ".join(
+            f"{field} = v.{field}" for field in RESOURCE_CONTENT_FIELDS
+        )
+        row = f"(%s::uuid{', %s::text' * len(RESOURCE_CONTENT_FIELDS)})"
+        updated_at = datetime.now(tz=timezone.utc)
+        with connection.cursor() as cursor:
+            for start in range(0, len(resources), self.batch_size):
+                batch = resources[start : start + self.batch_size]
+                values = []
+                for resource in batch:
+                    values.append(resource.id)
+                    values.extend(
+                        Resource._meta.get_field(field).get_prep_value(
+                            getattr(resource, field)
+                        )
+                        for field in RESOURCE_CONTENT_FIELDS
+                    )
+                cursor.execute(
+                    f"UPDATE {Resource._meta.db_table} AS r "
+                    f"SET {assignments}, updated_at = %s "
+                    f"FROM (VALUES {', '.join([row] * len(batch))}) "
+                    f"AS v(id, {', '.join(RESOURCE_CONTENT_FIELDS)}) "
+                    "WHERE r.tenant_id = %s AND r.id = v.id",
+                    [updated_at, *values, self.tenant_id],
+                )
+
+    def _store_tags(
+        self, findings: list[ProwlerFinding], resources: dict[str, Resource]
+    ) -> tuple[dict[tuple[str, str], ResourceTag], set[tuple[str, tuple[str, str]]]]:
+        """
+        Upsert the tags of the findings not stored yet during the scan and map them to their resources.
+
+        Returns:
+            tuple:
+                - dict[tuple[str, str], ResourceTag]: The tags upserted in this batch, by key and value.
+                - set[tuple[str, tuple[str, str]]]: The (resource UID, tag) mapped in this batch.
+        """
+        new_tags = {}
+        resource_tags = {}
+        for finding in findings:
+            for key, value in finding.resource_tags.items():
+                tag_key = (key, value)
+                if tag_key not in self.tag_cache and tag_key not in new_tags:
+                    new_tags[tag_key] = ResourceTag(
+                        tenant_id=self.tenant_id, key=key, value=value
+                    )
+                resource_tag_key = (finding.resource_uid, tag_key)
+                if resource_tag_key not in self.resource_tag_cache:
+                    resource_tags[resource_tag_key] = tag_key
+
+        if new_tags:
+            ResourceTag.objects.bulk_create(
+                new_tags.values(),
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=["tenant_id", "key", "value"],
+                update_fields=["updated_at"],
+            )
+
+        if resource_tags:
+            ResourceTagMapping.objects.bulk_create(
+                [
+                    ResourceTagMapping(
+                        tenant_id=self.tenant_id,
+                        resource=resources[resource_uid],
+                        tag=self.tag_cache.get(tag_key) or new_tags[tag_key],
+                    )
+                    for resource_uid, tag_key in resource_tags
+                ],
+                batch_size=self.batch_size,
+                ignore_conflicts=True,
+            )
+
+        return new_tags, set(resource_tags)
+
+    def _get_last_statuses(
+        self, findings: list[ProwlerFinding]
+    ) -> tuple[dict[str, tuple], dict[str, tuple]]:
+        """
+        Return the status and first_seen_at of the most recent finding with the same UID, by UID.
+
+        Returns:
+            tuple:
+                - dict[str, tuple]: The status and first_seen_at of every finding UID of the batch.
+                - dict[str, tuple]: The ones read from the findings table, to cache them.
+        """
+        last_statuses = {}
+        fetched_statuses = {}
+        uids_to_fetch = set()
+        for finding in findings:
+            if finding.uid in last_statuses:
+                continue
+            if finding.uid in self.last_status_cache:
+                last_statuses[finding.uid] = self.last_status_cache[finding.uid]
+                continue
+            previous_finding = self.previous_findings.get(finding.uid)
+            if previous_finding:
+                last_statuses[finding.uid] = previous_finding
+            else:
+                uids_to_fetch.add(finding.uid)
+
+        if uids_to_fetch:
+            fetched_statuses.update({uid: (None, None) for uid in uids_to_fetch})
+            most_recent_findings = (
+                Finding.all_objects.filter(
+                    tenant_id=self.tenant_id, uid__in=uids_to_fetch
+                )
+                .order_by("uid", "-inserted_at")
+                .distinct("uid")
+                .values("uid", "status", "first_seen_at")
+            )
+            for most_recent_finding in most_recent_findings:
+                fetched_statuses[most_recent_finding["uid"]] = (
+                    most_recent_finding["status"],
+                    most_recent_finding["first_seen_at"],
+                )
+            last_statuses.update(fetched_statuses)
+        return last_statuses, fetched_statuses
+
+    def _update_caches(self, stored_batch: dict) -> None:
+        for resource_uid in stored_batch["synced_resources"]:
+            # Initialize all processed resources in the cache
+            self.resource_failed_findings_cache[resource_uid] = 0
+        self.resource_cache.update(stored_batch["synced_resources"])
+        self.tag_cache.update(stored_batch["new_tags"])
+        self.resource_tag_cache.update(stored_batch["new_resource_tags"])
+        self.last_status_cache.update(stored_batch["fetched_statuses"])
+        for resource_uid, failed_count in stored_batch["failed_findings"].items():
+            self.resource_failed_findings_cache[resource_uid] += failed_count
+        for region, check_id, status in stored_batch["check_statuses"]:
+            current_status = self.check_status_by_region.setdefault(region, {})
+            if current_status.get(check_id) != "FAIL":
+                current_status[check_id] = status
+        for summary_key, status, delta, muted in stored_batch["summary_findings"]:
+            self._count_scan_summary(
+                self.scan_summary[summary_key], status, delta, muted
+            )
+        for resource_instance in stored_batch["resources"].values():
+            self.unique_resources.add((resource_instance.uid, resource_instance.region))
+            # Update scan resource summaries
+            self.scan_resource_cache.add(
+                (
+                    str(resource_instance.id),
+                    resource_instance.service,
+                    resource_instance.region,
+                    resource_instance.type,
+                )
+            )
+
+    @staticmethod
+    def _count_scan_summary(
+        counters: dict[str, int], status: FindingStatus, delta: str, muted: bool
+    ) -> None:
+        """Add a finding to the counters of its ScanSummary row, as `aggregate_findings` counts them."""
+        counters["total"] += 1
+        if muted:
+            counters["muted"] += 1
+            if delta == Finding.DeltaChoices.NEW:
+                counters["muted_new"] += 1
+            elif delta == Finding.DeltaChoices.CHANGED:
+                counters["muted_changed"] += 1
+            return
+
+        status_counter = None
+        if status == FindingStatus.FAIL:
+            counters["fail"] += 1
+            status_counter = "fail"
+        elif status == FindingStatus.PASS:
+            counters["_pass"] += 1
+            status_counter = "pass"
+        if delta == Finding.DeltaChoices.NEW:
+            counters["new"] += 1
+            if status_counter:
+                counters[f"{status_counter}_new"] += 1
+        elif delta == Finding.DeltaChoices.CHANGED:
+            counters["changed"] += 1
+            if status_counter:
+                counters[f"{status_counter}_changed"] += 1
+        else:
+            counters["unchanged"] += 1
+
+    def store_scan_summary(self) -> int:
+        """
+        Store the ScanSummary rows of the scan from the counters accumulated while the findings were
+        stored, with a single bulk insert.
+
+        Returns:
+            int: The number of ScanSummary rows stored.
+        """
+        scan_summaries = [
+            ScanSummary(
+                tenant_id=self.tenant_id,
+                scan_id=self.scan_instance.id,
+                check_id=check_id,
+                service=service,
+                severity=severity,
+                region=region,
+                **counters,
+            )
+            for (
+                check_id,
+                service,
+                severity,
+                region,
+            ), counters in self.scan_summary.items()
+        ]
+        with rls_transaction(self.tenant_id):
+            ScanSummary.objects.bulk_create(scan_summaries, batch_size=3000)
+        return len(scan_summaries)
+
+
 def perform_prowler_scan(
     tenant_id: str,
     scan_id: str,
@@ -130,8 +805,7 @@ def perform_prowler_scan(
 
     """
     exception = None
-    unique_resources = set()
-    scan_resource_cache: set[tuple[str, str, str, str]] = set()
+    ingestion = None
     start_time = time.time()
     exc = None
 
@@ -180,179 +854,27 @@ def perform_prowler_scan(
 
         prowler_scan = ProwlerScan(provider=prowler_provider, checks=checks_to_execute)
 
-        resource_cache = {}
-        tag_cache = {}
-        last_status_cache = {}
-        resource_failed_findings_cache = defaultdict(int)
-
+        with rls_transaction(tenant_id):
+            previous_findings = PreviousScanFindings.load(
+                tenant_id, provider_id, scan_id
+            )
+        ingestion = FindingsIngestion(
+            tenant_id, scan_instance, provider_instance, previous_findings
+        )
         for progress, findings in prowler_scan.scan():
-            for finding in findings:
-                if finding is None:
-                    logger.error(f"None finding detected on scan {scan_id}.")
-                    continue
-                for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
-                    try:
-                        with rls_transaction(tenant_id):
-                            # Process resource
-                            resource_uid = finding.resource_uid
-                            if resource_uid not in resource_cache:
-                                # Get or create the resource
-                                resource_instance, _ = Resource.objects.get_or_create(
-                                    tenant_id=tenant_id,
-                                    provider=provider_instance,
-                                    uid=resource_uid,
-                                    defaults={
-                                        "region": finding.region,
-                                        "service": finding.service_name,
-                                        "type": finding.resource_type,
-                                        "name": finding.resource_name,
-                                    },
-                                )
-                                resource_cache[resource_uid] = resource_instance
-
-                                # Initialize all processed resources in the cache
-                                resource_failed_findings_cache[resource_uid] = 0
-                            else:
-                                resource_instance = resource_cache[resource_uid]
-
-                        # Update resource fields if necessary
-                        updated_fields = []
-                        if (
-                            finding.region
-                            and resource_instance.region != finding.region
-                        ):
-                            resource_instance.region = finding.region
-                            updated_fields.append("region")
-                        if resource_instance.service != finding.service_name:
-                            resource_instance.service = finding.service_name
-                            updated_fields.append("service")
-                        if resource_instance.type != finding.resource_type:
-                            resource_instance.type = finding.resource_type
-                            updated_fields.append("type")
-                        if resource_instance.metadata != finding.resource_metadata:
-                            resource_instance.metadata = json.dumps(
-                                finding.resource_metadata, cls=CustomEncoder
-                            )
-                            updated_fields.append("metadata")
-                        if resource_instance.details != finding.resource_details:
-                            resource_instance.details = finding.resource_details
-                            updated_fields.append("details")
-                        if resource_instance.partition != finding.partition:
-                            resource_instance.partition = finding.partition
-                            updated_fields.append("partition")
-                        if updated_fields:
-                            with rls_transaction(tenant_id):
-                                resource_instance.save(update_fields=updated_fields)
-                    except (OperationalError, IntegrityError) as db_err:
-                        if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
-                            logger.warning(
-                                f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
-                                f"detected when processing resource {resource_uid} on scan {scan_id}. Retrying..."
-                            )
-                            time.sleep(0.1 * (2**attempt))
-                            continue
-                        else:
-                            raise db_err
-
-                # Update tags
-                tags = []
-                with rls_transaction(tenant_id):
-                    for key, value in finding.resource_tags.items():
-                        tag_key = (key, value)
-                        if tag_key not in tag_cache:
-                            tag_instance, _ = ResourceTag.objects.get_or_create(
-                                tenant_id=tenant_id, key=key, value=value
-                            )
-                            tag_cache[tag_key] = tag_instance
-                        else:
-                            tag_instance = tag_cache[tag_key]
-                        tags.append(tag_instance)
-                    resource_instance.upsert_or_delete_tags(tags=tags)
-
-                unique_resources.add((resource_instance.uid, resource_instance.region))
-
-                # Process finding
-                with rls_transaction(tenant_id):
-                    finding_uid = finding.uid
-                    last_first_seen_at = None
-                    if finding_uid not in last_status_cache:
-                        most_recent_finding = (
-                            Finding.all_objects.filter(
-                                tenant_id=tenant_id, uid=finding_uid
-                            )
-                            .order_by("-inserted_at")
-                            .values("status", "first_seen_at")
-                            .first()
-                        )
-                        last_status = None
-                        if most_recent_finding:
-                            last_status = most_recent_finding["status"]
-                            last_first_seen_at = most_recent_finding["first_seen_at"]
-                        last_status_cache[finding_uid] = last_status, last_first_seen_at
-                    else:
-                        last_status, last_first_seen_at = last_status_cache[finding_uid]
-
-                    status = FindingStatus[finding.status]
-                    delta = _create_finding_delta(last_status, status)
-                    # For the findings prior to the change, when a first finding is found with delta!="new" it will be
-                    # assigned a current date as first_seen_at and the successive findings with the same UID will
-                    # always get the date of the previous finding.
-                    # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
-                    # attribute will be assigned the current date, the following findings will get that date.
-                    if not last_first_seen_at:
-                        last_first_seen_at = datetime.now(tz=timezone.utc)
-
-                    # If the finding is muted at this time the reason must be the configured Mutelist
-                    muted_reason = "Muted by mutelist" if finding.muted else None
-
-                    # Create the finding
-                    finding_instance = Finding.objects.create(
-                        tenant_id=tenant_id,
-                        uid=finding_uid,
-                        delta=delta,
-                        check_metadata=finding.get_metadata(),
-                        status=status,
-                        status_extended=finding.status_extended,
-                        severity=finding.severity,
-                        impact=finding.severity,
-                        raw_result=finding.raw,
-                        check_id=finding.check_id,
-                        scan=scan_instance,
-                        first_seen_at=last_first_seen_at,
-                        muted=finding.muted,
-                        muted_reason=muted_reason,
-                        compliance=finding.compliance,
-                    )
-                    finding_instance.add_resources([resource_instance])
-
-                    # Increment failed_findings_count cache if the finding status is FAIL and not muted
-                    if status == FindingStatus.FAIL and not finding.muted:
-                        resource_uid = finding.resource_uid
-                        resource_failed_findings_cache[resource_uid] += 1
-
-                # Update scan resource summaries
-                scan_resource_cache.add(
-                    (
-                        str(resource_instance.id),
-                        resource_instance.service,
-                        resource_instance.region,
-                        resource_instance.type,
-                    )
-                )
-
-            # Update scan progress
-            with rls_transaction(tenant_id):
-                scan_instance.progress = progress
-                scan_instance.save()
+            ingestion.ingest(findings, progress)
 
         scan_instance.state = StateChoices.COMPLETED
 
         # Update failed_findings_count for all resources in batches if scan completed successfully
-        if resource_failed_findings_cache:
+        if ingestion.resource_failed_findings_cache:
             resources_to_update = []
-            for resource_uid, failed_count in resource_failed_findings_cache.items():
-                if resource_uid in resource_cache:
-                    resource_instance = resource_cache[resource_uid]
+            for (
+                resource_uid,
+                failed_count,
+            ) in ingestion.resource_failed_findings_cache.items():
+                if resource_uid in ingestion.resource_cache:
+                    resource_instance = ingestion.resource_cache[resource_uid]
                     resource_instance.failed_findings_count = failed_count
                     resources_to_update.append(resource_instance)
 
@@ -374,7 +896,9 @@ def perform_prowler_scan(
         with rls_transaction(tenant_id):
             scan_instance.duration = time.time() - start_time
             scan_instance.completed_at = datetime.now(tz=timezone.utc)
-            scan_instance.unique_resource_count = len(unique_resources)
+            scan_instance.unique_resource_count = (
+                len(ingestion.unique_resources) if ingestion else 0
+            )
             scan_instance.save()
 
     if exception is not None:
@@ -390,7 +914,12 @@ def perform_prowler_scan(
                 region=region,
                 resource_type=resource_type,
             )
-            for resource_id, service, region, resource_type in scan_resource_cache
+            for (
+                resource_id,
+                service,
+                region,
+                resource_type,
+            ) in ingestion.scan_resource_cache
         ]
         with rls_transaction(tenant_id):
             ResourceScanSummary.objects.bulk_create(
@@ -404,6 +933,32 @@ def perform_prowler_scan(
             f"Error storing filter values for scan {scan_id}: {filter_exception}"
         )
 
+    try:
+        # The summary was accumulated while storing the findings, so the scan-summary task has nothing to aggregate
+        ingestion.store_scan_summary()
+    except Exception as summary_exception:
+        import sentry_sdk
+
+        sentry_sdk.capture_exception(summary_exception)
+        logger.error(
+            f"Error storing the scan summary for scan {scan_id}: {summary_exception}"
+        )
+
+    try:
+        # The check statuses were accumulated while storing the findings, so there is no need to read them again
+        create_compliance_requirements(
+            tenant_id,
+            scan_id,
+            check_status_by_region=ingestion.check_status_by_region,
+        )
+    except Exception as compliance_exception:
+        import sentry_sdk
+
+        sentry_sdk.capture_exception(compliance_exception)
+        logger.error(
+            f"Error creating compliance requirements for scan {scan_id}: {compliance_exception}"
+        )
+
     serializer = ScanTaskSerializer(instance=scan_instance)
     return serializer.data
 
@@ -412,6 +967,9 @@ def aggregate_findings(tenant_id: str, scan_id: str):
     """
     Aggregates findings for a given scan and stores the results in the ScanSummary table.
 
+    The scans store their summary while the findings are ingested, so the findings are only
+    aggregated when the ScanSummary rows of the scan are missing, e.g. if storing them failed.
+
     This function retrieves all findings associated with a given `scan_id` and calculates various
     metrics such as counts of failed, passed, and muted findings, as well as their deltas (new,
     changed, unchanged). The results are grouped by `check_id`, `service`, `severity`, and `region`.
@@ -440,6 +998,9 @@ def aggregate_findings(tenant_id: str, scan_id: str):
         - muted_changed: Muted findings with a delta of 'changed'.
     """
     with rls_transaction(tenant_id):
+        if ScanSummary.objects.filter(tenant_id=tenant_id, scan_id=scan_id).exists():
+            return
+
         findings = Finding.objects.filter(tenant_id=tenant_id, scan_id=scan_id)
 
         aggregation = findings.values(
@@ -563,7 +1124,116 @@ def aggregate_findings(tenant_id: str, scan_id: str):
         ScanSummary.objects.bulk_create(scan_aggregations, batch_size=3000)
 
 
-def create_compliance_requirements(tenant_id: str, scan_id: str):
+def update_latest_scan_summaries(tenant_id: str, scan_id: str):
+    """
+    Refresh the LatestScanSummary rows of the scan's provider with the summary of the scan.
+
+    The ScanSummary rows of the scan are aggregated by service, severity and region, and they
+    replace the previous rows of the provider, unless a newer scan of the provider was completed.
+
+    Args:
+        tenant_id (str): The ID of the tenant to which the scan belongs.
+        scan_id (str): The ID of the scan whose summary is the latest one of its provider.
+
+    Returns:
+        dict: The status of the refresh and the number of rows stored.
+    """
+    with rls_transaction(tenant_id):
+        provider_id = Scan.all_objects.values_list("provider_id", flat=True).get(
+            pk=scan_id
+        )
+        # Serialize the refreshes of the provider, so concurrent scans do not mix their rows
+        Provider.all_objects.select_for_update().filter(pk=provider_id).first()
+
+        latest_scan_id = (
+            Scan.all_objects.filter(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                state=StateChoices.COMPLETED,
+            )
+            .order_by("-inserted_at")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if str(latest_scan_id) != str(scan_id):
+            return {"status": "not the latest scan"}
+
+        summaries = (
+            ScanSummary.all_objects.filter(tenant_id=tenant_id, scan_id=scan_id)
+            .values("service", "severity", "region")
+            .annotate(
+                summary_inserted_at=Max("inserted_at"),
+                **{f"{counter}_sum": Sum(counter) for counter in SCAN_SUMMARY_COUNTERS},
+            )
+        )
+        latest_summaries = [
+            LatestScanSummary(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                scan_id=scan_id,
+                inserted_at=summary["summary_inserted_at"],
+                service=summary["service"],
+                severity=summary["severity"],
+                region=summary["region"],
+                **{
+                    counter: summary[f"{counter}_sum"]
+                    for counter in SCAN_SUMMARY_COUNTERS
+                },
+            )
+            for summary in summaries
+        ]
+
+        LatestScanSummary.all_objects.filter(
+            tenant_id=tenant_id, provider_id=provider_id
+        ).delete()
+        LatestScanSummary.all_objects.bulk_create(latest_summaries, batch_size=3000)
+
+    return {"status": "updated", "rows": len(latest_summaries)}
+
+
+def _get_check_status_by_region(
+    tenant_id: str, scan_id: str
+) -> dict[str, dict[str, str]]:
+    """
+    Read the status of every check by region from the non-muted findings of the scan, FAIL
+    prevails over any other status.
+
+    Args:
+        tenant_id (str): The ID of the tenant.
+        scan_id (str): The ID of the scan.
+
+    Returns:
+        dict[str, dict[str, str]]: The status of every check, by region and check ID.
+    """
+    findings = (
+        Finding.all_objects.filter(scan_id=scan_id, muted=False)
+        .only("id", "check_id", "status")
+        .prefetch_related(
+            Prefetch(
+                "resources",
+                queryset=Resource.objects.only("id", "region"),
+                to_attr="small_resources",
+            )
+        )
+        .iterator(chunk_size=1000)
+    )
+
+    check_status_by_region = {}
+    with rls_transaction(tenant_id):
+        for finding in findings:
+            for resource in finding.small_resources:
+                region = resource.region
+                current_status = check_status_by_region.setdefault(region, {})
+                if current_status.get(finding.check_id) != "FAIL":
+                    current_status[finding.check_id] = finding.status
+    return check_status_by_region
+
+
+def create_compliance_requirements(
+    tenant_id: str,
+    scan_id: str,
+    check_status_by_region: dict[str, dict[str, str]] | None = None,
+):
     """
     Create detailed compliance requirement overview records for a scan.
 
@@ -571,9 +1241,15 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
     individual records for each compliance requirement in each region. These detailed
     records provide a granular view of compliance status.
 
+    The status of the checks of every requirement is looked up through an index of the
+    requirements by check, so only the requirements of the checks executed in a region are
+    computed and the rest keep the template values.
+
     Args:
         tenant_id (str): The ID of the tenant for which to create records.
         scan_id (str): The ID of the scan for which to create records.
+        check_status_by_region (dict, optional): The status of every check by region, as
+            accumulated while the findings were stored. If not set, it is read from the findings.
 
     Returns:
         dict: A dictionary containing the number of requirements created and the regions processed.
@@ -588,27 +1264,8 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
             prowler_provider = return_prowler_provider(provider_instance)
 
         # Get check status data by region from findings
-        findings = (
-            Finding.all_objects.filter(scan_id=scan_id, muted=False)
-            .only("id", "check_id", "status")
-            .prefetch_related(
-                Prefetch(
-                    "resources",
-                    queryset=Resource.objects.only("id", "region"),
-                    to_attr="small_resources",
-                )
-            )
-            .iterator(chunk_size=1000)
-        )
-
-        check_status_by_region = {}
-        with rls_transaction(tenant_id):
-            for finding in findings:
-                for resource in finding.small_resources:
-                    region = resource.region
-                    current_status = check_status_by_region.setdefault(region, {})
-                    if current_status.get(finding.check_id) != "FAIL":
-                        current_status[finding.check_id] = finding.status
+        if check_status_by_region is None:
+            check_status_by_region = _get_check_status_by_region(tenant_id, scan_id)
 
         try:
             # Try to get regions from provider
@@ -616,36 +1273,41 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
         except (AttributeError, Exception):
             # If not available, use regions from findings
             regions = set(check_status_by_region.keys())
+        regions = set(regions) | set(check_status_by_region.keys())
 
         # Get compliance template for the provider
         compliance_template = PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE[
             provider_instance.provider
         ]
-
-        # Create compliance data by region
-        compliance_overview_by_region = {
-            region: deepcopy(compliance_template) for region in regions
-        }
-
-        # Apply check statuses to compliance data
-        for region, check_status in check_status_by_region.items():
-            compliance_data = compliance_overview_by_region.setdefault(
-                region, deepcopy(compliance_template)
-            )
-            for check_name, status in check_status.items():
-                generate_scan_compliance(
-                    compliance_data,
-                    provider_instance.provider,
-                    check_name,
-                    status,
-                )
+        requirements_by_check = generate_compliance_requirements_by_check(
+            compliance_template
+        )
 
         # Prepare compliance requirement objects
         compliance_requirement_objects = []
-        for region, compliance_data in compliance_overview_by_region.items():
-            for compliance_id, compliance in compliance_data.items():
+        for region in regions:
+            # Count the status of the checks of the requirements with checks executed in the region
+            requirements_checks_status = defaultdict(
+                lambda: {"pass": 0, "fail": 0, "manual": 0}
+            )
+            for check_id, status in check_status_by_region.get(region, {}).items():
+                for requirement_key in requirements_by_check.get(check_id, ()):
+                    requirements_checks_status[requirement_key][status.lower()] += 1
+
+            for compliance_id, compliance in compliance_template.items():
                 # Create an overview record for each requirement within each compliance framework
                 for requirement_id, requirement in compliance["requirements"].items():
+                    passed_checks = requirement["checks_status"]["pass"]
+                    failed_checks = requirement["checks_status"]["fail"]
+                    requirement_status = requirement["status"]
+                    checks_status = requirements_checks_status.get(
+                        (compliance_id, requirement_id)
+                    )
+                    if checks_status:
+                        passed_checks += checks_status["pass"]
+                        failed_checks += checks_status["fail"]
+                        if checks_status["fail"]:
+                            requirement_status = "FAIL"
                     compliance_requirement_objects.append(
                         ComplianceRequirementOverview(
                             tenant_id=tenant_id,
@@ -656,10 +1318,10 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
                             version=compliance["version"],
                             requirement_id=requirement_id,
                             description=requirement["description"],
-                            passed_checks=requirement["checks_status"]["pass"],
-                            failed_checks=requirement["checks_status"]["fail"],
+                            passed_checks=passed_checks,
+                            failed_checks=failed_checks,
                             total_checks=requirement["checks_status"]["total"],
-                            requirement_status=requirement["status"],
+                            requirement_status=requirement_status,
                         )
                     )
 
@@ -672,9 +1334,7 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
             "requirements_created": len(compliance_requirement_objects),
             "regions_processed": list(regions),
             "compliance_frameworks": (
-                list(compliance_overview_by_region.get(list(regions)[0], {}).keys())
-                if regions
-                else []
+                list(compliance_template.keys()) if regions else []
             ),
         }
 
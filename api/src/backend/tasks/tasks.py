@@ -5,7 +5,11 @@ from shutil import rmtree
 from celery import chain, group, shared_task
 from celery.utils.log import get_task_logger
 from config.celery import RLSTask
-from config.django.base import DJANGO_FINDINGS_BATCH_SIZE, DJANGO_TMP_OUTPUT_DIRECTORY
+from config.django.base import (
+    DJANGO_FINDINGS_BATCH_SIZE,
+    DJANGO_OUTPUT_WRITERS_MAX_WORKERS,
+    DJANGO_TMP_OUTPUT_DIRECTORY,
+)
 from django_celery_beat.models import PeriodicTask
 from tasks.jobs.backfill import backfill_resource_scan_summaries
 from tasks.jobs.connection import (
@@ -17,6 +21,7 @@ from tasks.jobs.deletion import delete_provider, delete_tenant
 from tasks.jobs.export import (
     COMPLIANCE_CLASS_MAP,
     OUTPUT_FORMATS_MAPPING,
+    OutputWritersPool,
     _compress_output_files,
     _generate_output_directory,
     _upload_to_s3,
@@ -26,6 +31,7 @@ from tasks.jobs.scan import (
     aggregate_findings,
     create_compliance_requirements,
     perform_prowler_scan,
+    update_latest_scan_summaries,
 )
 from tasks.utils import batched, get_next_execution_datetime
 
@@ -51,9 +57,7 @@ def _perform_scan_complete_tasks(tenant_id: str, scan_id: str, provider_id: str)
         scan_id (str): The ID of the scan that was performed.
         provider_id (str): The primary key of the Provider instance that was scanned.
     """
-    create_compliance_requirements_task.apply_async(
-        kwargs={"tenant_id": tenant_id, "scan_id": scan_id}
-    )
+    # The compliance requirement overviews are created by perform_prowler_scan from the stored findings
     chain(
         perform_scan_summary_task.si(tenant_id=tenant_id, scan_id=scan_id),
         generate_outputs_task.si(
@@ -256,7 +260,9 @@ def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
 
 @shared_task(name="scan-summary", queue="overview")
 def perform_scan_summary_task(tenant_id: str, scan_id: str):
-    return aggregate_findings(tenant_id=tenant_id, scan_id=scan_id)
+    result = aggregate_findings(tenant_id=tenant_id, scan_id=scan_id)
+    update_latest_scan_summaries(tenant_id=tenant_id, scan_id=scan_id)
+    return result
 
 
 @shared_task(name="tenant-deletion", queue="deletion", autoretry_for=(Exception,))
@@ -319,68 +325,100 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
     output_writers = {}
     compliance_writers = {}
 
+    def write_output(cls, suffix, extra, fos, is_last):
+        writer, initialization = get_writer(
+            output_writers,
+            cls,
+            lambda: cls(
+                findings=fos,
+                file_path=out_dir,
+                file_extension=suffix,
+                from_cli=False,
+            ),
+            is_last,
+        )
+        if not initialization:
+            writer.transform(fos)
+        writer.batch_write_data_to_file(**extra)
+        writer._data.clear()
+
+    def write_compliance(name, klass, compliance_obj, filename, fos, is_last):
+        writer, initialization = get_writer(
+            compliance_writers,
+            name,
+            lambda: klass(
+                findings=fos,
+                compliance=compliance_obj,
+                file_path=filename,
+                from_cli=False,
+            ),
+            is_last,
+        )
+        if not initialization:
+            writer.transform(fos, compliance_obj, name)
+        writer.batch_write_data_to_file()
+        writer._data.clear()
+
     scan_summary = FindingOutput._transform_findings_stats(
         ScanSummary.objects.filter(scan_id=scan_id)
     )
 
-    qs = Finding.all_objects.filter(scan_id=scan_id).order_by("uid").iterator()
-    for batch, is_last in batched(qs, DJANGO_FINDINGS_BATCH_SIZE):
-        fos = [FindingOutput.transform_api_finding(f, prowler_provider) for f in batch]
-
-        # Outputs
-        for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
-            cls = cfg["class"]
-            suffix = cfg["suffix"]
-            extra = cfg.get("kwargs", {}).copy()
-            if mode == "html":
-                extra.update(provider=prowler_provider, stats=scan_summary)
-
-            writer, initialization = get_writer(
-                output_writers,
-                cls,
-                lambda cls=cls, fos=fos, suffix=suffix: cls(
-                    findings=fos,
-                    file_path=out_dir,
-                    file_extension=suffix,
-                    from_cli=False,
-                ),
-                is_last,
-            )
-            if not initialization:
-                writer.transform(fos)
-            writer.batch_write_data_to_file(**extra)
-            writer._data.clear()
-
-        # Compliance CSVs
-        for name in frameworks_avail:
-            compliance_obj = frameworks_bulk[name]
-
-            klass = GenericCompliance
-            for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
-                if condition(name):
-                    klass = cls
-                    break
-
-            filename = f"{comp_dir}_{name}.csv"
-
-            writer, initialization = get_writer(
-                compliance_writers,
-                name,
-                lambda klass=klass, fos=fos: klass(
-                    findings=fos,
-                    compliance=compliance_obj,
-                    file_path=filename,
-                    from_cli=False,
-                ),
-                is_last,
+    # Every batch is transformed once and written by all the writers in parallel
+    with OutputWritersPool(DJANGO_OUTPUT_WRITERS_MAX_WORKERS) as writers_pool:
+        qs = Finding.all_objects.filter(scan_id=scan_id).order_by("uid").iterator()
+        for batch, is_last in batched(qs, DJANGO_FINDINGS_BATCH_SIZE):
+            fos = [
+                FindingOutput.transform_api_finding(f, prowler_provider) for f in batch
+            ]
+
+            # Outputs
+            for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
+                extra = cfg.get("kwargs", {}).copy()
+                if mode == "html":
+                    extra.update(provider=prowler_provider, stats=scan_summary)
+                writers_pool.submit(
+                    mode,
+                    write_output,
+                    cfg["class"],
+                    cfg["suffix"],
+                    extra,
+                    fos,
+                    is_last,
+                )
+
+            # Compliance CSVs
+            for name in frameworks_avail:
+                klass = GenericCompliance
+                for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
+                    if condition(name):
+                        klass = cls
+                        break
+
+                writers_pool.submit(
+                    name,
+                    write_compliance,
+                    name,
+                    klass,
+                    frameworks_bulk[name],
+                    f"{comp_dir}_{name}.csv",
+                    fos,
+                    is_last,
+                )
+
+        writers_timings = writers_pool.wait()
+    logger.info(
+        f"Scan {scan_id} outputs written in: "
+        + ", ".join(
+            f"{name} {seconds:.2f}s"
+            for name, seconds in sorted(
+                writers_timings.items(), key=lambda timing: timing[1], reverse=True
             )
-            if not initialization:
-                writer.transform(fos, compliance_obj, name)
-            writer.batch_write_data_to_file()
-            writer._data.clear()
+        )
+    )
 
-    compressed = _compress_output_files(out_dir)
-    upload_uri = _upload_to_s3(tenant_id, compressed, scan_id)
+    # The outputs are compressed straight into S3, the ZIP is only written to disk when they are not uploaded
+    upload_uri = _upload_to_s3(tenant_id, out_dir, scan_id)
+    compressed = None if upload_uri else _compress_output_files(out_dir)
 
     # S3 integrations (need output_directory)
     with rls_transaction(tenant_id):
@@ -411,7 +449,7 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
         # TODO: We need to create a new periodic task to delete the output files
         # This task shouldn't be responsible for deleting the output files
         try:
-            rmtree(Path(compressed).parent, ignore_errors=True)
+            rmtree(Path(out_dir).parent, ignore_errors=True)
         except Exception as e:
             logger.error(f"Error deleting output files: {e}")
         final_location, did_upload = upload_uri, True
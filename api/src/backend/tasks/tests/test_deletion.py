@@ -1,8 +1,14 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
 from django.core.exceptions import ObjectDoesNotExist
-from tasks.jobs.deletion import delete_provider, delete_tenant
+from tasks.jobs.deletion import (
+    delete_provider,
+    delete_tenant,
+    truncate_findings_partitions,
+)
 
-from api.models import Provider, Tenant
+from api.models import Finding, Provider, Tenant
 
 
 @pytest.mark.django_db
@@ -23,6 +29,47 @@ class TestDeleteProvider:
         with pytest.raises(ObjectDoesNotExist):
             delete_provider(tenant_id, non_existent_pk)
 
+    def test_delete_provider_findings(self, findings_fixture):
+        provider = findings_fixture[0].scan.provider
+        tenant_id = str(provider.tenant_id)
+        findings_count = Finding.all_objects.filter(scan__provider=provider).count()
+
+        result = delete_provider(tenant_id, provider.id)
+
+        assert result["api.Finding"] == findings_count
+        assert not Finding.all_objects.filter(scan__provider=provider).exists()
+
+    def test_delete_provider_reports_progress(self, providers_fixture):
+        instance = providers_fixture[0]
+        task = MagicMock()
+        task.request.called_directly = False
+
+        with patch("tasks.jobs.deletion.current_task", task):
+            delete_provider(str(instance.tenant_id), instance.id)
+
+        states = {call.kwargs["state"] for call in task.update_state.call_args_list}
+        steps = [
+            call.kwargs["meta"]["step"] for call in task.update_state.call_args_list
+        ]
+        assert states == {"PROGRESS"}
+        assert steps[0] == "Findings Partitions"
+        assert steps[-1] == "Provider"
+
+
+@pytest.mark.django_db
+class TestTruncateFindingsPartitions:
+    def test_truncate_findings_partitions_skips_default_partition(
+        self, findings_fixture
+    ):
+        provider = findings_fixture[0].scan.provider
+        scan_ids = [finding.scan_id for finding in findings_fixture]
+
+        assert truncate_findings_partitions(str(provider.tenant_id), scan_ids) == {}
+        assert Finding.all_objects.filter(scan__provider=provider).exists()
+
+    def test_truncate_findings_partitions_without_scans(self, tenants_fixture):
+        assert truncate_findings_partitions(str(tenants_fixture[0].id), []) == {}
+
 
 @pytest.mark.django_db
 class TestDeleteTenant:
@@ -1,3 +1,4 @@
+import io
 import os
 import zipfile
 from pathlib import Path
@@ -6,6 +7,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from botocore.exceptions import ClientError
 from tasks.jobs.export import (
+    OutputWritersPool,
+    S3MultipartUpload,
     _compress_output_files,
     _generate_output_directory,
     _upload_to_s3,
@@ -13,6 +16,38 @@ from tasks.jobs.export import (
 )
 
 
+class FakeS3Client:
+    """In-memory stand-in of the S3 API used to upload the outputs"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.upload_file = MagicMock()
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b"".join(
+            parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+
+
 @pytest.mark.django_db
 class TestOutputs:
     def test_compress_output_files_creates_zip(self, tmpdir):
@@ -60,27 +95,38 @@ class TestOutputs:
         mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "test-bucket"
 
         base_tmp = Path(str(tmpdir.mkdir("upload_success")))
-        zip_path = base_tmp / "outputs.zip"
-        zip_path.write_bytes(b"dummy")
+        output_dir = base_tmp / "outputs"
+        output_dir.mkdir()
+        (output_dir / "result.csv").write_text("data")
 
         compliance_dir = base_tmp / "compliance"
         compliance_dir.mkdir()
         (compliance_dir / "report.csv").write_text("ok")
 
-        client_mock = MagicMock()
-        mock_get_client.return_value = client_mock
+        s3_client = FakeS3Client()
+        mock_get_client.return_value = s3_client
 
-        result = _upload_to_s3("tenant-id", str(zip_path), "scan-id")
+        result = _upload_to_s3("tenant-id", str(output_dir), "scan-id")
 
         expected_uri = "s3://test-bucket/tenant-id/scan-id/outputs.zip"
         assert result == expected_uri
-        assert client_mock.upload_file.call_count == 2
+        # The ZIP is streamed to S3 without writing it to disk
+        assert not (base_tmp / "outputs.zip").exists()
+        with zipfile.ZipFile(
+            io.BytesIO(s3_client.objects["tenant-id/scan-id/outputs.zip"])
+        ) as zipf:
+            assert sorted(zipf.namelist()) == [
+                "compliance/report.csv",
+                "outputs/result.csv",
+            ]
+            assert zipf.read("outputs/result.csv") == b"data"
+        s3_client.upload_file.assert_called_once()
 
     @patch("tasks.jobs.export.get_s3_client")
     @patch("tasks.jobs.export.base")
     def test_upload_to_s3_missing_bucket(self, mock_base, mock_get_client):
         mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = ""
-        result = _upload_to_s3("tenant", "/tmp/fake.zip", "scan")
+        result = _upload_to_s3("tenant", "/tmp/fake", "scan")
         assert result is None
 
     @patch("tasks.jobs.export.get_s3_client")
@@ -89,21 +135,22 @@ class TestOutputs:
         mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "test-bucket"
         base_tmp = Path(str(tmpdir.mkdir("upload_skips_non_files")))
 
-        zip_path = base_tmp / "results.zip"
-        zip_path.write_bytes(b"zip")
+        output_dir = base_tmp / "results"
+        output_dir.mkdir()
 
         compliance_dir = base_tmp / "compliance"
         compliance_dir.mkdir()
         (compliance_dir / "subdir").mkdir()
 
-        client_mock = MagicMock()
-        mock_get_client.return_value = client_mock
+        s3_client = FakeS3Client()
+        mock_get_client.return_value = s3_client
 
-        result = _upload_to_s3("tenant", str(zip_path), "scan")
+        result = _upload_to_s3("tenant", str(output_dir), "scan")
 
         expected_uri = "s3://test-bucket/tenant/scan/results.zip"
         assert result == expected_uri
-        client_mock.upload_file.assert_called_once()
+        assert list(s3_client.objects) == ["tenant/scan/results.zip"]
+        s3_client.upload_file.assert_not_called()
 
     @patch(
         "tasks.jobs.export.get_s3_client",
@@ -117,14 +164,14 @@ class TestOutputs:
         mock_base.DJANGO_OUTPUT_S3_AWS_OUTPUT_BUCKET = "bucket"
 
         base_tmp = Path(str(tmpdir.mkdir("upload_failure_logs")))
-        zip_path = base_tmp / "zipfile.zip"
-        zip_path.write_bytes(b"zip")
+        output_dir = base_tmp / "outputs"
+        output_dir.mkdir()
 
         compliance_dir = base_tmp / "compliance"
         compliance_dir.mkdir()
         (compliance_dir / "report.csv").write_text("csv")
 
-        _upload_to_s3("tenant", str(zip_path), "scan")
+        assert _upload_to_s3("tenant", str(output_dir), "scan") is None
         mock_logger.assert_called()
 
     def test_generate_output_directory_creates_paths(self, tmpdir):
@@ -164,3 +211,60 @@ class TestOutputs:
 
         assert path.endswith(f"aws-test-check-{output_file_timestamp}")
         assert compliance.endswith(f"aws-test-check-{output_file_timestamp}")
+
+
+class TestOutputWritersPool:
+    def test_writers_keep_the_order_of_their_batches(self):
+        written = {"csv": [], "html": []}
+
+        with OutputWritersPool(max_workers=4, max_pending_batches=2) as writers_pool:
+            for batch in range(10):
+                for name in written:
+                    writers_pool.submit(name, written[name].append, batch)
+            timings = writers_pool.wait()
+
+        assert written == {"csv": list(range(10)), "html": list(range(10))}
+        assert set(timings) == {"csv", "html"}
+
+    def test_writer_error_is_raised(self):
+        def failing_writer(batch):
+            raise ValueError(f"Unable to write batch {batch}")
+
+        with pytest.raises(ValueError, match="Unable to write batch 0"):
+            with OutputWritersPool(max_workers=2) as writers_pool:
+                writers_pool.submit("csv", failing_writer, 0)
+                writers_pool.wait()
+
+
+class TestS3MultipartUpload:
+    def test_small_object_uploaded_at_once(self):
+        s3_client = FakeS3Client()
+
+        with S3MultipartUpload(s3_client, "bucket", "key", part_size=10) as upload:
+            upload.write(b"small")
+
+        assert s3_client.objects == {"key": b"small"}
+        assert s3_client.uploads == {}
+
+    def test_parts_uploaded_as_they_fill(self):
+        s3_client = FakeS3Client()
+
+        upload = S3MultipartUpload(s3_client, "bucket", "key", part_size=4)
+        upload.write(b"0123")
+        upload.write(b"4567")
+        upload.write(b"89")
+        assert s3_client.uploads == {"upload-1": {1: b"0123", 2: b"4567"}}
+        upload.close()
+
+        assert s3_client.objects == {"key": b"0123456789"}
+
+    def test_abort(self):
+        s3_client = FakeS3Client()
+
+        upload = S3MultipartUpload(s3_client, "bucket", "key", part_size=4)
+        upload.write(b"012345")
+        upload.abort()
+        upload.close()
+
+        assert s3_client.objects == {}
+        assert s3_client.aborted == ["upload-1"]
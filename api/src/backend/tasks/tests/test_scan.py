@@ -5,15 +5,32 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from tasks.jobs.scan import (
+    FindingsIngestion,
+    PreviousScanFindings,
     _create_finding_delta,
     _store_resources,
+    aggregate_findings,
     create_compliance_requirements,
     perform_prowler_scan,
+    update_latest_scan_summaries,
 )
 from tasks.utils import CustomEncoder
 
 from api.exceptions import ProviderConnectionError
-from api.models import Finding, Provider, Resource, Scan, StateChoices, StatusChoices
+from api.models import (
+    ComplianceRequirementOverview,
+    Finding,
+    LatestScanSummary,
+    Provider,
+    Resource,
+    ResourceFindingMapping,
+    ResourceTag,
+    ResourceTagMapping,
+    Scan,
+    ScanSummary,
+    StateChoices,
+    StatusChoices,
+)
 from prowler.lib.check.models import Severity
 
 
@@ -735,6 +752,358 @@ class TestPerformScan:
         assert resource.failed_findings_count == 0
 
 
+def _mock_finding(
+    uid: str,
+    resource_uid: str,
+    status: StatusChoices = StatusChoices.FAIL,
+    muted: bool = False,
+    resource_tags: dict | None = None,
+    region: str = "us-east-1",
+):
+    finding = MagicMock()
+    finding.uid = uid
+    finding.status = status
+    finding.status_extended = f"{uid} status extended"
+    finding.severity = Severity.high
+    finding.check_id = "ingestion_check"
+    finding.get_metadata.return_value = {"key": "value"}
+    finding.resource_uid = resource_uid
+    finding.resource_name = resource_uid
+    finding.region = region
+    finding.service_name = "ec2"
+    finding.resource_type = "instance"
+    finding.resource_tags = resource_tags or {}
+    finding.muted = muted
+    finding.raw = {}
+    finding.resource_metadata = {}
+    finding.resource_details = "details"
+    finding.partition = "aws"
+    finding.compliance = {}
+    return finding
+
+
+@pytest.mark.django_db
+class TestFindingsIngestion:
+    def test_ingest_in_batches(self, tenants_fixture, scans_fixture, providers_fixture):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        provider = providers_fixture[0]
+        findings = [
+            _mock_finding("finding_1", "resource_1", resource_tags={"env": "prod"}),
+            _mock_finding(
+                "finding_2",
+                "resource_1",
+                status=StatusChoices.PASS,
+                resource_tags={"env": "prod"},
+            ),
+            _mock_finding(
+                "finding_3", "resource_2", muted=True, resource_tags={"env": "prod"}
+            ),
+        ]
+
+        ingestion = FindingsIngestion(str(tenant.id), scan, provider, batch_size=2)
+        ingestion.ingest(findings, 50)
+
+        scan.refresh_from_db()
+        assert scan.progress == 50
+        assert Finding.objects.filter(scan=scan).count() == 3
+        assert Resource.objects.filter(provider=provider).count() == 2
+        assert ResourceTag.objects.filter(key="env", value="prod").count() == 1
+        assert ResourceTagMapping.objects.filter(tag__key="env").count() == 2
+        assert ResourceFindingMapping.objects.filter(finding__scan=scan).count() == 3
+
+        finding = Finding.objects.get(scan=scan, uid="finding_1")
+        assert finding.delta == Finding.DeltaChoices.NEW
+        assert finding.first_seen_at is not None
+        assert finding.resource_regions == ["us-east-1"]
+        assert finding.resource_services == ["ec2"]
+        assert finding.resource_types == ["instance"]
+        assert list(finding.resources.values_list("uid", flat=True)) == ["resource_1"]
+        assert (
+            Finding.objects.get(scan=scan, uid="finding_3").muted_reason
+            == "Muted by mutelist"
+        )
+
+        assert ingestion.resource_failed_findings_cache == {
+            "resource_1": 1,
+            "resource_2": 0,
+        }
+        assert ingestion.unique_resources == {
+            ("resource_1", "us-east-1"),
+            ("resource_2", "us-east-1"),
+        }
+        assert len(ingestion.scan_resource_cache) == 2
+        # The muted finding is left out and FAIL prevails over PASS
+        assert ingestion.check_status_by_region == {
+            "us-east-1": {"ingestion_check": "FAIL"}
+        }
+
+    def test_ingest_existing_resource_and_finding(
+        self, tenants_fixture, providers_fixture, findings_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        previous_finding = findings_fixture[0]
+        previous_finding.refresh_from_db()
+        resource = previous_finding.resources.first()
+        scan = Scan.objects.create(
+            name="Ingestion Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+        finding = _mock_finding(
+            previous_finding.uid,
+            resource.uid,
+            status=StatusChoices.PASS,
+            region="eu-west-1",
+        )
+
+        ingestion = FindingsIngestion(str(tenant.id), scan, provider)
+        ingestion.ingest([finding], 100)
+
+        new_finding = Finding.objects.get(scan=scan)
+        assert new_finding.delta == Finding.DeltaChoices.CHANGED
+        assert new_finding.first_seen_at == previous_finding.first_seen_at
+
+        # The existing resource is updated instead of duplicated
+        assert Resource.objects.filter(provider=provider, uid=resource.uid).count() == 1
+        resource.refresh_from_db()
+        assert resource.region == "eu-west-1"
+        assert resource.name == "My Instance 1"
+        assert list(new_finding.resources.all()) == [resource]
+
+    def test_ingest_resource_content_changes(
+        self, tenants_fixture, scans_fixture, providers_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        first_scan, second_scan, *_ = scans_fixture
+
+        FindingsIngestion(str(tenant.id), first_scan, provider).ingest(
+            [_mock_finding("finding_1", "resource_1")], 100
+        )
+        resource = Resource.objects.get(provider=provider, uid="resource_1")
+
+        # Unchanged content, the resource is not written again
+        unchanged_ingestion = FindingsIngestion(str(tenant.id), second_scan, provider)
+        with patch.object(unchanged_ingestion, "_update_resources") as update_resources:
+            unchanged_ingestion.ingest([_mock_finding("finding_1", "resource_1")], 100)
+        update_resources.assert_not_called()
+        assert unchanged_ingestion.resource_cache["resource_1"].id == resource.id
+
+        # Changed content, only the first finding of the resource in the scan is used
+        changed_finding = _mock_finding("finding_3", "resource_1")
+        changed_finding.resource_details = "new details"
+        changed_finding.resource_metadata = {"name": "resource_1"}
+        ignored_finding = _mock_finding("finding_4", "resource_1", region="eu-west-1")
+        FindingsIngestion(str(tenant.id), second_scan, provider).ingest(
+            [changed_finding, ignored_finding], 100
+        )
+
+        updated_resource = Resource.objects.get(provider=provider, uid="resource_1")
+        assert updated_resource.id == resource.id
+        assert updated_resource.details == "new details"
+        assert json.loads(updated_resource.metadata) == {"name": "resource_1"}
+        assert updated_resource.region == "us-east-1"
+        assert updated_resource.updated_at > resource.updated_at
+
+    def test_ingest_none_finding(
+        self, tenants_fixture, scans_fixture, providers_fixture
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        provider = providers_fixture[0]
+
+        ingestion = FindingsIngestion(str(tenant.id), scan, provider)
+        ingestion.ingest([None], 10)
+
+        scan.refresh_from_db()
+        assert scan.progress == 10
+        assert not Finding.objects.filter(scan=scan).exists()
+
+    def test_store_scan_summary(
+        self, tenants_fixture, scans_fixture, providers_fixture
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        provider = providers_fixture[0]
+        findings = [
+            _mock_finding("finding_1", "resource_1"),
+            _mock_finding("finding_2", "resource_1", status=StatusChoices.PASS),
+            _mock_finding("finding_3", "resource_2", muted=True),
+            _mock_finding("finding_4", "resource_3", region="eu-west-1"),
+        ]
+
+        ingestion = FindingsIngestion(str(tenant.id), scan, provider, batch_size=2)
+        ingestion.ingest(findings, 100)
+
+        assert ingestion.store_scan_summary() == 2
+        summary = ScanSummary.objects.get(scan=scan, region="us-east-1")
+        assert summary.check_id == "ingestion_check"
+        assert summary.service == "ec2"
+        assert summary.severity == Severity.high
+        assert summary.total == 3
+        assert summary.fail == 1
+        assert summary._pass == 1
+        assert summary.muted == 1
+        assert summary.new == 2
+        assert summary.fail_new == 1
+        assert summary.pass_new == 1
+        assert summary.muted_new == 1
+        assert summary.changed == 0
+        assert summary.unchanged == 0
+        assert ScanSummary.objects.get(scan=scan, region="eu-west-1").fail_new == 1
+
+        # The scan-summary task does not aggregate the findings again
+        with patch("tasks.jobs.scan.Finding.objects.filter") as mock_findings_filter:
+            aggregate_findings(str(tenant.id), str(scan.id))
+            mock_findings_filter.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestPreviousScanFindings:
+    def test_load(self, tenants_fixture, providers_fixture, findings_fixture):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        finding1, finding2 = findings_fixture
+        finding1.refresh_from_db()
+        finding2.refresh_from_db()
+        scan = Scan.objects.create(
+            name="Delta Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+
+        previous_findings = PreviousScanFindings.load(
+            str(tenant.id), str(provider.id), str(scan.id)
+        )
+
+        assert len(previous_findings) == 2
+        assert previous_findings.get(finding1.uid) == (
+            StatusChoices.FAIL,
+            finding1.first_seen_at,
+        )
+        assert previous_findings.get(finding2.uid) == (
+            StatusChoices.FAIL,
+            finding2.first_seen_at,
+        )
+        assert previous_findings.get("not_in_the_previous_scan") is None
+
+    def test_load_without_previous_scan(self, tenants_fixture, providers_fixture):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        scan = Scan.objects.create(
+            name="First Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+
+        previous_findings = PreviousScanFindings.load(
+            str(tenant.id), str(provider.id), str(scan.id)
+        )
+
+        assert len(previous_findings) == 0
+        assert previous_findings.get("any_finding") is None
+
+    def test_ingest_with_previous_findings(
+        self, tenants_fixture, providers_fixture, findings_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        previous_finding = findings_fixture[0]
+        previous_finding.refresh_from_db()
+        scan = Scan.objects.create(
+            name="Delta Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.EXECUTING,
+            tenant_id=tenant.id,
+        )
+        previous_findings = PreviousScanFindings.load(
+            str(tenant.id), str(provider.id), str(scan.id)
+        )
+        findings = [
+            _mock_finding(previous_finding.uid, "resource_1"),
+            _mock_finding("brand_new_finding", "resource_1"),
+        ]
+
+        ingestion = FindingsIngestion(str(tenant.id), scan, provider, previous_findings)
+        ingestion.ingest(findings, 100)
+
+        unchanged_finding = Finding.objects.get(scan=scan, uid=previous_finding.uid)
+        assert unchanged_finding.delta is None
+        assert unchanged_finding.first_seen_at == previous_finding.first_seen_at
+        new_finding = Finding.objects.get(scan=scan, uid="brand_new_finding")
+        assert new_finding.delta == Finding.DeltaChoices.NEW
+        # Only the UIDs missing in the previous scan are read from the findings table
+        assert ingestion.last_status_cache == {"brand_new_finding": (None, None)}
+
+
+@pytest.mark.django_db
+class TestUpdateLatestScanSummaries:
+    def _create_scan(self, tenant, provider, fail):
+        scan = Scan.objects.create(
+            name="Latest Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant_id=tenant.id,
+        )
+        for check_id in ("check1", "check2"):
+            ScanSummary.objects.create(
+                tenant_id=tenant.id,
+                scan=scan,
+                check_id=check_id,
+                service="ec2",
+                severity="high",
+                region="us-east-1",
+                fail=fail,
+                total=fail,
+            )
+        return scan
+
+    def test_update_latest_scan_summaries(self, tenants_fixture, providers_fixture):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        old_scan = self._create_scan(tenant, provider, fail=1)
+        update_latest_scan_summaries(str(tenant.id), str(old_scan.id))
+        latest_scan = self._create_scan(tenant, provider, fail=2)
+
+        result = update_latest_scan_summaries(str(tenant.id), str(latest_scan.id))
+
+        assert result == {"status": "updated", "rows": 1}
+        # The summaries of the checks are added up and replace the ones of the previous scan
+        latest_summary = LatestScanSummary.objects.get(provider=provider)
+        assert latest_summary.scan_id == latest_scan.id
+        assert latest_summary.service == "ec2"
+        assert latest_summary.severity == "high"
+        assert latest_summary.region == "us-east-1"
+        assert latest_summary.fail == 4
+        assert latest_summary.total == 4
+
+    def test_update_latest_scan_summaries_older_scan(
+        self, tenants_fixture, providers_fixture
+    ):
+        tenant = tenants_fixture[0]
+        provider = providers_fixture[0]
+        old_scan = self._create_scan(tenant, provider, fail=1)
+        latest_scan = self._create_scan(tenant, provider, fail=2)
+        update_latest_scan_summaries(str(tenant.id), str(latest_scan.id))
+
+        result = update_latest_scan_summaries(str(tenant.id), str(old_scan.id))
+
+        assert result == {"status": "not the latest scan"}
+        assert (
+            LatestScanSummary.objects.get(provider=provider).scan_id == latest_scan.id
+        )
+
+
 # TODO Add tests for aggregations
 
 
@@ -752,7 +1121,6 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
         ):
             tenant_id = str(tenants_fixture[0].id)
             scan_id = str(scans_fixture[0].id)
@@ -803,7 +1171,6 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
         ):
             tenant_id = str(tenants_fixture[0].id)
             scan_id = str(scans_fixture[0].id)
@@ -842,7 +1209,6 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
         ):
             tenant = tenants_fixture[0]
             scan = scans_fixture[0]
@@ -890,7 +1256,6 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
         ):
             tenant_id = str(tenants_fixture[0].id)
             scan_id = str(scans_fixture[0].id)
@@ -922,14 +1287,9 @@ class TestCreateComplianceRequirements:
     def test_create_compliance_requirements_check_status_priority(
         self, tenants_fixture, scans_fixture, providers_fixture, findings_fixture
     ):
-        with (
-            patch(
-                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
-            ) as mock_compliance_template,
-            patch(
-                "tasks.jobs.scan.generate_scan_compliance"
-            ) as mock_generate_compliance,
-        ):
+        with patch(
+            "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
+        ) as mock_compliance_template:
             tenant_id = str(tenants_fixture[0].id)
             scan_id = str(scans_fixture[0].id)
 
@@ -940,6 +1300,7 @@ class TestCreateComplianceRequirements:
                     "requirements": {
                         "1.1": {
                             "description": "Test requirement",
+                            "checks": {"test_check_id": None},
                             "checks_status": {
                                 "pass": 0,
                                 "fail": 0,
@@ -954,7 +1315,87 @@ class TestCreateComplianceRequirements:
 
             create_compliance_requirements(tenant_id, scan_id)
 
-            assert mock_generate_compliance.call_count == 1
+            # Only the non-muted finding, in us-east-1, is counted
+            failed_requirement = ComplianceRequirementOverview.objects.get(
+                scan_id=scan_id, region="us-east-1", requirement_id="1.1"
+            )
+            assert failed_requirement.failed_checks == 1
+            assert failed_requirement.requirement_status == "FAIL"
+            muted_requirement = ComplianceRequirementOverview.objects.get(
+                scan_id=scan_id, region="eu-west-1", requirement_id="1.1"
+            )
+            assert muted_requirement.failed_checks == 0
+            assert muted_requirement.requirement_status == "PASS"
+
+    def test_create_compliance_requirements_from_check_status_by_region(
+        self, tenants_fixture, scans_fixture, providers_fixture
+    ):
+        with (
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
+            ) as mock_compliance_template,
+            patch(
+                "tasks.jobs.scan._get_check_status_by_region"
+            ) as mock_get_check_status_by_region,
+        ):
+            tenant_id = str(tenants_fixture[0].id)
+            scan_id = str(scans_fixture[0].id)
+
+            mock_compliance_template.__getitem__.return_value = {
+                "test_compliance": {
+                    "framework": "Test Framework",
+                    "version": "1.0",
+                    "requirements": {
+                        "req_1": {
+                            "description": "Test Requirement 1",
+                            "checks": {"check_a": None, "check_b": None},
+                            "checks_status": {
+                                "pass": 0,
+                                "fail": 0,
+                                "manual": 0,
+                                "total": 2,
+                            },
+                            "status": "PASS",
+                        },
+                        "req_2": {
+                            "description": "Test Requirement 2",
+                            "checks": {"check_c": None},
+                            "checks_status": {
+                                "pass": 0,
+                                "fail": 0,
+                                "manual": 0,
+                                "total": 1,
+                            },
+                            "status": "PASS",
+                        },
+                    },
+                }
+            }
+
+            create_compliance_requirements(
+                tenant_id,
+                scan_id,
+                check_status_by_region={
+                    "us-east-1": {"check_a": "PASS", "check_b": "FAIL"},
+                    "eu-west-1": {"check_a": "PASS", "check_c": "PASS"},
+                },
+            )
+
+            mock_get_check_status_by_region.assert_not_called()
+            requirements = {
+                (requirement.region, requirement.requirement_id): requirement
+                for requirement in ComplianceRequirementOverview.objects.filter(
+                    scan_id=scan_id
+                )
+            }
+            assert requirements[("us-east-1", "req_1")].passed_checks == 1
+            assert requirements[("us-east-1", "req_1")].failed_checks == 1
+            assert requirements[("us-east-1", "req_1")].requirement_status == "FAIL"
+            assert requirements[("us-east-1", "req_2")].passed_checks == 0
+            assert requirements[("us-east-1", "req_2")].requirement_status == "PASS"
+            assert requirements[("eu-west-1", "req_1")].passed_checks == 1
+            assert requirements[("eu-west-1", "req_1")].requirement_status == "PASS"
+            assert requirements[("eu-west-1", "req_2")].passed_checks == 1
 
     def test_create_compliance_requirements_multiple_regions(
         self,
@@ -967,7 +1408,6 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
         ):
             tenant_id = str(tenants_fixture[0].id)
             scan_id = str(scans_fixture[0].id)
@@ -1007,7 +1447,6 @@ class TestCreateComplianceRequirements:
             patch(
                 "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE"
             ) as mock_compliance_template,
-            patch("tasks.jobs.scan.generate_scan_compliance"),
         ):
             tenant_id = str(tenants_fixture[0].id)
             scan_id = str(scans_fixture[0].id)
@@ -479,9 +479,8 @@ class TestScanCompleteTasks:
         self, mock_outputs_task, mock_scan_summary_task, mock_compliance_tasks
     ):
         _perform_scan_complete_tasks("tenant-id", "scan-id", "provider-id")
-        mock_compliance_tasks.assert_called_once_with(
-            kwargs={"tenant_id": "tenant-id", "scan_id": "scan-id"},
-        )
+        # The compliance requirements are created by the scan itself
+        mock_compliance_tasks.assert_not_called()
         mock_scan_summary_task.assert_called_once_with(
             scan_id="scan-id",
             tenant_id="tenant-id",
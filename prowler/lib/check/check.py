@@ -1,12 +1,14 @@
 import importlib
 import json
 import os
+import queue
 import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable, Generator, Optional
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -389,7 +391,24 @@ def execute_checks(
     custom_checks_metadata: Any,
     config_file: str,
     output_options: Any,
+    max_workers: int = 1,
+    findings_handler: Optional[Callable[[list], None]] = None,
 ) -> list:
+    """
+    Execute the given checks and report their findings
+
+    Args:
+        checks_to_execute (list): checks to execute
+        global_provider (Any): provider object
+        custom_checks_metadata (Any): custom checks metadata
+        config_file (str): path of the configuration file in use
+        output_options (Any): output options, depending on the provider
+        max_workers (int): number of checks executed concurrently, grouped by service (default: 1)
+        findings_handler (Callable): function called with the findings of every check as it completes, the findings are not kept when it is set (default: None)
+
+    Returns:
+        list: list of findings, empty if findings_handler is set
+    """
     # List to store all the check's findings
     all_findings = []
     # Services and checks executed for the Audit Status
@@ -431,53 +450,60 @@ def execute_checks(
     elif hasattr(output_options, "fixer"):
         verbose = output_options.fixer
 
-    # Execution with the --only-logs flag
-    if output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
-            try:
-                try:
-                    # Import check module
-                    check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                    lib = import_check(check_module_path)
-                    # Recover functions from check
-                    check_to_execute = getattr(lib, check_name)
-                    check = check_to_execute()
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                    continue
-                if verbose:
-                    print(
-                        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
-                    )
-                check_findings = execute(
-                    check,
-                    global_provider,
-                    custom_checks_metadata,
-                    output_options,
+    def run_check(check_name: str) -> tuple:
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        # Import check module
+        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+        lib = import_check(check_module_path)
+        # Recover functions from check
+        check_to_execute = getattr(lib, check_name)
+        check = check_to_execute()
+        check_findings = execute(
+            check,
+            global_provider,
+            custom_checks_metadata,
+            output_options,
+        )
+        return check, check_findings
+
+    def process_check_result(check_name: str, result: tuple, error: Exception):
+        try:
+            if error:
+                raise error
+            check, check_findings = result
+            if verbose:
+                print(
+                    f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
                 )
-                report(check_findings, global_provider, output_options)
+            report(check_findings, global_provider, output_options)
+            if findings_handler:
+                findings_handler(check_findings)
+            else:
                 all_findings.extend(check_findings)
 
-                # Update Audit Status
-                services_executed.add(service)
-                checks_executed.add(check_name)
-                global_provider.audit_metadata = update_audit_metadata(
-                    global_provider.audit_metadata, services_executed, checks_executed
-                )
+            # Update Audit Status
+            services_executed.add(check_name.split("_")[0])
+            checks_executed.add(check_name)
+            global_provider.audit_metadata = update_audit_metadata(
+                global_provider.audit_metadata, services_executed, checks_executed
+            )
+        # If check does not exists in the provider or is from another provider
+        except ModuleNotFoundError:
+            logger.error(
+                f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+            )
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.error(
-                    f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                )
-            except Exception as error:
-                logger.error(
-                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+    # Execution with the --only-logs flag
+    if output_options.only_logs:
+        for check_name, result, error in run_checks(
+            checks_to_execute, run_check, max_workers
+        ):
+            process_check_result(check_name, result, error)
     else:
         # Prepare your messages
         messages = [f"Config File: {Fore.YELLOW}{config_file}{Style.RESET_ALL}"]
@@ -510,64 +536,88 @@ def execute_checks(
             stats=False,
             enrich_print=False,
         ) as bar:
-            for check_name in checks_to_execute:
+            for check_name, result, error in run_checks(
+                checks_to_execute, run_check, max_workers
+            ):
                 # Recover service from check name
                 service = check_name.split("_")[0]
                 bar.title = (
                     f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                 )
-                try:
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                        )
-                        continue
-                    if verbose:
-                        print(
-                            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
-                        )
-                    check_findings = execute(
-                        check,
-                        global_provider,
-                        custom_checks_metadata,
-                        output_options,
-                    )
-
-                    report(check_findings, global_provider, output_options)
-
-                    all_findings.extend(check_findings)
-                    services_executed.add(service)
-                    checks_executed.add(check_name)
-                    global_provider.audit_metadata = update_audit_metadata(
-                        global_provider.audit_metadata,
-                        services_executed,
-                        checks_executed,
-                    )
-
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+                process_check_result(check_name, result, error)
                 bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
 
     return all_findings
 
 
+def run_checks(
+    checks_to_execute: list,
+    check_runner: Callable[[str], Any],
+    max_workers: int = 1,
+    ordered: bool = True,
+) -> Generator[tuple[str, Any, Optional[Exception]], None, None]:
+    """
+    Run every check with the check_runner and yield the outcome of each one.
+
+    Checks are grouped by service and each service group is executed serially by a
+    single worker, so the checks of a service never run at the same time while
+    different services are scanned concurrently. The caller consumes the results
+    in its own thread, so any progress accounting done there needs no locking.
+
+    Args:
+        checks_to_execute (list): checks to run
+        check_runner (Callable): function called with the check name, its return value is yielded
+        max_workers (int): number of workers, 1 or less runs the checks in the calling thread (default: 1)
+        ordered (bool): yield in the checks_to_execute order, otherwise as soon as each check completes (default: True)
+
+    Yields:
+        tuple: (check_name, result, error), where error is the exception raised by the check_runner, if any
+    """
+    if max_workers is None or max_workers <= 1:
+        for check_name in checks_to_execute:
+            try:
+                result, error = check_runner(check_name), None
+            except Exception as check_error:
+                result, error = None, check_error
+            yield check_name, result, error
+        return
+
+    # Group the checks by service keeping their position to yield them in order
+    service_checks = {}
+    for index, check_name in enumerate(checks_to_execute):
+        service = check_name.split("_")[0]
+        service_checks.setdefault(service, []).append((index, check_name))
+
+    results = queue.Queue()
+
+    def run_service_checks(checks: list):
+        for index, check_name in checks:
+            try:
+                results.put((index, check_name, check_runner(check_name), None))
+            except Exception as check_error:
+                results.put((index, check_name, None, check_error))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for checks in service_checks.values():
+            executor.submit(run_service_checks, checks)
+
+        completed_checks = {}
+        next_index = 0
+        for _ in range(len(checks_to_execute)):
+            index, check_name, result, error = results.get()
+            if not ordered:
+                yield check_name, result, error
+                continue
+            completed_checks[index] = (check_name, result, error)
+            while next_index in completed_checks:
+                yield completed_checks.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def execute(
     check: Check,
     global_provider: Any,
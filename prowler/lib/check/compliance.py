@@ -17,26 +17,27 @@ def update_checks_metadata_with_compliance(
         dict: The checks metadata with the compliance frameworks
     """
     try:
-        for check in bulk_checks_metadata:
-            check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance
-                        compliance = Compliance(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
-            # Save it into the check's metadata
+        # Build the compliance of every check in a single pass over the requirements
+        checks_compliance = {check: [] for check in bulk_checks_metadata}
+        for framework in bulk_compliance_frameworks.values():
+            for requirement in framework.Requirements:
+                # Verify if check is in the requirement
+                for check in dict.fromkeys(requirement.Checks):
+                    if check not in checks_compliance:
+                        continue
+                    # Create the Compliance including the requirement, the framework
+                    # and the requirement are already validated
+                    compliance = Compliance.construct(
+                        Framework=framework.Framework,
+                        Provider=framework.Provider,
+                        Version=framework.Version,
+                        Description=framework.Description,
+                        Requirements=[requirement],
+                    )
+                    # Include the compliance framework for the check
+                    checks_compliance[check].append(compliance)
+        # Save it into the check's metadata
+        for check, check_compliance in checks_compliance.items():
             bulk_checks_metadata[check].Compliance = check_compliance
         return bulk_checks_metadata
     except Exception as e:
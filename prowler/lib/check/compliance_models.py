@@ -1,10 +1,13 @@
+import json
 import os
 import sys
 from enum import Enum
+from operator import itemgetter
 from typing import Optional, Union
 
-from pydantic.v1 import BaseModel, ValidationError, root_validator
+from pydantic.v1 import BaseModel, PrivateAttr, ValidationError, root_validator
 
+from prowler.lib.check.metadata_index import get_metadata_index
 from prowler.lib.check.utils import list_compliance_modules
 from prowler.lib.logger import logger
 
@@ -236,6 +239,8 @@ class Compliance(BaseModel):
             Compliance_Requirement,
         ]
     ]
+    # Position and requirement by requirement ID, built on first use
+    _requirements_index: Optional[dict] = PrivateAttr(default=None)
 
     @root_validator(pre=True)
     # noqa: F841 - since vulture raises unused variable 'cls'
@@ -248,6 +253,38 @@ class Compliance(BaseModel):
             raise ValueError("Framework or Provider must not be empty")
         return values
 
+    def get_requirements(
+        self, requirement_ids: Union[list[str], str]
+    ) -> list[Union[Mitre_Requirement, Compliance_Requirement]]:
+        """
+        Returns the requirements of the compliance framework with the given IDs, in the framework order
+
+        The index of the requirements by ID is built the first time it is called and shared by every
+        compliance output of the framework, so the requirements of each finding are looked up instead
+        of going through all the requirements of the framework.
+
+        Args:
+            requirement_ids (list[str] | str): The requirement IDs, e.g. the ones of the framework in Finding.compliance
+
+        Returns:
+            list: The requirements with the given IDs
+        """
+        if self._requirements_index is None:
+            requirements_index = {}
+            for position, requirement in enumerate(self.Requirements):
+                requirements_index.setdefault(requirement.Id, []).append(
+                    (position, requirement)
+                )
+            self._requirements_index = requirements_index
+        if isinstance(requirement_ids, str):
+            requirement_ids = [requirement_ids]
+        requirements = []
+        for requirement_id in set(requirement_ids):
+            requirements.extend(self._requirements_index.get(requirement_id, []))
+        return [
+            requirement for _, requirement in sorted(requirements, key=itemgetter(0))
+        ]
+
     @staticmethod
     def list(bulk_compliance_frameworks: dict, provider: str = None) -> list[str]:
         """
@@ -346,6 +383,18 @@ class Compliance(BaseModel):
         """Bulk load all compliance frameworks specification into a dict"""
         try:
             bulk_compliance_frameworks = {}
+            metadata_index = get_metadata_index(provider)
+            if metadata_index:
+                for compliance_framework_name, compliance_framework in metadata_index[
+                    "Compliance"
+                ].items():
+                    bulk_compliance_frameworks[compliance_framework_name] = (
+                        load_compliance_framework_from_index(
+                            compliance_framework_name, compliance_framework
+                        )
+                    )
+                return bulk_compliance_frameworks
+
             available_compliance_framework_modules = list_compliance_modules()
             for compliance_framework in available_compliance_framework_modules:
                 if provider in compliance_framework.name:
@@ -386,3 +435,71 @@ def load_compliance_framework(
         sys.exit(1)
     else:
         return compliance_framework
+
+
+# Models that can be stored in the metadata index, by name
+indexed_compliance_models = {
+    model.__name__: model
+    for model in (
+        Mitre_Requirement,
+        Compliance_Requirement,
+        CIS_Requirement_Attribute,
+        ENS_Requirement_Attribute,
+        ISO27001_2013_Requirement_Attribute,
+        AWS_Well_Architected_Requirement_Attribute,
+        KISA_ISMSP_Requirement_Attribute,
+        Prowler_ThreatScore_Requirement_Attribute,
+        Generic_Compliance_Requirement_Attribute,
+        Mitre_Requirement_Attribute_AWS,
+        Mitre_Requirement_Attribute_Azure,
+        Mitre_Requirement_Attribute_GCP,
+    )
+}
+
+
+def dump_compliance_framework_to_index(compliance_framework: Compliance) -> dict:
+    """
+    dump_compliance_framework_to_index returns the JSON representation of a validated Compliance Framework
+    along with the model resolved for each requirement and attribute, so it can be loaded without trying
+    every model of the Union types again.
+    """
+    return {
+        "Framework": json.loads(compliance_framework.json()),
+        "Models": [
+            [
+                requirement.__class__.__name__,
+                [attribute.__class__.__name__ for attribute in requirement.Attributes],
+            ]
+            for requirement in compliance_framework.Requirements
+        ],
+    }
+
+
+def load_compliance_framework_from_index(
+    compliance_framework_name: str, indexed_compliance_framework: dict
+) -> Compliance:
+    """load_compliance_framework_from_index parses a Compliance Framework Specification stored in the metadata index"""
+    try:
+        framework = indexed_compliance_framework["Framework"]
+        requirements = []
+        for requirement, (requirement_model, attribute_models) in zip(
+            framework["Requirements"], indexed_compliance_framework["Models"]
+        ):
+            # Validate the attributes with the model resolved when the index was built
+            attributes = [
+                indexed_compliance_models[attribute_model].parse_obj(attribute)
+                for attribute, attribute_model in zip(
+                    requirement["Attributes"], attribute_models
+                )
+            ]
+            requirements.append(
+                indexed_compliance_models[requirement_model].construct(
+                    **{**requirement, "Attributes": attributes}
+                )
+            )
+        return Compliance.construct(**{**framework, "Requirements": requirements})
+    except (ValidationError, KeyError, ValueError) as error:
+        logger.critical(
+            f"Compliance Framework Specification {compliance_framework_name} is not valid: {error}"
+        )
+        sys.exit(1)
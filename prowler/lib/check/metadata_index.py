@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+import prowler
+from prowler.config.config import default_cache_directory, prowler_version
+from prowler.lib.check.utils import (
+    list_compliance_modules,
+    recover_checks_from_provider,
+)
+from prowler.lib.logger import logger
+
+# Bump it every time the index layout changes
+METADATA_INDEX_VERSION = 1
+# Set it to "false" to always read the metadata files
+METADATA_INDEX_ENV = "PROWLER_METADATA_INDEX"
+METADATA_INDEX_DIRECTORY_ENV = "PROWLER_CACHE_DIR"
+
+# Indexes already loaded in this process, by provider
+_loaded_metadata_indexes: dict[str, dict] = {}
+
+
+def is_metadata_index_enabled() -> bool:
+    """is_metadata_index_enabled returns False if the index is disabled through the environment"""
+    return os.environ.get(METADATA_INDEX_ENV, "true").lower() not in (
+        "false",
+        "0",
+        "no",
+    )
+
+
+def get_metadata_index_path(provider: str) -> str:
+    """
+    get_metadata_index_path returns the path of the metadata index of the provider.
+
+    Example:
+        get_metadata_index_path("aws") -> "~/.cache/prowler/metadata_index_aws.json"
+    """
+    directory = os.environ.get(METADATA_INDEX_DIRECTORY_ENV, default_cache_directory)
+    return os.path.join(directory, f"metadata_index_{provider}.json")
+
+
+def get_metadata_index_fingerprint(provider: str) -> str:
+    """
+    get_metadata_index_fingerprint returns a hash of the path, size and modification time of every
+    check metadata and compliance file of the provider, so any change in them makes the index stale.
+
+    It only lists directories, without importing the check packages nor reading the files.
+    """
+    fingerprint = hashlib.sha256(prowler_version.encode())
+    prowler_path = prowler.__path__[0]
+    files = []
+    services_path = os.path.join(prowler_path, "providers", provider, "services")
+    if os.path.isdir(services_path):
+        with os.scandir(services_path) as services:
+            for service in services:
+                if not service.is_dir():
+                    continue
+                with os.scandir(service.path) as checks:
+                    for check in checks:
+                        if not check.is_dir():
+                            continue
+                        metadata_file = os.path.join(
+                            check.path, f"{check.name}.metadata.json"
+                        )
+                        if os.path.isfile(metadata_file):
+                            files.append(metadata_file)
+    compliance_path = os.path.join(prowler_path, "compliance", provider)
+    if os.path.isdir(compliance_path):
+        with os.scandir(compliance_path) as compliance_files:
+            for compliance_file in compliance_files:
+                if compliance_file.is_file() and compliance_file.name.endswith(".json"):
+                    files.append(compliance_file.path)
+
+    for file in sorted(files):
+        file_stat = os.stat(file)
+        fingerprint.update(
+            f"{os.path.relpath(file, prowler_path)}:{file_stat.st_size}:{file_stat.st_mtime_ns}\n".encode()
+        )
+    return fingerprint.hexdigest()
+
+
+def build_metadata_index(provider: str, fingerprint: str) -> dict:
+    """
+    build_metadata_index reads every check metadata and compliance file of the provider.
+
+    The checks metadata is stored as it is, keyed by CheckID, and validated when the index is loaded.
+    The compliance frameworks are validated here and stored along with the model resolved for every
+    requirement, keyed by compliance framework name.
+    """
+    # Imported here since the compliance models use the index
+    from prowler.lib.check.compliance_models import (
+        dump_compliance_framework_to_index,
+        load_compliance_framework,
+    )
+
+    checks = {}
+    for check_name, check_path in recover_checks_from_provider(provider):
+        if check_name.endswith("_fixer"):
+            continue
+        metadata_file = os.path.abspath(f"{check_path}/{check_name}.metadata.json")
+        with open(metadata_file) as f:
+            metadata = json.load(f)
+        file_stat = os.stat(metadata_file)
+        checks[metadata["CheckID"]] = {
+            "File": metadata_file,
+            "Size": file_stat.st_size,
+            "ModifiedTime": file_stat.st_mtime_ns,
+            "Metadata": metadata,
+        }
+
+    compliance = {}
+    for compliance_framework in list_compliance_modules():
+        if provider not in compliance_framework.name:
+            continue
+        compliance_specification_dir_path = (
+            f"{compliance_framework.module_finder.path}/{provider}"
+        )
+        for filename in os.listdir(compliance_specification_dir_path):
+            file_path = os.path.join(compliance_specification_dir_path, filename)
+            if os.path.isfile(file_path) and os.stat(file_path).st_size > 0:
+                compliance_framework_name = filename.split(".json")[0]
+                compliance[compliance_framework_name] = (
+                    dump_compliance_framework_to_index(
+                        load_compliance_framework(file_path)
+                    )
+                )
+
+    return {
+        "Version": METADATA_INDEX_VERSION,
+        "ProwlerVersion": prowler_version,
+        "Provider": provider,
+        "Fingerprint": fingerprint,
+        "Checks": checks,
+        "Compliance": compliance,
+    }
+
+
+def save_metadata_index(provider: str, index: dict) -> None:
+    """save_metadata_index writes the index atomically, so concurrent processes never read a partial file"""
+    index_path = get_metadata_index_path(provider)
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        temporary_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(temporary_path, index_path)
+    except Exception as error:
+        # The index is just an optimisation, Prowler works without it
+        logger.debug(
+            f"Unable to save the metadata index {index_path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+
+def load_metadata_index(provider: str, fingerprint: str) -> Optional[dict]:
+    """load_metadata_index returns the index stored on disk if it is not stale, otherwise None"""
+    index_path = get_metadata_index_path(provider)
+    if not os.path.isfile(index_path):
+        return None
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except Exception as error:
+        logger.debug(
+            f"Unable to read the metadata index {index_path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+    if (
+        index.get("Version") != METADATA_INDEX_VERSION
+        or index.get("ProwlerVersion") != prowler_version
+        or index.get("Fingerprint") != fingerprint
+    ):
+        logger.debug(f"The metadata index {index_path} is stale")
+        return None
+    return index
+
+
+def get_metadata_index(provider: str) -> Optional[dict]:
+    """
+    get_metadata_index returns the metadata index of the provider, building it if it is missing or stale.
+
+    The index is read once per process. It returns None if the index is disabled or cannot be built,
+    so the callers fall back to read the metadata files.
+    """
+    if not is_metadata_index_enabled() or provider == "iac":
+        return None
+    if provider in _loaded_metadata_indexes:
+        return _loaded_metadata_indexes[provider]
+    try:
+        fingerprint = get_metadata_index_fingerprint(provider)
+        index = load_metadata_index(provider, fingerprint)
+        if not index:
+            logger.debug(f"Building the metadata index for the {provider} provider")
+            index = build_metadata_index(provider, fingerprint)
+            save_metadata_index(provider, index)
+        _loaded_metadata_indexes[provider] = index
+        return index
+    except Exception as error:
+        logger.error(
+            f"Unable to load the metadata index for the {provider} provider -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+def get_indexed_check_metadata(provider: str, check_id: str, metadata_file: str):
+    """
+    get_indexed_check_metadata returns the raw metadata of the check if the index of the provider is
+    already loaded in this process and the check's metadata file has not changed, otherwise None.
+    """
+    index = _loaded_metadata_indexes.get(provider)
+    if not index:
+        return None
+    check = index["Checks"].get(check_id)
+    if not check:
+        return None
+    try:
+        file_stat = os.stat(metadata_file)
+    except OSError:
+        return None
+    if (
+        check["File"] != os.path.abspath(metadata_file)
+        or check["Size"] != file_stat.st_size
+        or check["ModifiedTime"] != file_stat.st_mtime_ns
+    ):
+        return None
+    return check["Metadata"]
+
+
+def clear_metadata_index_cache() -> None:
+    """clear_metadata_index_cache forgets the indexes loaded in this process"""
+    _loaded_metadata_indexes.clear()
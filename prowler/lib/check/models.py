@@ -11,6 +11,10 @@ from pydantic.v1 import BaseModel, ValidationError, validator
 
 from prowler.config.config import Provider
 from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.metadata_index import (
+    get_indexed_check_metadata,
+    get_metadata_index,
+)
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 
@@ -181,7 +185,8 @@ class CheckMetadata(BaseModel):
     @staticmethod
     def get_bulk(provider: str) -> dict[str, "CheckMetadata"]:
         """
-        Load the metadata of all checks for a given provider reading the check's metadata files.
+        Load the metadata of all checks for a given provider from the provider's metadata index,
+        or reading the check's metadata files if the index is not available.
         Args:
             provider (str): The name of the provider.
         Returns:
@@ -189,6 +194,20 @@ class CheckMetadata(BaseModel):
         """
 
         bulk_check_metadata = {}
+        metadata_index = get_metadata_index(provider)
+        if metadata_index:
+            for check_id, check in metadata_index["Checks"].items():
+                try:
+                    bulk_check_metadata[check_id] = CheckMetadata.parse_obj(
+                        check["Metadata"]
+                    )
+                except ValidationError as error:
+                    logger.critical(
+                        f"Metadata from {check['File']} is not valid: {error}"
+                    )
+                    raise error
+            return bulk_check_metadata
+
         checks = recover_checks_from_provider(provider)
         # Build list of check's metadata files
         for check_info in checks:
@@ -415,6 +434,24 @@ class CheckMetadata(BaseModel):
         return checks
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_check_metadata(metadata: str) -> CheckMetadata:
+    """
+    Parse the JSON representation of a check's metadata just once.
+
+    Every finding of a check is created from the same metadata, so the parsed model is
+    cached using the JSON string as key. Customised metadata produces a different JSON
+    representation and gets its own entry. The returned model is shared and must not be
+    modified, use `.copy()` to get an instance that can be changed.
+
+    Args:
+        metadata (str): The JSON representation of the check's metadata.
+    Returns:
+        CheckMetadata: The shared parsed check metadata.
+    """
+    return CheckMetadata.parse_raw(metadata)
+
+
 class Check(ABC, CheckMetadata):
     """Prowler Check"""
 
@@ -425,8 +462,17 @@ class Check(ABC, CheckMetadata):
             os.path.abspath(sys.modules[self.__module__].__file__)[:-3]
             + ".metadata.json"
         )
-        # Store it to validate them with Pydantic
-        data = CheckMetadata.parse_file(metadata_file).dict()
+        # Use the metadata index if it is loaded and the file has not changed
+        # Module format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        module_path = self.__module__.split(".")
+        data = None
+        if len(module_path) > 2:
+            data = get_indexed_check_metadata(
+                module_path[2], module_path[-1], metadata_file
+            )
+        if data is None:
+            # Store it to validate them with Pydantic
+            data = CheckMetadata.parse_file(metadata_file).dict()
         # Calls parents init function
         super().__init__(**data)
         # TODO: verify that the CheckID is the same as the filename and classname
@@ -462,7 +508,9 @@ class Check_Report:
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
+        # Checks can change some metadata per finding, e.g. the Severity, so each finding
+        # gets a shallow copy of the shared parsed metadata
+        self.check_metadata = parse_check_metadata(metadata).copy()
         if isinstance(resource, dict):
             self.resource = resource
         elif hasattr(resource, "dict"):
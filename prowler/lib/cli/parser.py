@@ -363,6 +363,12 @@ Detailed documentation at https://docs.prowler.com
             default=default_fixer_config_file_path,
             help="Set configuration fixer file path",
         )
+        config_parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=1,
+            help="Number of checks executed concurrently, checks of the same service run in the same worker (default: 1)",
+        )
 
     def __init_custom_checks_metadata_parser__(self):
         # CustomChecksMetadata
@@ -1,3 +1,4 @@
+import functools
 import re
 from abc import ABC, abstractmethod
 
@@ -82,6 +83,19 @@ mutelist_schema = {
     "additionalProperties": False,
 }
 
+# Maximum number of muting decisions remembered per mutelist
+MUTELIST_DECISIONS_CACHE_SIZE = 100000
+
+
+@functools.lru_cache(maxsize=None)
+def compile_mutelist_item(item: str) -> re.Pattern:
+    """
+    compile_mutelist_item returns the compiled regular expression of a mutelist item, where "*" matches anything.
+
+    The mutelist items are a few, so they are compiled only once for the whole execution.
+    """
+    return re.compile(item.replace("*", ".*"))
+
 
 class Mutelist(ABC):
     """
@@ -101,10 +115,19 @@ class Mutelist(ABC):
         is_muted: Checks if a finding is muted for the audited account, check, region, resource, and tags.
         is_muted_in_check: Checks if a check is muted.
         is_excepted: Checks if the account, region, resource, and tags are excepted based on the exceptions.
+
+    The mutelist is read-only once loaded, so the muted checks matching every check and the muting
+    decisions are cached. The caches are rebuilt if a different mutelist is set.
     """
 
     _mutelist: dict = {}
     _mutelist_file_path: str = None
+    # Mutelist the caches were built for
+    _cached_mutelist: dict = None
+    # (id(muted_checks), check) -> (muted_checks, [(muted_check, muted_check_info)])
+    _muted_checks_cache: dict = None
+    # (audited_account, check, finding_region, finding_resource, finding_tags) -> bool
+    _decisions_cache: dict = None
 
     MUTELIST_KEY = "Mutelist"
 
@@ -184,24 +207,44 @@ class Mutelist(ABC):
             bool: True if the finding is muted for the audited account, check, region, resource and tags., otherwise False.
         """
         try:
+            self._reset_caches_if_mutelist_changed()
+            decision_key = (
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
+            try:
+                return self._decisions_cache[decision_key]
+            except KeyError:
+                pass
+            except TypeError:
+                # The finding tags are not hashable, so the decision cannot be cached
+                decision_key = None
+
             # By default is not muted
             is_finding_muted = False
 
-            # We always check all the accounts present in the mutelist
+            # Only the audited account and the wildcard one can mute the finding,
             # if one mutes the finding we set the finding as muted
-            for account in self._mutelist.get("Accounts", []):
-                if account == audited_account or account == "*":
-                    if self.is_muted_in_check(
-                        self._mutelist["Accounts"][account]["Checks"],
-                        audited_account,
-                        check,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    ):
-                        is_finding_muted = True
-                        break
+            accounts = self._mutelist.get("Accounts", {})
+            for account in dict.fromkeys((audited_account, "*")):
+                if account in accounts and self.is_muted_in_check(
+                    accounts[account]["Checks"],
+                    audited_account,
+                    check,
+                    finding_region,
+                    finding_resource,
+                    finding_tags,
+                ):
+                    is_finding_muted = True
+                    break
 
+            if decision_key is not None:
+                if len(self._decisions_cache) >= MUTELIST_DECISIONS_CACHE_SIZE:
+                    self._decisions_cache.clear()
+                self._decisions_cache[decision_key] = is_finding_muted
             return is_finding_muted
         except Exception as error:
             logger.error(
@@ -236,27 +279,18 @@ class Mutelist(ABC):
             # Default value is not muted
             is_check_muted = False
 
-            for muted_check, muted_check_info in muted_checks.items():
-                # map lambda to awslambda
-                muted_check = re.sub("^lambda", "awslambda", muted_check)
-
-                check_match = (
-                    "*" == muted_check
-                    or check == muted_check
-                    or self.is_item_matched([muted_check], check)
-                )
-
+            # Only the muted checks matching the check are evaluated, in the mutelist order
+            for muted_check_info in self._get_matching_muted_checks(
+                muted_checks, check
+            ):
                 # Check if the finding is excepted
                 exceptions = muted_check_info.get("Exceptions")
-                if (
-                    self.is_excepted(
-                        exceptions,
-                        audited_account,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    )
-                    and check_match
+                if self.is_excepted(
+                    exceptions,
+                    audited_account,
+                    finding_region,
+                    finding_resource,
+                    finding_tags,
                 ):
                     # Break loop and return default value since is excepted
                     break
@@ -267,33 +301,21 @@ class Mutelist(ABC):
                 # We need to set the muted_tags if None, "" or [], so the falsy helps
                 if not muted_tags:
                     muted_tags = "*"
-                # If there is a *, it affects to all checks
-                if check_match:
-                    muted_in_check = True
-                    muted_in_region = self.is_item_matched(
-                        muted_regions, finding_region
-                    )
-                    muted_in_resource = self.is_item_matched(
-                        muted_resources, finding_resource
-                    )
-                    muted_in_tags = self.is_item_matched(
-                        muted_tags, finding_tags, tag=True
-                    )
-
-                    # For a finding to be muted requires the following set to True:
-                    # - muted_in_check -> True
-                    # - muted_in_region -> True
-                    # - muted_in_tags -> True
-                    # - muted_in_resource -> True
-                    # - excepted -> False
-
-                    if (
-                        muted_in_check
-                        and muted_in_region
-                        and muted_in_tags
-                        and muted_in_resource
-                    ):
-                        is_check_muted = True
+                muted_in_region = self.is_item_matched(muted_regions, finding_region)
+                muted_in_resource = self.is_item_matched(
+                    muted_resources, finding_resource
+                )
+                muted_in_tags = self.is_item_matched(muted_tags, finding_tags, tag=True)
+
+                # For a finding to be muted requires the following set to True:
+                # - muted_in_check -> True, since only the matching checks are evaluated
+                # - muted_in_region -> True
+                # - muted_in_tags -> True
+                # - muted_in_resource -> True
+                # - excepted -> False
+
+                if muted_in_region and muted_in_tags and muted_in_resource:
+                    is_check_muted = True
 
             return is_check_muted
         except Exception as error:
@@ -302,6 +324,49 @@ class Mutelist(ABC):
             )
             return False
 
+    def _reset_caches_if_mutelist_changed(self) -> None:
+        """_reset_caches_if_mutelist_changed empties the caches if they were built for another mutelist"""
+        if self._cached_mutelist is not self._mutelist or self._decisions_cache is None:
+            self._cached_mutelist = self._mutelist
+            self._muted_checks_cache = {}
+            self._decisions_cache = {}
+
+    def _get_matching_muted_checks(self, muted_checks: dict, check: str) -> list:
+        """
+        _get_matching_muted_checks returns the information of the muted checks matching the check, in the mutelist order.
+
+        A muted check matches if it is "*", the check itself or a regular expression found in the check.
+        The result is computed once per muted checks and check.
+
+        Args:
+            muted_checks (dict): Dictionary containing information about muted checks.
+            check (str): The check to be evaluated for muting.
+
+        Returns:
+            list: The information of the muted checks matching the check.
+        """
+        self._reset_caches_if_mutelist_changed()
+        cache_key = (id(muted_checks), check)
+        cached = self._muted_checks_cache.get(cache_key)
+        # The muted checks are kept in the cache so their id cannot be reused
+        if cached and cached[0] is muted_checks:
+            return cached[1]
+
+        matching_muted_checks = []
+        for muted_check, muted_check_info in muted_checks.items():
+            # map lambda to awslambda
+            if muted_check.startswith("lambda"):
+                muted_check = f"aws{muted_check}"
+            # If there is a *, it affects to all checks
+            if (
+                "*" == muted_check
+                or check == muted_check
+                or self.is_item_matched([muted_check], check)
+            ):
+                matching_muted_checks.append(muted_check_info)
+        self._muted_checks_cache[cache_key] = (muted_checks, matching_muted_checks)
+        return matching_muted_checks
+
     def mute_finding(self, finding):
         """
         Check if the provided finding is muted
@@ -421,14 +486,13 @@ class Mutelist(ABC):
                 if tag:
                     is_item_matched = True
                 for item in matched_items:
-                    if "*" in item:
-                        item = item.replace("*", ".*")
+                    item = compile_mutelist_item(item)
                     if tag:
-                        if not re.search(item, finding_items):
+                        if not item.search(finding_items):
                             is_item_matched = False
                             break
                     else:
-                        if re.search(item, finding_items):
+                        if item.search(finding_items):
                             is_item_matched = True
                             break
             return is_item_matched
@@ -38,35 +38,35 @@ class AWSWellArchitected(ComplianceOutput):
         """
         for finding in findings:
             # Get the compliance requirements for the finding
-            finding_requirements = finding.compliance.get(compliance_name, [])
-            for requirement in compliance.Requirements:
-                if requirement.Id in finding_requirements:
-                    for attribute in requirement.Attributes:
-                        compliance_row = AWSWellArchitectedModel(
-                            Provider=finding.provider,
-                            Description=compliance.Description,
-                            AccountId=finding.account_uid,
-                            Region=finding.region,
-                            AssessmentDate=str(timestamp),
-                            Requirements_Id=requirement.Id,
-                            Requirements_Description=requirement.Description,
-                            Requirements_Attributes_Name=attribute.Name,
-                            Requirements_Attributes_WellArchitectedQuestionId=attribute.WellArchitectedQuestionId,
-                            Requirements_Attributes_WellArchitectedPracticeId=attribute.WellArchitectedPracticeId,
-                            Requirements_Attributes_Section=attribute.Section,
-                            Requirements_Attributes_SubSection=attribute.SubSection,
-                            Requirements_Attributes_LevelOfRisk=attribute.LevelOfRisk,
-                            Requirements_Attributes_AssessmentMethod=attribute.AssessmentMethod,
-                            Requirements_Attributes_Description=attribute.Description,
-                            Requirements_Attributes_ImplementationGuidanceUrl=attribute.ImplementationGuidanceUrl,
-                            Status=finding.status,
-                            StatusExtended=finding.status_extended,
-                            ResourceId=finding.resource_uid,
-                            ResourceName=finding.resource_name,
-                            CheckId=finding.check_id,
-                            Muted=finding.muted,
-                        )
-                        self._data.append(compliance_row)
+            for requirement in compliance.get_requirements(
+                finding.compliance.get(compliance_name, [])
+            ):
+                for attribute in requirement.Attributes:
+                    compliance_row = AWSWellArchitectedModel(
+                        Provider=finding.provider,
+                        Description=compliance.Description,
+                        AccountId=finding.account_uid,
+                        Region=finding.region,
+                        AssessmentDate=str(timestamp),
+                        Requirements_Id=requirement.Id,
+                        Requirements_Description=requirement.Description,
+                        Requirements_Attributes_Name=attribute.Name,
+                        Requirements_Attributes_WellArchitectedQuestionId=attribute.WellArchitectedQuestionId,
+                        Requirements_Attributes_WellArchitectedPracticeId=attribute.WellArchitectedPracticeId,
+                        Requirements_Attributes_Section=attribute.Section,
+                        Requirements_Attributes_SubSection=attribute.SubSection,
+                        Requirements_Attributes_LevelOfRisk=attribute.LevelOfRisk,
+                        Requirements_Attributes_AssessmentMethod=attribute.AssessmentMethod,
+                        Requirements_Attributes_Description=attribute.Description,
+                        Requirements_Attributes_ImplementationGuidanceUrl=attribute.ImplementationGuidanceUrl,
+                        Status=finding.status,
+                        StatusExtended=finding.status_extended,
+                        ResourceId=finding.resource_uid,
+                        ResourceName=finding.resource_name,
+                        CheckId=finding.check_id,
+                        Muted=finding.muted,
+                    )
+                    self._data.append(compliance_row)
         # Add manual requirements to the compliance output
         for requirement in compliance.Requirements:
             if not requirement.Checks:
@@ -20,9 +20,9 @@ def get_cis_table(
         "Level 2": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = set()
+    fail_count = set()
+    muted_count = set()
     for index, finding in enumerate(findings):
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
@@ -42,13 +42,13 @@ def get_cis_table(
                             }
                         if finding.muted:
                             if index not in muted_count:
-                                muted_count.append(index)
+                                muted_count.add(index)
                                 sections[section]["Muted"] += 1
                         else:
                             if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
+                                fail_count.add(index)
                             elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
+                                pass_count.add(index)
                         if "Level 1" in attribute.Profile:
                             if not finding.muted:
                                 if finding.status == "FAIL":
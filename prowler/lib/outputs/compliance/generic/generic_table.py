@@ -12,9 +12,9 @@ def get_generic_compliance_table(
     output_directory: str,
     compliance_overview: bool,
 ):
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = set()
+    fail_count = set()
+    muted_count = set()
     for index, finding in enumerate(findings):
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
@@ -27,12 +27,12 @@ def get_generic_compliance_table(
             ):
                 if finding.muted:
                     if index not in muted_count:
-                        muted_count.append(index)
+                        muted_count.add(index)
                 else:
                     if finding.status == "FAIL" and index not in fail_count:
-                        fail_count.append(index)
+                        fail_count.add(index)
                     elif finding.status == "PASS" and index not in pass_count:
-                        pass_count.append(index)
+                        pass_count.add(index)
     if (
         len(fail_count) + len(pass_count) + len(muted_count) > 1
     ):  # If there are no resources, don't print the compliance table
@@ -19,9 +19,9 @@ def get_mitre_attack_table(
         "Status": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = set()
+    fail_count = set()
+    muted_count = set()
     for index, finding in enumerate(findings):
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
@@ -36,16 +36,16 @@ def get_mitre_attack_table(
                             tactics[tactic] = {"FAIL": 0, "PASS": 0, "Muted": 0}
                         if finding.muted:
                             if index not in muted_count:
-                                muted_count.append(index)
+                                muted_count.add(index)
                                 tactics[tactic]["Muted"] += 1
                         else:
                             if finding.status == "FAIL":
                                 if index not in fail_count:
-                                    fail_count.append(index)
+                                    fail_count.add(index)
                                     tactics[tactic]["FAIL"] += 1
                             elif finding.status == "PASS":
                                 if index not in pass_count:
-                                    pass_count.append(index)
+                                    pass_count.add(index)
                                     tactics[tactic]["PASS"] += 1
     # Add results to table
     tactics = dict(sorted(tactics.items()))
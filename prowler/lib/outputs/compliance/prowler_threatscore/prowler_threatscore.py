@@ -19,13 +19,13 @@ def get_prowler_threatscore_table(
         "Score": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = set()
+    fail_count = set()
+    muted_count = set()
     pillars = {}
     score_per_pillar = {}
     max_score_per_pillar = {}
-    counted_findings = []
+    counted_findings = set()
     for index, finding in enumerate(findings):
         check = bulk_checks_metadata[finding.check_metadata.CheckID]
         check_compliances = check.Compliance
@@ -52,21 +52,21 @@ def get_prowler_threatscore_table(
                             max_score_per_pillar[pillar] += (
                                 attribute.LevelOfRisk * attribute.Weight
                             )
-                            counted_findings.append(index)
+                            counted_findings.add(index)
 
                         if pillar not in pillars:
                             pillars[pillar] = {"FAIL": 0, "PASS": 0, "Muted": 0}
 
                         if finding.muted:
                             if index not in muted_count:
-                                muted_count.append(index)
+                                muted_count.add(index)
                                 pillars[pillar]["Muted"] += 1
                         else:
                             if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
+                                fail_count.add(index)
                                 pillars[pillar]["FAIL"] += 1
                             elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
+                                pass_count.add(index)
                                 pillars[pillar]["PASS"] += 1
 
     pillars = dict(sorted(pillars.items()))
@@ -96,6 +96,54 @@ def set_report_color(status: str, muted: bool = False) -> str:
     return color
 
 
+class FindingsStatistics:
+    """
+    Running statistics of the findings, updated with the findings of every check as it completes, so the
+    findings do not need to be kept until the end of the scan. Only the UIDs of the resources are stored.
+    """
+
+    def __init__(self):
+        self._resources = set()
+        self._stats = {
+            "total_pass": 0,
+            "total_muted_pass": 0,
+            "total_fail": 0,
+            "total_muted_fail": 0,
+            "findings_count": 0,
+            "all_fails_are_muted": True,
+        }
+        for severity in Severity:
+            self._stats[f"total_{severity.value}_severity_fail"] = 0
+            self._stats[f"total_{severity.value}_severity_pass"] = 0
+
+    def update(self, findings: list[Finding]) -> None:
+        """Add the findings to the statistics"""
+        for finding in findings:
+            self._resources.add(finding.resource_uid)
+
+            if finding.status == Status.PASS:
+                status = "pass"
+            elif finding.status == Status.FAIL:
+                status = "fail"
+                if not finding.muted:
+                    self._stats["all_fails_are_muted"] = False
+            else:
+                continue
+
+            self._stats["findings_count"] += 1
+            self._stats[f"total_{status}"] += 1
+            self._stats[
+                f"total_{Severity(finding.metadata.Severity).value}_severity_{status}"
+            ] += 1
+            if finding.muted is True:
+                self._stats[f"total_muted_{status}"] += 1
+
+    @property
+    def stats(self) -> dict:
+        """The statistics in the format returned by extract_findings_statistics"""
+        return {**self._stats, "resources_count": len(self._resources)}
+
+
 def extract_findings_statistics(findings: list[Finding]) -> dict:
     """
     extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
@@ -112,81 +160,6 @@ def extract_findings_statistics(findings: list[Finding]) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    muted_pass = 0
-    muted_fail = 0
-    resources = set()
-    findings_count = 0
-    all_fails_are_muted = True
-    critical_severity_pass = 0
-    critical_severity_fail = 0
-    high_severity_pass = 0
-    high_severity_fail = 0
-    medium_severity_pass = 0
-    medium_severity_fail = 0
-    low_severity_pass = 0
-    low_severity_fail = 0
-    informational_severity_pass = 0
-    informational_severity_fail = 0
-
-    for finding in findings:
-        resources.add(finding.resource_uid)
-
-        if finding.status == Status.PASS:
-            findings_count += 1
-            total_pass += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_pass += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_pass += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_pass += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_pass += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_pass += 1
-
-            if finding.muted is True:
-                muted_pass += 1
-
-        if finding.status == Status.FAIL:
-            findings_count += 1
-            total_fail += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_fail += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_fail += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_fail += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_fail += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_fail += 1
-
-            if finding.muted is True:
-                muted_fail += 1
-
-            if not finding.muted and all_fails_are_muted:
-                all_fails_are_muted = False
-
-    stats["total_pass"] = total_pass
-    stats["total_muted_pass"] = muted_pass
-    stats["total_fail"] = total_fail
-    stats["total_muted_fail"] = muted_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
-    stats["total_critical_severity_fail"] = critical_severity_fail
-    stats["total_critical_severity_pass"] = critical_severity_pass
-    stats["total_high_severity_fail"] = high_severity_fail
-    stats["total_high_severity_pass"] = high_severity_pass
-    stats["total_medium_severity_fail"] = medium_severity_fail
-    stats["total_medium_severity_pass"] = medium_severity_pass
-    stats["total_low_severity_fail"] = low_severity_fail
-    stats["total_low_severity_pass"] = low_severity_pass
-    stats["total_informational_severity_pass"] = informational_severity_pass
-    stats["total_informational_severity_fail"] = informational_severity_fail
-    stats["all_fails_are_muted"] = all_fails_are_muted
-
-    return stats
+    statistics = FindingsStatistics()
+    statistics.update(findings)
+    return statistics.stats
@@ -0,0 +1,366 @@
+from itertools import repeat
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from typing import Iterator, NamedTuple
+
+from prowler.config.config import (
+    csv_file_suffix,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+)
+from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.models import CheckMetadata
+from prowler.lib.logger import logger
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+    AWSWellArchitected,
+)
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
+from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
+from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
+    KubernetesISO27001,
+)
+from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+    AzureMitreAttack,
+)
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
+    ProwlerThreatScoreAWS,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
+    ProwlerThreatScoreAzure,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
+    ProwlerThreatScoreGCP,
+)
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
+    ProwlerThreatScoreM365,
+)
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.output import Output
+from prowler.lib.outputs.outputs import FindingsStatistics
+from prowler.providers.common.provider import Provider
+
+# Compliance output classes by provider, the frameworks not matched use GenericCompliance
+COMPLIANCE_CLASS_MAP = {
+    "aws": [
+        (lambda name: name.startswith("cis_"), AWSCIS),
+        (lambda name: name == "mitre_attack_aws", AWSMitreAttack),
+        (lambda name: name.startswith("ens_"), AWSENS),
+        (
+            lambda name: name.startswith("aws_well_architected_framework"),
+            AWSWellArchitected,
+        ),
+        (lambda name: name.startswith("iso27001_"), AWSISO27001),
+        (lambda name: name.startswith("kisa"), AWSKISAISMSP),
+        (lambda name: name == "prowler_threatscore_aws", ProwlerThreatScoreAWS),
+    ],
+    "azure": [
+        (lambda name: name.startswith("cis_"), AzureCIS),
+        (lambda name: name == "mitre_attack_azure", AzureMitreAttack),
+        (lambda name: name.startswith("ens_"), AzureENS),
+        (lambda name: name.startswith("iso27001_"), AzureISO27001),
+        (lambda name: name == "prowler_threatscore_azure", ProwlerThreatScoreAzure),
+    ],
+    "gcp": [
+        (lambda name: name.startswith("cis_"), GCPCIS),
+        (lambda name: name == "mitre_attack_gcp", GCPMitreAttack),
+        (lambda name: name.startswith("ens_"), GCPENS),
+        (lambda name: name.startswith("iso27001_"), GCPISO27001),
+        (lambda name: name == "prowler_threatscore_gcp", ProwlerThreatScoreGCP),
+    ],
+    "kubernetes": [
+        (lambda name: name.startswith("cis_"), KubernetesCIS),
+        (lambda name: name.startswith("iso27001_"), KubernetesISO27001),
+    ],
+    "m365": [
+        (lambda name: name.startswith("cis_"), M365CIS),
+        (lambda name: name == "prowler_threatscore_m365", ProwlerThreatScoreM365),
+        (lambda name: name.startswith("iso27001_"), M365ISO27001),
+    ],
+    "nhn": [
+        (lambda name: name.startswith("iso27001_"), NHNISO27001),
+    ],
+    "github": [
+        (lambda name: name.startswith("cis_"), GithubCIS),
+    ],
+}
+
+# Resource of the rows added by the compliance outputs for the requirements without checks
+MANUAL_REQUIREMENT_RESOURCE_ID = "manual_check"
+
+# Output classes and file suffixes of the output formats
+OUTPUT_FORMATS_MAPPING = {
+    "csv": (CSV, csv_file_suffix),
+    "json-asff": (ASFF, json_asff_file_suffix),
+    "json-ocsf": (OCSF, json_ocsf_file_suffix),
+    "html": (HTML, html_file_suffix),
+}
+
+
+def get_compliance_output_class(provider: str, compliance_name: str) -> type:
+    """get_compliance_output_class returns the output class of the compliance framework for the provider"""
+    for condition, compliance_class in COMPLIANCE_CLASS_MAP.get(provider, []):
+        if condition(compliance_name):
+            return compliance_class
+    return GenericCompliance
+
+
+class FindingResult(NamedTuple):
+    """Result of a finding with the fields used by the summary and compliance tables"""
+
+    check_metadata: CheckMetadata
+    status: str
+    muted: bool
+
+
+class FindingResults:
+    """
+    Running count of the check results by check, severity, status and muted.
+
+    It replaces the list of findings in the summary and compliance tables: iterating it yields a
+    FindingResult per finding, grouped by check in the order the checks completed, and the same
+    object is yielded for the findings with the same result, so only one is stored per count.
+    The severity is part of the result since some checks override it per finding, e.g. by how
+    close a certificate is to its expiration.
+    """
+
+    def __init__(self):
+        self._results = {}
+        self._total = 0
+
+    def update(self, findings: list) -> None:
+        """Add the results of the check findings, i.e. Check_Report objects"""
+        for finding in findings:
+            key = (
+                finding.check_metadata.CheckID,
+                finding.check_metadata.Severity,
+                finding.status,
+                finding.muted,
+            )
+            if key not in self._results:
+                self._results[key] = [
+                    FindingResult(
+                        finding.check_metadata, finding.status, finding.muted
+                    ),
+                    0,
+                ]
+            self._results[key][1] += 1
+        self._total += len(findings)
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[FindingResult]:
+        for result, count in self._results.values():
+            yield from repeat(result, count)
+
+
+class StreamingOutputs:
+    """
+    Output files written check by check as the scan runs.
+
+    The findings of every check are converted to Finding once, added to the running statistics and
+    results, and appended to every output file, so they can be released before the next check and
+    the memory used is bounded by the largest check instead of the whole scan.
+
+    Each writer keeps the converted findings of its last check until the next check with findings
+    arrives, since the writers close their files with the last batch written. The HTML rows are
+    spooled to a temporary file because its header shows the statistics of the whole scan, and the
+    ASFF findings are kept in memory since that format is written at once and sent to Security Hub.
+    The rows of the compliance requirements without checks are written once, after the findings.
+
+    Attributes:
+        statistics (FindingsStatistics): The statistics of the findings.
+        results (FindingResults): The results of the findings for the summary and compliance tables.
+        generated_outputs (dict): The output writers, "regular" and "compliance".
+    """
+
+    def __init__(
+        self,
+        provider: Provider,
+        output_options,
+        output_formats: list,
+        compliance_frameworks: dict[str, Compliance],
+    ):
+        """
+        Args:
+            provider (Provider): the provider object
+            output_options: the output options object, depending on the provider
+            output_formats (list): the output formats to write, e.g. ["csv", "html"]
+            compliance_frameworks (dict): the compliance frameworks to write by name
+        """
+        self._provider = provider
+        self._output_options = output_options
+        self.statistics = FindingsStatistics()
+        self.results = FindingResults()
+        self.generated_outputs = {"regular": [], "compliance": []}
+        self._html_output = None
+        self._html_rows = None
+        self._asff_output = None
+
+        filename = f"{output_options.output_directory}/{output_options.output_filename}"
+        for output_format in output_formats or []:
+            if output_format not in OUTPUT_FORMATS_MAPPING:
+                continue
+            output_class, suffix = OUTPUT_FORMATS_MAPPING[output_format]
+            output = output_class(
+                findings=[], file_path=f"{filename}{suffix}", from_cli=False
+            )
+            if output_class is HTML:
+                self._html_output = output
+            elif output_class is ASFF:
+                self._asff_output = output
+            self.generated_outputs["regular"].append(output)
+
+        self._compliance_names = {}
+        self._manual_requirements = {}
+        for compliance_name, compliance in compliance_frameworks.items():
+            compliance_class = get_compliance_output_class(
+                provider.type, compliance_name
+            )
+            output = compliance_class(
+                findings=[],
+                compliance=compliance,
+                file_path=(
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                ),
+                from_cli=False,
+            )
+            self._compliance_names[output] = (
+                compliance,
+                (
+                    f"{compliance.Framework}-{compliance.Version}"
+                    if compliance.Version
+                    else compliance.Framework
+                ),
+            )
+            self.generated_outputs["compliance"].append(output)
+
+    @property
+    def asff_output(self) -> ASFF:
+        """The ASFF writer, if the json-asff output format is enabled"""
+        return self._asff_output
+
+    def add(self, findings: list) -> None:
+        """
+        Convert the findings of a check and append them to the running statistics, results and output files.
+
+        Args:
+            findings (list): the findings of the check, i.e. Check_Report objects
+        """
+        self.results.update(findings)
+        finding_outputs = []
+        for finding in findings:
+            try:
+                finding_outputs.append(
+                    Finding.generate_output(
+                        self._provider, finding, self._output_options
+                    )
+                )
+            except Exception:
+                continue
+        if not finding_outputs:
+            return
+        self.statistics.update(finding_outputs)
+
+        for output in self.generated_outputs["regular"]:
+            if output is self._asff_output:
+                output.transform(finding_outputs)
+            elif output is self._html_output:
+                self._spool_html_rows(finding_outputs)
+            else:
+                self._write_pending(output)
+                output.transform(finding_outputs)
+        for output in self.generated_outputs["compliance"]:
+            self._write_pending(output)
+            compliance, compliance_name = self._compliance_names[output]
+            output.transform(finding_outputs, compliance, compliance_name)
+            # Every transform adds the manual requirements, they are written once at the end
+            manual_requirements = [
+                row
+                for row in output.data
+                if row.ResourceId == MANUAL_REQUIREMENT_RESOURCE_ID
+            ]
+            if manual_requirements:
+                self._manual_requirements.setdefault(output, manual_requirements)
+                output.data[:] = [
+                    row
+                    for row in output.data
+                    if row.ResourceId != MANUAL_REQUIREMENT_RESOURCE_ID
+                ]
+
+    def close(self) -> None:
+        """Write the findings of the last check and close the output files, the HTML with the final statistics"""
+        for output in (
+            self.generated_outputs["regular"] + self.generated_outputs["compliance"]
+        ):
+            if output is self._html_output:
+                self._write_html()
+            elif output is self._asff_output:
+                # ASFF writes and closes the file at once, its findings are kept for Security Hub
+                if output.data:
+                    output.create_file_descriptor(output.file_path)
+                    output.batch_write_data_to_file()
+            else:
+                output.data.extend(self._manual_requirements.pop(output, []))
+                output.close_file = True
+                self._write_pending(output)
+
+    @staticmethod
+    def _write_pending(output: Output) -> None:
+        """Write the findings kept by the writer from the previous check, if any"""
+        if not output.data:
+            return
+        if not output.file_descriptor:
+            output.create_file_descriptor(output.file_path)
+        output.batch_write_data_to_file()
+        output.data.clear()
+
+    def _spool_html_rows(self, finding_outputs: list[Finding]) -> None:
+        self._html_output.transform(finding_outputs)
+        if self._html_rows is None:
+            self._html_rows = TemporaryFile(mode="w+")
+        self._html_rows.writelines(self._html_output.data)
+        self._html_output.data.clear()
+
+    def _write_html(self) -> None:
+        if self._html_rows is None:
+            return
+        try:
+            self._html_output.create_file_descriptor(self._html_output.file_path)
+            file_descriptor = self._html_output.file_descriptor
+            HTML.write_header(
+                file_descriptor, self._provider, self.statistics.stats, from_cli=True
+            )
+            self._html_rows.seek(0)
+            copyfileobj(self._html_rows, file_descriptor)
+            HTML.write_footer(file_descriptor)
+            file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        finally:
+            self._html_rows.close()
+            self._html_rows = None
@@ -6,6 +6,7 @@ from prowler.lib.check.check import (
     execute,
     import_check,
     list_services,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.checks_loader import load_checks_to_execute
@@ -229,6 +230,8 @@ class Scan:
     def scan(
         self,
         custom_checks_metadata: dict = None,
+        max_workers: int = 1,
+        ordered: bool = True,
     ) -> Generator[tuple[float, list[Finding]], None, None]:
         """
         Executes the scan by iterating over the checks to execute and executing each check.
@@ -236,6 +239,8 @@ class Scan:
 
         Args:
             custom_checks_metadata (dict): Custom metadata for the checks (default: {}).
+            max_workers (int): Number of checks executed concurrently, grouped by service (default: 1).
+            ordered (bool): Yield the checks in order, otherwise as soon as they complete (default: True).
 
         Yields:
             Tuple[float, list[Finding]]: A tuple containing the progress and findings for each check.
@@ -244,6 +249,7 @@ class Scan:
             ModuleNotFoundError: If the check does not exist in the provider or is from another provider.
             Exception: If any other error occurs during the execution of a check.
         """
+        check_name = None
         try:
             # Using SimpleNamespace to create a mocked object
             arguments = SimpleNamespace()
@@ -266,29 +272,19 @@ class Scan:
 
             start_time = datetime.datetime.now()
 
-            for check_name in checks_to_execute:
+            for check_name, check_findings, error in run_checks(
+                checks_to_execute,
+                lambda check_name: self._execute_check(
+                    check_name, custom_checks_metadata
+                ),
+                max_workers=max_workers,
+                ordered=ordered,
+            ):
                 try:
+                    if error:
+                        raise error
                     # Recover service from check name
                     service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                        )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
-                    )
 
                     # Filter the findings by the status
                     if self._status:
@@ -345,6 +341,27 @@ class Scan:
                 f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def _execute_check(self, check_name: str, custom_checks_metadata: dict) -> list:
+        """
+        _execute_check imports, instantiates and executes the given check, returning its findings.
+        It is called from the scan workers, so it must not update the scan progress.
+        """
+        # Recover service from check name
+        service = get_service_name_from_check_name(check_name)
+        # Import check module
+        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
+        lib = import_check(check_module_path)
+        # Recover functions from check
+        check_to_execute = getattr(lib, check_name)
+        check = check_to_execute()
+        # Execute the check
+        return execute(
+            check,
+            self._provider,
+            custom_checks_metadata,
+            output_options=None,
+        )
+
     def get_completed_services(self) -> set[str]:
         """
         get_completed_services returns the services that have been completed.
@@ -10,22 +10,33 @@ except ImportError:
 
 import re
 import sys
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from hashlib import sha512
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
 from ipaddress import ip_address
+from multiprocessing import get_context
 from os.path import exists
+from threading import RLock
 from time import mktime
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from colorama import Style
 from detect_secrets import SecretsCollection
+
+# Private helper of detect-secrets used to scan in memory, check it on every bump of the detect-secrets==1.5.0 pin
+from detect_secrets.core.scan import _process_line_based_plugins
 from detect_secrets.settings import transient_settings
+from detect_secrets.transformers import get_transformed_file
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
 
+# Minimum number of items for a batch to be scanned for secrets in a pool of processes
+SECRETS_SCAN_PROCESS_POOL_MIN_BATCH = 500
+# detect-secrets settings are global, so the scans applying them cannot overlap
+_detect_secrets_lock = RLock()
+
 default_detect_secrets_plugins = [
     {"name": "ArtifactoryDetector"},
     {"name": "AWSKeyDetector"},
@@ -111,6 +122,195 @@ def hash_sha512(string: str) -> str:
     return sha512(string.encode(encoding_format_utf_8)).hexdigest()[0:9]
 
 
+def get_detect_secrets_settings(
+    detect_secrets_plugins: list[dict] = None, excluded_secrets: list[str] = None
+) -> dict:
+    """get_detect_secrets_settings returns the detect-secrets settings with the given plugins and the regex patterns to exclude."""
+    settings = {
+        "plugins_used": detect_secrets_plugins or default_detect_secrets_plugins,
+        "filters_used": [
+            {"path": "detect_secrets.filters.common.is_invalid_file"},
+            {"path": "detect_secrets.filters.common.is_known_false_positive"},
+            {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
+            {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
+        ],
+    }
+    if excluded_secrets and len(excluded_secrets) > 0:
+        settings["filters_used"].append(
+            {
+                "path": "detect_secrets.filters.regex.should_exclude_line",
+                "pattern": excluded_secrets,
+            }
+        )
+    return settings
+
+
+def _scan_secrets_data(
+    data: Union[str, bytes], name: str = "data"
+) -> Optional[list[dict]]:
+    """
+    _scan_secrets_data scans the data in memory with the detect-secrets settings in use.
+
+    It follows SecretsCollection.scan_file without the temporary file: the data is read as if it was written
+    with the raw_unicode_escape encoding and opened as text, or as the content of a file if it is bytes, and
+    the filename filters are not applied since there is no file to check.
+    """
+    try:
+        if isinstance(data, bytes):
+            text = data.decode(encoding_format_utf_8)
+        else:
+            text = data.encode("raw_unicode_escape").decode(encoding_format_utf_8)
+    except UnicodeDecodeError:
+        # detect-secrets ignores binary files
+        return None
+    data_file = StringIO(text, newline=None)
+    data_file.name = name
+
+    secrets = SecretsCollection()
+    lines = get_transformed_file(data_file) or data_file.readlines()
+    for use_eager_transformers in (False, True):
+        if use_eager_transformers:
+            data_file.seek(0)
+            lines = get_transformed_file(data_file, use_eager_transformers=True)
+            if not lines:
+                break
+        for secret in _process_line_based_plugins(
+            lines=list(enumerate(lines, start=1)), filename=name
+        ):
+            secrets[name].add(secret)
+        if secrets[name]:
+            break
+
+    return secrets.json().get(name)
+
+
+def _scan_secrets_chunk(settings: dict, data: dict, named: bool = False) -> dict:
+    """
+    _scan_secrets_chunk scans every item of data with the settings applied once, returning the secrets of the items with any.
+
+    If named is True the IDs of the items are used as their filenames, so detect-secrets parses them by their extension.
+    """
+    results = {}
+    with _detect_secrets_lock, transient_settings(settings):
+        for item_id, item_data in data.items():
+            try:
+                item_secrets = _scan_secrets_data(
+                    item_data, name=item_id if named else "data"
+                )
+            except Exception as error:
+                logger.error(
+                    f"Error scanning {item_id} for secrets: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                continue
+            if item_secrets:
+                results[item_id] = item_secrets
+    return results
+
+
+class SecretsScanner:
+    """
+    SecretsScanner scans data for secrets with the same detect-secrets settings for every scan.
+
+    The data is scanned in memory and the batches are split among a pool of processes when they are large
+    enough to pay off starting it.
+
+    Attributes:
+        settings (dict): The detect-secrets settings used to scan.
+
+    Examples:
+        >>> SecretsScanner().scan_batch({"version-1": "password=password", "version-2": "echo hello"})
+        {'version-1': [{'filename': 'data', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'type': 'Secret Keyword'}]}
+    """
+
+    def __init__(
+        self,
+        detect_secrets_plugins: list[dict] = None,
+        excluded_secrets: list[str] = None,
+    ):
+        self.settings = get_detect_secrets_settings(
+            detect_secrets_plugins, excluded_secrets
+        )
+
+    def scan(self, data: str) -> Optional[list[dict]]:
+        """scan returns the secrets found in the data, or None if there are none."""
+        return _scan_secrets_chunk(self.settings, {"data": data}).get("data")
+
+    def scan_file(self, file: str) -> Optional[list[dict]]:
+        """scan_file returns the secrets found in the file, or None if there are none."""
+        secrets = SecretsCollection()
+        with _detect_secrets_lock, transient_settings(self.settings):
+            secrets.scan_file(file)
+        return secrets.json().get(file)
+
+    def scan_batch(self, data: dict, max_workers: int = None) -> dict:
+        """
+        scan_batch scans every item of the batch for secrets.
+
+        Args:
+            data (dict): The data to scan by an ID chosen by the caller.
+            max_workers (int): The maximum number of processes to scan large batches, by default the number of CPUs.
+
+        Returns:
+            dict: The secrets found by the ID of the data, only for the data with secrets.
+        """
+        return self._scan_in_chunks(data, max_workers)
+
+    def scan_files(self, files: dict, max_workers: int = None) -> dict:
+        """
+        scan_files scans the content of every file for secrets, without writing them to disk.
+
+        Args:
+            files (dict): The content of the files, as bytes, by their filename.
+            max_workers (int): The maximum number of processes to scan large batches, by default the number of CPUs.
+
+        Returns:
+            dict: The secrets found by filename, only for the files with secrets.
+        """
+        return self._scan_in_chunks(files, max_workers, named=True)
+
+    def _scan_in_chunks(
+        self, data: dict, max_workers: int = None, named: bool = False
+    ) -> dict:
+        max_workers = max_workers or os.cpu_count() or 1
+        if len(data) < SECRETS_SCAN_PROCESS_POOL_MIN_BATCH or max_workers < 2:
+            return _scan_secrets_chunk(self.settings, data, named)
+
+        items = list(data.items())
+        chunk_size = -(-len(items) // max_workers)
+        chunks = [
+            dict(items[index : index + chunk_size])
+            for index in range(0, len(items), chunk_size)
+        ]
+        results = {}
+        failed_chunks = []
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=get_context("spawn")
+            ) as executor:
+                futures = [
+                    executor.submit(_scan_secrets_chunk, self.settings, chunk, named)
+                    for chunk in chunks
+                ]
+                for chunk, future in zip(chunks, futures):
+                    try:
+                        results.update(future.result())
+                    except Exception as error:
+                        logger.warning(
+                            f"Error scanning a batch of data for secrets in a process, scanning it in the current one: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+                        failed_chunks.append(chunk)
+        except Exception as error:
+            # E.g. daemonic processes, like Celery workers, cannot start a process pool
+            logger.warning(
+                f"Unable to scan for secrets in a pool of processes, scanning in the current one: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            # Scanning a chunk again gives the same results
+            failed_chunks = chunks
+        for chunk in failed_chunks:
+            results.update(_scan_secrets_chunk(self.settings, chunk, named))
+        return results
+
+
 def detect_secrets_scan(
     data: str = None,
     file=None,
@@ -134,51 +334,10 @@ def detect_secrets_scan(
         {'file.txt': [{'filename': 'file.txt', 'hashed_secret': 'f7c3bc1d808e04732adf679965ccc34ca7ae3441', 'is_verified': False, 'line_number': 1, 'type': 'Secret Keyword'}]}
     """
     try:
-        if not file:
-            temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-            temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-            temp_data_file.close()
-
-        secrets = SecretsCollection()
-
-        if not detect_secrets_plugins:
-            detect_secrets_plugins = default_detect_secrets_plugins
-
-        settings = {
-            "plugins_used": detect_secrets_plugins,
-            "filters_used": [
-                {"path": "detect_secrets.filters.common.is_invalid_file"},
-                {"path": "detect_secrets.filters.common.is_known_false_positive"},
-                {"path": "detect_secrets.filters.heuristic.is_likely_id_string"},
-                {"path": "detect_secrets.filters.heuristic.is_potential_secret"},
-            ],
-        }
-
-        if excluded_secrets and len(excluded_secrets) > 0:
-            settings["filters_used"].append(
-                {
-                    "path": "detect_secrets.filters.regex.should_exclude_line",
-                    "pattern": excluded_secrets,
-                }
-            )
-        with transient_settings(settings):
-            if file:
-                secrets.scan_file(file)
-            else:
-                secrets.scan_file(temp_data_file.name)
-
-        if not file:
-            os.remove(temp_data_file.name)
-
-        detect_secrets_output = secrets.json()
-
-        if detect_secrets_output:
-            if file:
-                return detect_secrets_output[file]
-            else:
-                return detect_secrets_output[temp_data_file.name]
-        else:
-            return None
+        scanner = SecretsScanner(detect_secrets_plugins, excluded_secrets)
+        if file:
+            return scanner.scan_file(file)
+        return scanner.scan(data)
     except Exception as e:
         logger.error(f"Error scanning for secrets: {e}")
         return None
@@ -54,6 +54,7 @@ from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
     parse_organizations_metadata,
 )
+from prowler.providers.aws.lib.response_cache.response_cache import AWSResponseCache
 from prowler.providers.aws.models import (
     AWSAssumeRoleConfiguration,
     AWSAssumeRoleInfo,
@@ -86,6 +87,7 @@ class AwsProvider(Provider):
         _scan_unused_services (bool): A boolean indicating whether to scan unused services.
         _enabled_regions (set): The set of enabled regions.
         _mutelist (AWSMutelist): The AWS provider mutelist.
+        _response_cache (AWSResponseCache): The on-disk cache of the AWS API responses, if enabled.
         audit_metadata (Audit_Metadata): The audit metadata.
     """
 
@@ -98,6 +100,7 @@ class AwsProvider(Provider):
     _scan_unused_services: bool = False
     _enabled_regions: set = set()
     _mutelist: AWSMutelist
+    _response_cache: AWSResponseCache = None
     # TODO: this is not optional, enforce for all providers
     audit_metadata: Audit_Metadata
 
@@ -123,6 +126,8 @@ class AwsProvider(Provider):
         aws_access_key_id: str = None,
         aws_secret_access_key: str = None,
         aws_session_token: Optional[str] = None,
+        response_cache_dir: str = None,
+        response_cache_ttl: int = None,
     ):
         """
         Initializes the AWS provider.
@@ -148,6 +153,8 @@ class AwsProvider(Provider):
             - aws_access_key_id: The AWS access key ID.
             - aws_secret_access_key: The AWS secret access key.
             - aws_session_token: The AWS session token, optional.
+            - response_cache_dir: The directory to cache the responses of the read-only AWS API calls, optional.
+            - response_cache_ttl: The seconds the cached responses are valid, optional. Setting it enables the cache in the default directory.
 
         Raises:
             - ArgumentTypeError: If the input MFA ARN is invalid.
@@ -281,6 +288,21 @@ class AwsProvider(Provider):
             self._identity.account_arn = f"arn:{assumed_role_configuration.info.role_arn.partition}:iam::{assumed_role_configuration.info.role_arn.account_id}:root"
         ########
 
+        ######## AWS API Response Cache
+        self._response_cache = None
+        if response_cache_dir or response_cache_ttl is not None:
+            self._response_cache = AWSResponseCache(
+                account=self._identity.account,
+                cache_dir=response_cache_dir,
+                ttl=response_cache_ttl,
+            )
+            # Every client created from now on uses the cache
+            self._response_cache.register(self._session.current_session)
+            logger.info(
+                f"Caching the AWS API responses in {self._response_cache.cache_dir} for {self._response_cache.ttl} seconds"
+            )
+        ########
+
         ######## AWS Organizations Metadata
         # This is needed in the case we don't assume an AWS Organizations IAM Role
         aws_organizations_session = self._session.original_session
@@ -401,6 +423,10 @@ class AwsProvider(Provider):
     def audit_config(self):
         return self._audit_config
 
+    @property
+    def response_cache(self) -> Optional[AWSResponseCache]:
+        return self._response_cache
+
     @property
     def fixer_config(self):
         return self._fixer_config
@@ -4,6 +4,10 @@ from re import fullmatch, search
 from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arn.arn import arn_type
+from prowler.providers.aws.lib.response_cache.response_cache import (
+    DEFAULT_RESPONSE_CACHE_DIRECTORY,
+    DEFAULT_RESPONSE_CACHE_TTL,
+)
 
 
 def init_parser(self):
@@ -149,6 +153,38 @@ def init_parser(self):
         help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
     )
 
+    # AWS API Response Cache
+    response_cache_subparser = aws_parser.add_argument_group("AWS API Response Cache")
+    response_cache_subparser.add_argument(
+        "--cache-dir",
+        nargs="?",
+        default=None,
+        help="Cache the responses of the read-only AWS API calls in this directory to reuse them in the next scans",
+    )
+    response_cache_subparser.add_argument(
+        "--cache-ttl",
+        nargs="?",
+        default=None,
+        type=int,
+        help=f"Seconds the cached AWS API responses are valid, it enables the cache in {DEFAULT_RESPONSE_CACHE_DIRECTORY} if --cache-dir is not set (Default: {DEFAULT_RESPONSE_CACHE_TTL})",
+    )
+
+    # Snapshots
+    snapshot_subparser = aws_parser.add_argument_group("Snapshots")
+    snapshot_parser = snapshot_subparser.add_mutually_exclusive_group()
+    snapshot_parser.add_argument(
+        "--snapshot",
+        nargs="?",
+        default=None,
+        help="Record the AWS resources discovered in the scan to this file to replay them later with --replay",
+    )
+    snapshot_parser.add_argument(
+        "--replay",
+        nargs="?",
+        default=None,
+        help="Run the checks against the AWS resources recorded in this snapshot file instead of calling AWS, no credentials are needed. Snapshots are pickled Python objects, only replay the ones recorded by a trusted scan",
+    )
+
     # Scan Unused Services
     scan_unused_services_subparser = aws_parser.add_argument_group(
         "Scan Unused Services"
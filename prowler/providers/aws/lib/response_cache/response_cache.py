@@ -0,0 +1,264 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from boto3 import Session
+from botocore.awsrequest import AWSResponse
+
+from prowler.config.config import default_cache_directory
+from prowler.lib.logger import logger
+
+# Bump it every time the format of the cached responses changes
+RESPONSE_CACHE_VERSION = 1
+DEFAULT_RESPONSE_CACHE_DIRECTORY = f"{default_cache_directory}/aws_responses"
+DEFAULT_RESPONSE_CACHE_TTL = 3600
+DEFAULT_RESPONSE_CACHE_MAX_SIZE = 512 * 1024 * 1024
+# Only read-only operations are cached
+CACHED_OPERATION_PREFIXES = ("Describe", "List", "Get")
+# Operations returning credentials, secrets or short-lived URLs are never stored on disk, including the
+# ones returning the data scanned by the secrets checks: environment variables, user data, stack outputs,
+# documents and log events, along with the connection passwords and app client secrets
+NOT_CACHED_OPERATIONS = {
+    ("autoscaling", "DescribeLaunchConfigurations"),
+    ("cloudformation", "DescribeStacks"),
+    ("cognito-idp", "DescribeUserPoolClient"),
+    ("ecr", "GetAuthorizationToken"),
+    ("ec2", "DescribeInstanceAttribute"),
+    ("ec2", "DescribeLaunchTemplateVersions"),
+    ("ec2", "GetPasswordData"),
+    ("ecs", "DescribeTaskDefinition"),
+    ("glue", "GetConnection"),
+    ("glue", "GetConnections"),
+    ("lambda", "GetFunction"),
+    ("lambda", "GetFunctionConfiguration"),
+    ("lambda", "ListFunctions"),
+    ("logs", "FilterLogEvents"),
+    ("logs", "GetLogEvents"),
+    ("secretsmanager", "GetSecretValue"),
+    ("ssm", "GetDocument"),
+    ("ssm", "GetParameter"),
+    ("ssm", "GetParameters"),
+    ("ssm", "GetParametersByPath"),
+    ("sso", "GetRoleCredentials"),
+    ("sts", "GetFederationToken"),
+    ("sts", "GetSessionToken"),
+}
+CACHE_KEY_CONTEXT = "prowler_response_cache_key"
+CACHE_HIT_CONTEXT = "prowler_response_cache_hit"
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    raise TypeError(f"Object of type {value.__class__.__name__} is not cacheable")
+
+
+def _decode(value: dict):
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    return value
+
+
+class AWSResponseCache:
+    """
+    On-disk cache of the responses of the read-only AWS API calls.
+
+    The responses are stored in a gzipped JSON file per call, keyed by the account, region,
+    service, operation and parameters, so every page of a paginated call is stored on its own.
+    They expire after the TTL and the least recently used ones are removed once the cache is bigger than max_size.
+
+    Attributes:
+        cache_dir (str): Directory where the responses are stored.
+        ttl (int): Seconds a response is valid.
+        max_size (int): Maximum size of the cache in bytes.
+        account (str): AWS account the responses belong to.
+        hits (int): Number of calls answered from the cache.
+        misses (int): Number of calls sent to AWS and stored.
+    """
+
+    def __init__(
+        self,
+        account: str,
+        cache_dir: str = None,
+        ttl: int = None,
+        max_size: int = DEFAULT_RESPONSE_CACHE_MAX_SIZE,
+    ):
+        self.account = account
+        self.cache_dir = cache_dir or DEFAULT_RESPONSE_CACHE_DIRECTORY
+        self.ttl = DEFAULT_RESPONSE_CACHE_TTL if ttl is None else ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._list_cache_files())
+
+    def register(self, session: Session) -> None:
+        """register caches the API calls of every client created from the session from now on"""
+        session.events.register(
+            "provide-client-params",
+            self._set_cache_key,
+            unique_id="prowler-response-cache-key",
+        )
+        session.events.register(
+            "before-call",
+            self._get_cached_response,
+            unique_id="prowler-response-cache-get",
+        )
+        session.events.register(
+            "after-call",
+            self._store_response,
+            unique_id="prowler-response-cache-store",
+        )
+
+    def get_cache_key(
+        self, region: str, service: str, operation: str, params: dict
+    ) -> str:
+        """get_cache_key returns the hash of the account, region, service, operation and parameters of the call"""
+        call = json.dumps(
+            [
+                RESPONSE_CACHE_VERSION,
+                self.account,
+                region,
+                service,
+                operation,
+                params,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(call.encode()).hexdigest()
+
+    def get(self, key: str):
+        """get returns the cached response, or None if it is missing or expired"""
+        path = self._get_path(key)
+        try:
+            with gzip.open(path, "rt") as f:
+                cached_response = json.load(f, object_hook=_decode)
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logger.debug(
+                f"Unable to read the cached AWS response {path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            self._remove(path)
+            return None
+        if time.time() - cached_response["CreatedAt"] > self.ttl:
+            self._remove(path)
+            return None
+        # Keep the recently used responses when evicting
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return cached_response["Response"]
+
+    def set(self, key: str, response: dict) -> None:
+        """set stores the response atomically and evicts the least recently used responses if the cache is full"""
+        path = self._get_path(key)
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(temporary_path, "wt") as f:
+                json.dump(
+                    {"CreatedAt": time.time(), "Response": response},
+                    f,
+                    default=_encode,
+                )
+            os.chmod(temporary_path, 0o600)
+            size = os.path.getsize(temporary_path)
+            os.replace(temporary_path, path)
+        except Exception as error:
+            logger.debug(
+                f"Unable to cache the AWS response {path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return
+        with self._lock:
+            self._size += size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _set_cache_key(self, params, model, context, **kwargs):
+        service = model.service_model.service_name
+        if (
+            model.name.startswith(CACHED_OPERATION_PREFIXES)
+            and (service, model.name) not in NOT_CACHED_OPERATIONS
+            and not model.has_streaming_output
+        ):
+            context[CACHE_KEY_CONTEXT] = self.get_cache_key(
+                context.get("client_region"), service, model.name, params
+            )
+        # Keep the parameters unchanged
+        return None
+
+    def _get_cached_response(self, context, **kwargs):
+        key = context.get(CACHE_KEY_CONTEXT)
+        if not key:
+            return None
+        response = self.get(key)
+        if response is None:
+            return None
+        context[CACHE_HIT_CONTEXT] = True
+        with self._lock:
+            self.hits += 1
+        return AWSResponse(None, 200, {}, None), response
+
+    def _store_response(self, http_response, parsed, context, **kwargs):
+        key = context.get(CACHE_KEY_CONTEXT)
+        if (
+            key
+            and not context.get(CACHE_HIT_CONTEXT)
+            and http_response.status_code < 300
+        ):
+            with self._lock:
+                self.misses += 1
+            self.set(key, parsed)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+
+    def _list_cache_files(self) -> list:
+        with os.scandir(self.cache_dir) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".json.gz")
+            ]
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            with self._lock:
+                self._size -= size
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """_evict removes the least recently used responses until the cache is under 90% of its size, it must be called holding the lock"""
+        cache_files = []
+        for entry in self._list_cache_files():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            cache_files.append((stat.st_mtime, stat.st_size, entry.path))
+        self._size = sum(size for _, size, _ in cache_files)
+        for _, size, path in sorted(cache_files):
+            if self._size <= self.max_size * 0.9:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
@@ -1,3 +1,6 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Optional
 
@@ -17,6 +20,78 @@ from prowler.providers.common.models import Connection
 
 SECURITY_HUB_INTEGRATION_NAME = "prowler/prowler"
 SECURITY_HUB_MAX_BATCH = 100
+# Maximum number of regions handled at the same time
+SECURITY_HUB_MAX_WORKERS = 10
+# BatchImportFindings is limited to 10 requests per second with bursts of 30 per region
+SECURITY_HUB_BATCH_IMPORT_RATE = 10
+SECURITY_HUB_BATCH_IMPORT_BURST = 30
+SECURITY_HUB_BATCH_IMPORT_MIN_RATE = 0.5
+# Maximum number of retries of a throttled batch or of its failed findings
+SECURITY_HUB_MAX_RETRIES = 5
+SECURITY_HUB_THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "LimitExceededException",
+}
+# Error codes of the failed findings that can succeed when they are sent again
+SECURITY_HUB_RETRYABLE_ERROR_CODES = SECURITY_HUB_THROTTLING_ERROR_CODES | {
+    "InternalFailure",
+    "InternalException",
+    "InternalServerError",
+    "ServiceUnavailable",
+}
+
+
+class SecurityHubRateLimiter:
+    """
+    Token bucket pacing the BatchImportFindings requests of a region.
+
+    The rate is halved every time a request is throttled and slowly recovers after every
+    successful request, up to the Security Hub limit.
+
+    Attributes:
+        rate (float): Current number of requests per second.
+        max_rate (float): Maximum number of requests per second.
+        burst (int): Maximum number of requests sent at once.
+    """
+
+    def __init__(
+        self,
+        rate: float = SECURITY_HUB_BATCH_IMPORT_RATE,
+        burst: int = SECURITY_HUB_BATCH_IMPORT_BURST,
+    ):
+        self.rate = rate
+        self.max_rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """acquire waits until there is a token available and consumes it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    def throttled(self) -> None:
+        """throttled halves the rate and empties the bucket after a throttled request"""
+        with self._lock:
+            self.rate = max(SECURITY_HUB_BATCH_IMPORT_MIN_RATE, self.rate / 2)
+            self._tokens = 0
+
+    def succeeded(self) -> None:
+        """succeeded increases the rate after a successful request"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + 0.5)
 
 
 @dataclass
@@ -42,6 +117,7 @@ class SecurityHub:
         _aws_partition (str): AWS partition (e.g., aws, aws-cn, aws-us-gov) where SecurityHub is deployed.
         _findings_per_region (dict): Dictionary containing findings per region.
         _enabled_regions (dict): Dictionary containing enabled regions with SecurityHub clients.
+        _rate_limiters (dict): Dictionary containing the BatchImportFindings rate limiter per region.
 
     Methods:
         __init__: Initializes the SecurityHub object with necessary attributes.
@@ -49,7 +125,10 @@ class SecurityHub:
         verify_enabled_per_region: Verifies and stores enabled regions with SecurityHub clients.
         batch_send_to_security_hub: Sends findings to Security Hub and returns the count of successfully sent findings.
         archive_previous_findings: Archives findings that are not present in the current execution.
-        _send_findings_to_security_hub: Sends findings to AWS Security Hub in batches and returns the count of successfully sent findings.
+        _archive_previous_findings_in_region: Archives findings of a region that are not present in the current execution.
+        _send_findings_to_region: Sends the findings of a region to AWS Security Hub and returns the count of successfully sent findings.
+        _send_findings_in_batches: Sends findings to AWS Security Hub in batches and returns the count of successfully sent findings.
+        _send_batch: Sends a batch of findings to AWS Security Hub, retrying the throttled requests and the failed findings.
     """
 
     _session: Session
@@ -57,6 +136,7 @@ class SecurityHub:
     _aws_partition: str
     _findings_per_region: dict[str, list[AWSSecurityFindingFormat]]
     _enabled_regions: dict[str, Session]
+    _rate_limiters: dict[str, SecurityHubRateLimiter]
 
     def __init__(
         self,
@@ -122,6 +202,8 @@ class SecurityHub:
 
         self._enabled_regions = None
         self._findings_per_region = {}
+        self._rate_limiters = {}
+        self._rate_limiters_lock = threading.Lock()
 
         if aws_security_hub_available_regions:
             self._enabled_regions = self.verify_enabled_per_region(
@@ -246,120 +328,237 @@ class SecurityHub:
         """
         Sends the findings to AWS Security Hub in batches for each region and returns the count of successfully sent findings.
 
+        The regions are handled concurrently.
+
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
         success_count = 0
-        try:
-            # Iterate findings by region
-            for region, findings in self._findings_per_region.items():
-                # Send findings to Security Hub
-                logger.info(
-                    f"Sending {len(findings)} findings to Security Hub in the region {region}"
-                )
+        if not self._findings_per_region:
+            return success_count
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(
+            max_workers=min(SECURITY_HUB_MAX_WORKERS, len(self._findings_per_region))
+        ) as executor:
+            futures = [
+                executor.submit(self._send_findings_to_region, region, findings)
+                for region, findings in self._findings_per_region.items()
+            ]
+            for future in as_completed(futures):
+                success_count += future.result()
+        elapsed_time = time.monotonic() - start_time
+        logger.info(
+            f"Sent {success_count} findings to Security Hub in {elapsed_time:.2f} seconds ({success_count / max(elapsed_time, 0.001):.2f} findings/second)"
+        )
+        return success_count
 
-                # Convert findings to dict
-                findings = [finding.dict(exclude_none=True) for finding in findings]
-                success_count += self._send_findings_in_batches(
-                    findings,
-                    region,
-                )
+    def _send_findings_to_region(
+        self, region: str, findings: list[AWSSecurityFindingFormat]
+    ) -> int:
+        """
+        Sends the given findings to AWS Security Hub for a specific region and returns the count of successfully sent findings.
 
+        Args:
+            region (str): The AWS region where the findings will be sent.
+            findings (list[AWSSecurityFindingFormat]): List of findings to send to AWS Security Hub.
+
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
+        try:
+            # Send findings to Security Hub
+            logger.info(
+                f"Sending {len(findings)} findings to Security Hub in the region {region}"
+            )
+            # Convert findings to dict
+            findings = [finding.dict(exclude_none=True) for finding in findings]
+            return self._send_findings_in_batches(findings, region)
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
-        return success_count
+            return 0
 
     def archive_previous_findings(self) -> int:
         """
         Checks previous findings in Security Hub to archive them.
 
+        The regions are handled concurrently.
+
         Returns:
             int: Number of successfully archived findings.
         """
         logger.info("Checking previous findings in Security Hub to archive them.")
         success_count = 0
-        for region in self._findings_per_region.keys():
-            try:
-                current_findings = self._findings_per_region[region]
-                # Get current findings IDs
-                current_findings_ids = []
-                for finding in current_findings:
-                    current_findings_ids.append(finding.Id)
-                # Get findings of that region
-                findings_filter = {
-                    "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
-                    "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
-                    "AwsAccountId": [
-                        {"Value": self._aws_account_id, "Comparison": "EQUALS"}
-                    ],
-                    "Region": [{"Value": region, "Comparison": "EQUALS"}],
-                }
-                get_findings_paginator = self._enabled_regions[region].get_paginator(
-                    "get_findings"
-                )
-                findings_to_archive = []
-                for page in get_findings_paginator.paginate(
-                    Filters=findings_filter, PaginationConfig={"PageSize": 100}
-                ):
-                    # Archive findings that have not appear in this execution
-                    for finding in page["Findings"]:
-                        if finding["Id"] not in current_findings_ids:
-                            finding["RecordState"] = "ARCHIVED"
-                            finding["UpdatedAt"] = timestamp_utc.strftime(
-                                "%Y-%m-%dT%H:%M:%SZ"
-                            )
-
-                            findings_to_archive.append(finding)
-                logger.info(f"Archiving {len(findings_to_archive)} findings.")
-
-                # Send archive findings to SHub
+        if not self._findings_per_region:
+            return success_count
+        with ThreadPoolExecutor(
+            max_workers=min(SECURITY_HUB_MAX_WORKERS, len(self._findings_per_region))
+        ) as executor:
+            futures = [
+                executor.submit(self._archive_previous_findings_in_region, region)
+                for region in self._findings_per_region.keys()
+            ]
+            for future in as_completed(futures):
+                success_count += future.result()
+        return success_count
+
+    def _archive_previous_findings_in_region(self, region: str) -> int:
+        """
+        Archives the active Prowler findings of the region that are not present in the current execution.
+
+        Only the previous findings to archive are kept while paginating, and they are sent once the
+        pagination finishes since archiving them shrinks the ACTIVE findings being paginated.
+
+        Args:
+            region (str): The AWS region where the findings will be archived.
+
+        Returns:
+            int: Number of successfully archived findings in the region.
+        """
+        success_count = 0
+        try:
+            # Get current findings IDs
+            current_findings_ids = {
+                finding.Id for finding in self._findings_per_region[region]
+            }
+            # Get findings of that region
+            findings_filter = {
+                "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
+                "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
+                "AwsAccountId": [
+                    {"Value": self._aws_account_id, "Comparison": "EQUALS"}
+                ],
+                "Region": [{"Value": region, "Comparison": "EQUALS"}],
+            }
+            updated_at = timestamp_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+            get_findings_paginator = self._enabled_regions[region].get_paginator(
+                "get_findings"
+            )
+            findings_to_archive = []
+            for page in get_findings_paginator.paginate(
+                Filters=findings_filter,
+                PaginationConfig={"PageSize": SECURITY_HUB_MAX_BATCH},
+            ):
+                # Archive findings that have not appear in this execution
+                for finding in page["Findings"]:
+                    if finding["Id"] not in current_findings_ids:
+                        finding["RecordState"] = "ARCHIVED"
+                        finding["UpdatedAt"] = updated_at
+                        findings_to_archive.append(finding)
+            if findings_to_archive:
                 success_count += self._send_findings_in_batches(
-                    findings_to_archive,
-                    region,
-                )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+                    findings_to_archive, region
                 )
+            logger.info(
+                f"Archived {len(findings_to_archive)} findings in the region {region}."
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
         return success_count
 
-    def _send_findings_in_batches(
-        self, findings: list[AWSSecurityFindingFormat], region: str
-    ) -> int:
+    def _get_rate_limiter(self, region: str) -> SecurityHubRateLimiter:
+        """_get_rate_limiter returns the rate limiter of the region, shared by all the requests sent to it"""
+        with self._rate_limiters_lock:
+            if region not in self._rate_limiters:
+                self._rate_limiters[region] = SecurityHubRateLimiter()
+            return self._rate_limiters[region]
+
+    def _send_findings_in_batches(self, findings: list[dict], region: str) -> int:
         """
         Sends the given findings to AWS Security Hub in batches for a specific region and returns the count of successfully sent findings.
 
+        The requests are paced by the rate limiter of the region. The throttled batches are retried and
+        only the findings reported in FailedFindings with a transient error are sent again.
+
         Args:
-            findings (list[AWSSecurityFindingFormat]): List of findings to send to AWS Security Hub.
+            findings (list[dict]): List of findings to send to AWS Security Hub.
             region (str): The AWS region where the findings will be sent.
 
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
         success_count = 0
+        start_time = time.monotonic()
         try:
-            list_chunked = [
-                findings[i : i + SECURITY_HUB_MAX_BATCH]
-                for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
-            ]
-            for findings in list_chunked:
+            for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH):
+                success_count += self._send_batch(
+                    findings[i : i + SECURITY_HUB_MAX_BATCH], region
+                )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
+        elapsed_time = time.monotonic() - start_time
+        logger.info(
+            f"Sent {success_count} of {len(findings)} findings to Security Hub in the region {region} in {elapsed_time:.2f} seconds ({success_count / max(elapsed_time, 0.001):.2f} findings/second)"
+        )
+        return success_count
+
+    def _send_batch(self, findings: list[dict], region: str) -> int:
+        """
+        Sends a batch of up to SECURITY_HUB_MAX_BATCH findings to AWS Security Hub, retrying the throttled
+        requests and the findings failed with a transient error up to SECURITY_HUB_MAX_RETRIES times.
+
+        The findings failed with any other error, such as an invalid finding, are logged without sending them again.
+
+        Args:
+            findings (list[dict]): List of findings to send to AWS Security Hub.
+            region (str): The AWS region where the findings will be sent.
+
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
+        success_count = 0
+        rate_limiter = self._get_rate_limiter(region)
+        failed_findings = []
+        for _ in range(SECURITY_HUB_MAX_RETRIES + 1):
+            rate_limiter.acquire()
+            try:
                 batch_import = self._enabled_regions[region].batch_import_findings(
                     Findings=findings
                 )
-                if batch_import["FailedCount"] > 0:
-                    failed_import = batch_import["FailedFindings"][0]
+            except ClientError as error:
+                if (
+                    error.response["Error"]["Code"]
+                    not in SECURITY_HUB_THROTTLING_ERROR_CODES
+                ):
+                    raise error
+                logger.warning(
+                    f"Security Hub is throttling the findings sent to the region {region}, slowing down."
+                )
+                rate_limiter.throttled()
+                continue
+            rate_limiter.succeeded()
+            success_count += batch_import["SuccessCount"]
+            failed_findings = []
+            for failed_import in batch_import.get("FailedFindings", []):
+                if failed_import["ErrorCode"] in SECURITY_HUB_RETRYABLE_ERROR_CODES:
+                    failed_findings.append(failed_import)
+                else:
                     logger.error(
-                        f"Failed to send findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
+                        f"Failed to send finding {failed_import['Id']} to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
                     )
-                success_count += batch_import["SuccessCount"]
-            return success_count
-        except Exception as error:
+            if not failed_findings:
+                return success_count
+            # Retry only the findings that failed with a transient error
+            failed_findings_ids = {
+                failed_finding["Id"] for failed_finding in failed_findings
+            }
+            findings = [
+                finding for finding in findings if finding["Id"] in failed_findings_ids
+            ]
+        for failed_import in failed_findings:
             logger.error(
-                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+                f"Failed to send finding {failed_import['Id']} to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
             )
-            return success_count
+        if not failed_findings:
+            logger.error(
+                f"Failed to send {len(findings)} findings to AWS Security Hub in the region {region} -- the requests were throttled"
+            )
+        return success_count
 
     @staticmethod
     def test_connection(
@@ -1,7 +1,13 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import as_completed
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.service.thread_pool import (
+    get_provider_thread_pool,
+    register_throttling_handler,
+)
 
 # TODO: review the following code
 # from prowler.providers.aws.aws_provider import (
@@ -9,7 +15,45 @@ from prowler.providers.aws.aws_provider import AwsProvider
 #     get_default_region,
 # )
 
-MAX_WORKERS = 10
+
+# Lazy discovery calls the current thread is part of, either running them or running one of their thread pool tasks
+_running_lazy_calls = threading.local()
+
+
+def _get_running_lazy_calls() -> frozenset:
+    return getattr(_running_lazy_calls, "calls", frozenset())
+
+
+def _run_in_lazy_calls(call, lazy_calls: frozenset):
+    """_run_in_lazy_calls returns the call running as part of the lazy calls, so it reads the attributes they have not published yet"""
+
+    def run_in_lazy_calls(*args, **kwargs):
+        previous_lazy_calls = _get_running_lazy_calls()
+        _running_lazy_calls.calls = lazy_calls
+        try:
+            return call(*args, **kwargs)
+        finally:
+            _running_lazy_calls.calls = previous_lazy_calls
+
+    run_in_lazy_calls.__name__ = call.__name__
+    return run_in_lazy_calls
+
+
+class LazyCall:
+    """
+    Discovery call of a service that runs the first time one of its attributes is read.
+
+    The attributes set while the call runs are kept in values and published once it finishes,
+    so the other threads wait for the call instead of reading them half-filled.
+    """
+
+    def __init__(self, call, attributes: tuple):
+        self.call = call
+        self.attributes = attributes
+        self.lock = threading.RLock()
+        self.running = False
+        self.done = False
+        self.values = {}
 
 
 class AWSService:
@@ -17,7 +61,8 @@ class AWSService:
     - AWS Regional Clients
     - Shared information like the account ID and ARN, the AWS partition and the checks audited
     - AWS Session
-    - Thread pool for the __threading_call__
+    - Thread pool for the __threading_call__ and __threading_call_chain__, shared by all the services of the provider
+    - Lazy discovery calls registered with __lazy_load__ and __lazy_attribute__
     - Also handles if the AWS Service is Global
     """
 
@@ -64,12 +109,81 @@ class AWSService:
         self.region = provider.get_default_region(self.service)
         self.client = self.session.client(self.service, self.region)
 
-        # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        # Thread pool for __threading_call__, shared by all the services of the provider
+        self.thread_pool = get_provider_thread_pool(provider)
+        # Back off the service in a region when its API is throttling the requests
+        for regional_client in (getattr(self, "regional_clients", None) or {}).values():
+            register_throttling_handler(regional_client, self.thread_pool, self.service)
+        register_throttling_handler(self.client, self.thread_pool, self.service)
 
     def __get_session__(self):
         return self.session
 
+    def __lazy_load__(self, call, *attributes):
+        """Run the call, which sets the given attributes, the first time one of them is read"""
+        lazy_calls = self.__dict__.setdefault("_lazy_calls", {})
+        lazy_call = LazyCall(call, attributes)
+        for attribute in attributes:
+            lazy_calls[attribute] = lazy_call
+
+    def __lazy_attribute__(self, attribute, call, *args):
+        """Set the attribute to the call's result the first time it is read"""
+
+        def set_attribute():
+            setattr(self, attribute, call(*args))
+
+        set_attribute.__name__ = call.__name__
+        self.__lazy_load__(set_attribute, attribute)
+
+    def __load_lazy_attributes__(self):
+        """Run all the pending lazy discovery calls"""
+        for attribute in list(self.__dict__.get("_lazy_calls", {})):
+            getattr(self, attribute, None)
+
+    def __setattr__(self, name, value):
+        # The attributes of a running lazy discovery call are published once it finishes
+        lazy_call = self.__dict__.get("_lazy_calls", {}).get(name)
+        if lazy_call and lazy_call.running:
+            lazy_call.values[name] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __getattr__(self, name):
+        # Only called if the attribute is not set, so the lazy discovery call is pending or running
+        lazy_call = self.__dict__.get("_lazy_calls", {}).get(name)
+        if lazy_call:
+            if lazy_call in _get_running_lazy_calls():
+                # Read by the call itself, or by its tasks, before it publishes the attribute
+                if name in lazy_call.values:
+                    return lazy_call.values[name]
+            else:
+                # The other threads wait until the call finishes
+                with lazy_call.lock:
+                    if not lazy_call.done:
+                        lazy_call.running = True
+                        try:
+                            logger.info(
+                                f"{self.service.upper()} - Discovering {', '.join(lazy_call.attributes)}..."
+                            )
+                            _run_in_lazy_calls(
+                                lazy_call.call,
+                                _get_running_lazy_calls() | {lazy_call},
+                            )()
+                        except Exception as error:
+                            logger.error(
+                                f"{self.service.upper()} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                            )
+                        finally:
+                            self.__dict__.update(lazy_call.values)
+                            lazy_call.values = {}
+                            lazy_call.running = False
+                            lazy_call.done = True
+                if name in self.__dict__:
+                    return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
     def __threading_call__(self, call, iterator=None):
         # Use the provided iterator, or default to self.regional_clients
         items = iterator if iterator is not None else self.regional_clients.values()
@@ -91,8 +205,34 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
+        start_time = time.monotonic()
+        # Run the tasks in the current thread if it is already a task of the pool,
+        # otherwise it could wait forever for its own subtasks
+        if self.thread_pool.in_worker():
+            for item in items:
+                try:
+                    call(item)
+                except Exception:
+                    # Currently handled within the called function
+                    pass
+            return
+
+        # The tasks started by a lazy discovery call are part of it
+        running_lazy_calls = _get_running_lazy_calls()
+        if running_lazy_calls:
+            call = _run_in_lazy_calls(call, running_lazy_calls)
+
         # Submit tasks to the thread pool
-        futures = [self.thread_pool.submit(call, item) for item in items]
+        futures = [
+            self.thread_pool.submit_to_region(
+                self.service,
+                self.__get_item_region__(item),
+                f"{self.service.upper()} - {call_name}",
+                call,
+                item,
+            )
+            for item in items
+        ]
 
         # Wait for all tasks to complete
         for future in as_completed(futures):
@@ -102,6 +242,38 @@ class AWSService:
                 # Handle exceptions if necessary
                 pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
 
+        metrics = self.thread_pool.get_metrics().get(
+            f"{self.service.upper()} - {call_name}"
+        )
+        if metrics:
+            logger.info(
+                f"{self.service.upper()} - '{call_name}' function finished in {time.monotonic() - start_time:.2f} seconds (average queue time {metrics.average_queue_time:.2f} seconds, average run time {metrics.average_run_time:.2f} seconds, max queue depth {metrics.max_queue_depth})"
+            )
+
+    def __threading_call_chain__(self, calls: list, iterator):
+        """
+        Run all the calls for every item as a single task per item, one call after the other.
+
+        Unlike calling __threading_call__ once per call, the items do not wait for each other between
+        the calls, so a slow item only delays its own chain. Each task runs in the region of its item.
+        """
+
+        def call_chain(item):
+            for call in calls:
+                try:
+                    call(item)
+                except Exception:
+                    # Currently handled within the called function, the rest of the chain still runs
+                    pass
+
+        call_chain.__name__ = "_then_".join(call.__name__.strip("_") for call in calls)
+        self.__threading_call__(call_chain, iterator)
+
+    def __get_item_region__(self, item) -> str:
+        """Return the region of a regional client or resource, or the service's default region"""
+        region = getattr(item, "region", None)
+        return region if isinstance(region, str) else self.region
+
     def get_unknown_arn(self, resource_type: str = None, region: str = None) -> str:
         """
         Generate an unknown ARN for the service
@@ -0,0 +1,333 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from prowler.lib.logger import logger
+
+# Maximum number of tasks running at the same time for all the services of a provider
+DEFAULT_MAX_WORKERS = 20
+# Maximum number of tasks running at the same time for a service in a region
+DEFAULT_MAX_WORKERS_PER_REGION = 10
+# The tasks of a throttled service and region wait BACKOFF_BASE_SECONDS * 2^level
+BACKOFF_BASE_SECONDS = 0.1
+BACKOFF_MAX_LEVEL = 6
+# Error codes botocore retries because the API is throttling the requests
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+}
+
+# Thread pool of every provider, it is removed along with the provider
+_provider_thread_pools = WeakKeyDictionary()
+_provider_thread_pools_lock = threading.Lock()
+
+
+@dataclass
+class CallMetrics:
+    """
+    Metrics of the tasks submitted with the same call name.
+
+    Attributes:
+        calls (int): Number of tasks submitted.
+        completed (int): Number of tasks completed.
+        queue_depth (int): Number of tasks waiting for a worker.
+        max_queue_depth (int): Maximum number of tasks that waited for a worker at the same time.
+        queue_time (float): Seconds the tasks waited for a worker.
+        run_time (float): Seconds the tasks were running.
+    """
+
+    calls: int = 0
+    completed: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    queue_time: float = 0.0
+    run_time: float = 0.0
+
+    @property
+    def average_queue_time(self) -> float:
+        return self.queue_time / self.completed if self.completed else 0.0
+
+    @property
+    def average_run_time(self) -> float:
+        return self.run_time / self.completed if self.completed else 0.0
+
+
+class AWSThreadPool:
+    """
+    Thread pool shared by all the AWS services of a provider.
+
+    The tasks submitted for a service and region are limited to max_workers_per_region running at
+    the same time, and are delayed with an exponential backoff while botocore reports that the
+    service is throttling the requests in that region. They wait in a queue per service and region
+    and are handed to the pool once they can run, so a busy or throttled region does not hold the
+    threads the tasks of the other services and regions need.
+
+    Attributes:
+        max_workers (int): Maximum number of tasks running at the same time.
+        max_workers_per_region (int): Maximum number of tasks running at the same time per service and region.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_workers_per_region: int = DEFAULT_MAX_WORKERS_PER_REGION,
+    ):
+        self.max_workers = max_workers
+        self.max_workers_per_region = max_workers_per_region
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prowler-aws"
+        )
+        # Reentrant since the callbacks of a future failed while dispatching can submit tasks
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        # (service, region) -> deque of the tasks waiting to be handed to the executor
+        self._pending = {}
+        # (service, region) -> number of tasks handed to the executor and not finished
+        self._running = {}
+        # (service, region) -> [backoff level, monotonic time to resume]
+        self._backoffs = {}
+        # (service, region) -> threading.Timer resuming the pending tasks once the backoff is over
+        self._backoff_timers = {}
+        # (service, region) -> number of throttled requests
+        self._throttles = {}
+        # call name -> CallMetrics
+        self._metrics = {}
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """submit runs the function in the pool like ThreadPoolExecutor.submit, without any service or region limit"""
+        return self._submit(None, None, fn.__name__, fn, args, kwargs)
+
+    def submit_to_region(
+        self, service: str, region: str, call_name: str, fn, *args
+    ) -> Future:
+        """
+        submit_to_region queues the function and hands it to the pool once there are less than
+        max_workers_per_region tasks running for the service in the region and the backoff of the
+        service in the region, if any, is over. The queued function does not hold a thread of the pool.
+
+        Args:
+            service (str): The AWS service, e.g. "ec2".
+            region (str): The AWS region the function calls.
+            call_name (str): Name used to group the metrics of the task.
+            fn: The function to run.
+            args: The arguments of the function.
+
+        Returns:
+            Future: The future of the task.
+        """
+        return self._submit(service, region, call_name, fn, args, {})
+
+    def in_worker(self) -> bool:
+        """in_worker returns True if it is called from a task of the pool"""
+        return getattr(self._local, "in_worker", False)
+
+    def throttled(self, service: str, region: str) -> None:
+        """throttled increases the backoff of the service in the region"""
+        key = (service, region)
+        with self._lock:
+            level, _ = self._backoffs.get(key, (0, 0.0))
+            level = min(level + 1, BACKOFF_MAX_LEVEL)
+            self._backoffs[key] = [
+                level,
+                time.monotonic() + BACKOFF_BASE_SECONDS * 2**level,
+            ]
+            self._throttles[key] = self._throttles.get(key, 0) + 1
+        logger.debug(
+            f"{service.upper()} - Throttled in {region}, backing off (level {level})"
+        )
+
+    def get_metrics(self) -> dict[str, CallMetrics]:
+        """get_metrics returns a copy of the metrics per call name"""
+        with self._lock:
+            return {
+                call_name: CallMetrics(**vars(metrics))
+                for call_name, metrics in self._metrics.items()
+            }
+
+    def get_throttles(self) -> dict[tuple, int]:
+        """get_throttles returns the number of throttled requests per service and region"""
+        with self._lock:
+            return dict(self._throttles)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if wait:
+            # The queued tasks are handed to the executor as the running ones finish
+            with self._lock:
+                pending_futures = [
+                    task[0] for pending in self._pending.values() for task in pending
+                ]
+            wait_futures(pending_futures)
+        self._executor.shutdown(wait=wait)
+
+    def _submit(self, service, region, call_name, fn, args, kwargs) -> Future:
+        with self._lock:
+            metrics = self._metrics.setdefault(call_name, CallMetrics())
+            metrics.calls += 1
+            metrics.queue_depth += 1
+            metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+            submitted_at = time.monotonic()
+            if not service:
+                return self._executor.submit(
+                    self._run,
+                    service,
+                    region,
+                    metrics,
+                    submitted_at,
+                    fn,
+                    args,
+                    kwargs,
+                )
+            future = Future()
+            key = (service, region)
+            self._pending.setdefault(key, deque()).append(
+                (future, metrics, submitted_at, fn, args, kwargs)
+            )
+            self._dispatch(key)
+        return future
+
+    def _dispatch(self, key: tuple) -> None:
+        """
+        _dispatch hands the queued tasks of the service and region to the executor while there are
+        free slots and no backoff, and schedules their resume if there is one. It must be called holding the lock.
+        """
+        pending = self._pending.get(key)
+        while pending and self._running.get(key, 0) < self.max_workers_per_region:
+            backoff = self._backoffs.get(key)
+            if backoff and backoff[1] > time.monotonic():
+                if key not in self._backoff_timers:
+                    timer = threading.Timer(
+                        backoff[1] - time.monotonic(), self._resume, args=(key,)
+                    )
+                    timer.daemon = True
+                    self._backoff_timers[key] = timer
+                    timer.start()
+                return
+            future, metrics, submitted_at, fn, args, kwargs = pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                # Cancelled while it was queued
+                metrics.queue_depth -= 1
+                continue
+            self._running[key] = self._running.get(key, 0) + 1
+            try:
+                self._executor.submit(
+                    self._run_in_region,
+                    key,
+                    future,
+                    metrics,
+                    submitted_at,
+                    fn,
+                    args,
+                    kwargs,
+                )
+            except RuntimeError as error:
+                # The executor has been shut down
+                self._running[key] -= 1
+                metrics.queue_depth -= 1
+                future.set_exception(error)
+        if not pending:
+            self._pending.pop(key, None)
+
+    def _resume(self, key: tuple) -> None:
+        """_resume hands the queued tasks of the service and region to the executor once its backoff is over"""
+        with self._lock:
+            self._backoff_timers.pop(key, None)
+            self._dispatch(key)
+
+    def _run_in_region(
+        self, key, future, metrics, submitted_at, fn, args, kwargs
+    ) -> None:
+        try:
+            result = self._run(*key, metrics, submitted_at, fn, args, kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _run(self, service, region, metrics, submitted_at, fn, args, kwargs):
+        started_at = time.monotonic()
+        with self._lock:
+            metrics.queue_depth -= 1
+            metrics.queue_time += started_at - submitted_at
+        self._local.in_worker = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.in_worker = False
+            with self._lock:
+                metrics.completed += 1
+                metrics.run_time += time.monotonic() - started_at
+                if service:
+                    self._running[(service, region)] -= 1
+                    self._recover(service, region)
+                    self._dispatch((service, region))
+
+    def _recover(self, service: str, region: str) -> None:
+        """_recover lowers the backoff once it is over, it must be called holding the lock"""
+        key = (service, region)
+        backoff = self._backoffs.get(key)
+        if backoff and backoff[1] <= time.monotonic():
+            backoff[0] -= 1
+            if backoff[0] <= 0:
+                del self._backoffs[key]
+
+
+def get_provider_thread_pool(provider) -> AWSThreadPool:
+    """
+    get_provider_thread_pool returns the thread pool shared by all the services of the provider,
+    creating it the first time with the following audit config keys:
+        - max_service_threads: maximum number of tasks running at the same time.
+        - max_service_threads_per_region: maximum number of tasks running at the same time per service and region.
+    """
+    with _provider_thread_pools_lock:
+        thread_pool = _provider_thread_pools.get(provider)
+        if thread_pool is None:
+            audit_config = getattr(provider, "audit_config", None)
+            if not isinstance(audit_config, dict):
+                audit_config = {}
+            thread_pool = AWSThreadPool(
+                max_workers=audit_config.get(
+                    "max_service_threads", DEFAULT_MAX_WORKERS
+                ),
+                max_workers_per_region=audit_config.get(
+                    "max_service_threads_per_region", DEFAULT_MAX_WORKERS_PER_REGION
+                ),
+            )
+            _provider_thread_pools[provider] = thread_pool
+        return thread_pool
+
+
+def register_throttling_handler(
+    client, thread_pool: AWSThreadPool, service: str
+) -> None:
+    """register_throttling_handler makes the thread pool back off the service in the client's region when botocore gets a throttling error"""
+    region = client.meta.region_name
+
+    def handle_needs_retry(response=None, **kwargs):
+        if response:
+            error_code = response[1].get("Error", {}).get("Code")
+            if error_code in THROTTLING_ERROR_CODES:
+                thread_pool.throttled(service, region)
+        # Let botocore decide whether to retry the request
+        return None
+
+    client.meta.events.register(
+        "needs-retry",
+        handle_needs_retry,
+        unique_id=f"prowler-thread-pool-{service}-{region}",
+    )
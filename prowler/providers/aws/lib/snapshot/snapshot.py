@@ -0,0 +1,350 @@
+import gzip
+import io
+import os
+import pickle
+import sys
+import types
+from datetime import datetime
+from importlib import import_module
+
+from colorama import Style
+
+from prowler.config.config import (
+    default_config_file_path,
+    get_default_mute_file_path,
+    load_and_validate_config_file,
+    prowler_version,
+)
+from prowler.lib.logger import logger
+from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.mutelist.mutelist import AWSMutelist
+from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.lib.service.thread_pool import get_provider_thread_pool
+from prowler.providers.aws.models import AWSSession
+from prowler.providers.common.provider import Provider
+
+# Bump it every time the format of the snapshots changes
+SNAPSHOT_VERSION = 1
+SERVICES_MODULE_PREFIX = "prowler.providers.aws.services."
+# Attributes bound to the live session, they are rebuilt when the snapshot is replayed
+NOT_RECORDED_ATTRIBUTES = {
+    "provider",
+    "session",
+    "client",
+    "regional_clients",
+    "thread_pool",
+    "_lazy_calls",
+}
+# Classes that are not defined by Prowler but can be loaded from a snapshot, besides the builtin containers
+SNAPSHOT_ALLOWED_CLASSES = {
+    ("builtins", "bytearray"),
+    ("builtins", "complex"),
+    ("builtins", "dict"),
+    ("builtins", "frozenset"),
+    ("builtins", "list"),
+    ("builtins", "set"),
+    ("builtins", "tuple"),
+    ("collections", "OrderedDict"),
+    ("collections", "defaultdict"),
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "time"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+    ("dateutil.tz.tz", "tzlocal"),
+    ("dateutil.tz.tz", "tzoffset"),
+    ("dateutil.tz.tz", "tzutc"),
+    ("decimal", "Decimal"),
+}
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    """
+    Unpickler of the snapshots, which only loads the classes defined by Prowler and the data types
+    in SNAPSHOT_ALLOWED_CLASSES, so a snapshot cannot call any other function while it is loaded.
+
+    Since the Prowler classes can still be instantiated, only trusted snapshots must be replayed.
+    """
+
+    def find_class(self, module: str, name: str):
+        if (module, name) in SNAPSHOT_ALLOWED_CLASSES:
+            return super().find_class(module, name)
+        if module.startswith("prowler.") and "." not in name:
+            loaded_class = getattr(import_module(module), name, None)
+            if isinstance(loaded_class, type) and loaded_class.__module__ == module:
+                return loaded_class
+        raise pickle.UnpicklingError(
+            f"{module}.{name} is not allowed in a Prowler snapshot"
+        )
+
+
+class ReplayClient:
+    """
+    Client of a service replayed from a snapshot.
+
+    It keeps the region of the original client, which the checks use, but it cannot call AWS.
+    """
+
+    def __init__(self, service: str, region: str):
+        self.service = service
+        self.region = region
+        self.meta = types.SimpleNamespace(region_name=region)
+
+    def __getattr__(self, name):
+        raise RuntimeError(
+            f"{self.service.upper()} - Unable to call {name} in {self.region} while replaying a snapshot"
+        )
+
+
+def get_recorded_services() -> dict[str, AWSService]:
+    """get_recorded_services returns the AWS service clients loaded in this process by their module name"""
+    services = {}
+    for module_name, module in list(sys.modules.items()):
+        if module_name.startswith(SERVICES_MODULE_PREFIX) and module_name.endswith(
+            "_client"
+        ):
+            client_name = module_name.split(".")[-1]
+            service = getattr(module, client_name, None)
+            if isinstance(service, AWSService):
+                services[module_name] = service
+    return services
+
+
+def record_service(service: AWSService) -> dict:
+    """
+    record_service returns the state of the service, running its pending lazy discovery calls first
+    so the snapshot can be used by any check of the service.
+
+    The attributes that cannot be pickled, or loaded back by the SnapshotUnpickler, are left out and logged.
+    """
+    service.__load_lazy_attributes__()
+    state = {}
+    for attribute, value in vars(service).items():
+        if attribute in NOT_RECORDED_ATTRIBUTES:
+            continue
+        try:
+            SnapshotUnpickler(
+                io.BytesIO(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            ).load()
+        except Exception as error:
+            logger.warning(
+                f"{service.service.upper()} - Unable to record {attribute} in the snapshot -- {error.__class__.__name__}: {error}"
+            )
+            continue
+        state[attribute] = value
+    return {
+        "Class": (service.__class__.__module__, service.__class__.__qualname__),
+        "Regions": (
+            list(service.regional_clients)
+            if getattr(service, "regional_clients", None) is not None
+            else None
+        ),
+        "State": state,
+    }
+
+
+def save_snapshot(provider: AwsProvider, snapshot_path: str) -> int:
+    """
+    save_snapshot writes the populated AWS service clients of the scan to a compressed file.
+
+    The file holds a header with the snapshot version, followed by the provider's identity and
+    the state of every service, so it can be replayed later without AWS credentials.
+
+    Args:
+        provider (AwsProvider): The provider used in the scan.
+        snapshot_path (str): Path of the snapshot file.
+
+    Returns:
+        int: The number of services recorded.
+    """
+    services = {
+        module_name: record_service(service)
+        for module_name, service in get_recorded_services().items()
+    }
+    header = {
+        "Version": SNAPSHOT_VERSION,
+        "ProwlerVersion": prowler_version,
+        "Provider": provider.type,
+        "Account": provider.identity.account,
+        "CreatedAt": datetime.now().isoformat(),
+    }
+    snapshot = {
+        "Identity": provider.identity,
+        "OrganizationsMetadata": provider.organizations_metadata,
+        "AuditResources": provider.audit_resources,
+        "ScanUnusedServices": provider.scan_unused_services,
+        "EnabledRegions": provider._enabled_regions,
+        "Services": services,
+    }
+    directory = os.path.dirname(os.path.abspath(snapshot_path))
+    os.makedirs(directory, exist_ok=True)
+    temporary_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        with gzip.open(temporary_path, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(temporary_path, 0o600)
+        os.replace(temporary_path, snapshot_path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    logger.info(f"Recorded {len(services)} AWS services in {snapshot_path}")
+    return len(services)
+
+
+def load_snapshot(snapshot_path: str) -> dict:
+    """
+    load_snapshot returns the content of the snapshot file along with its header.
+
+    Snapshots are pickled Python objects, so only the ones recorded by a trusted scan must be loaded.
+    They are read with the SnapshotUnpickler, which rejects the classes not defined by Prowler.
+
+    Raises:
+        ValueError: If the file is not a snapshot or it has a different version.
+    """
+    with gzip.open(snapshot_path, "rb") as f:
+        header = SnapshotUnpickler(f).load()
+        if not isinstance(header, dict) or header.get("Version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"{snapshot_path} is not a Prowler snapshot with version {SNAPSHOT_VERSION}"
+            )
+        if header.get("Provider") != "aws":
+            raise ValueError(
+                f"{snapshot_path} is a snapshot of the {header.get('Provider')} provider"
+            )
+        if header.get("ProwlerVersion") != prowler_version:
+            logger.warning(
+                f"{snapshot_path} was recorded with Prowler {header.get('ProwlerVersion')}, some checks may fail to replay it"
+            )
+        snapshot = SnapshotUnpickler(f).load()
+    snapshot["Header"] = header
+    return snapshot
+
+
+class AwsReplayProvider(AwsProvider):
+    """
+    AWS provider that replays a snapshot instead of calling AWS.
+
+    It takes the identity, regions and audited resources from the snapshot, and the audit config,
+    fixer config and mutelist from the current arguments, so new checks and configurations can be
+    evaluated against a previous inventory. The recorded service clients replace the live ones.
+
+    Attributes:
+        replayed_services (set): The services recorded in the snapshot, e.g. {"ec2", "iam"}.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        config_path: str = None,
+        config_content: dict = None,
+        fixer_config: dict = {},
+        mutelist_path: str = None,
+        mutelist_content: dict = None,
+    ):
+        logger.info(f"Replaying the AWS snapshot {snapshot_path}")
+        snapshot = load_snapshot(snapshot_path)
+
+        self._session = AWSSession(
+            current_session=None, original_session=None, session_config=None
+        )
+        self._identity = snapshot["Identity"]
+        self._organizations_metadata = snapshot["OrganizationsMetadata"]
+        self._audit_resources = snapshot["AuditResources"]
+        self._scan_unused_services = snapshot["ScanUnusedServices"]
+        self._enabled_regions = snapshot["EnabledRegions"]
+        self._response_cache = None
+
+        # Audit Config
+        if config_content:
+            self._audit_config = config_content
+        else:
+            if not config_path:
+                config_path = default_config_file_path
+            self._audit_config = load_and_validate_config_file(self._type, config_path)
+
+        # Fixer Config
+        self._fixer_config = fixer_config
+
+        # Mutelist, without a session it can only be read from a local file or its content
+        if mutelist_content:
+            self._mutelist = AWSMutelist(
+                mutelist_content=mutelist_content,
+                aws_account_id=self._identity.account,
+            )
+        else:
+            if not mutelist_path:
+                mutelist_path = get_default_mute_file_path(self.type)
+            self._mutelist = AWSMutelist(
+                mutelist_path=mutelist_path,
+                aws_account_id=self._identity.account,
+            )
+
+        self.replayed_services = set()
+        for module_name, recorded_service in snapshot["Services"].items():
+            self.replay_service(module_name, recorded_service)
+
+        Provider.set_global_provider(self)
+
+    def print_credentials(self):
+        # The identity comes from the snapshot, no credentials are used
+        print(
+            f"{Style.BRIGHT}Replaying the AWS snapshot recorded with the credentials below:{Style.RESET_ALL}"
+        )
+        super().print_credentials()
+
+    def replay_service(self, module_name: str, recorded_service: dict) -> AWSService:
+        """
+        replay_service restores the service client and installs it as the module the checks import it from,
+        so they get the recorded resources without creating a live client.
+
+        Raises:
+            ValueError: If the recorded service is not an AWS service client of Prowler.
+        """
+        class_module, class_name = recorded_service["Class"]
+        if not (
+            module_name.startswith(SERVICES_MODULE_PREFIX)
+            and module_name.endswith("_client")
+            and class_module.startswith(SERVICES_MODULE_PREFIX)
+        ):
+            raise ValueError(f"{module_name} is not an AWS service client of Prowler")
+        service_class = getattr(import_module(class_module), class_name, None)
+        if not (
+            isinstance(service_class, type) and issubclass(service_class, AWSService)
+        ):
+            raise ValueError(
+                f"{class_module}.{class_name} is not an AWS service of Prowler"
+            )
+        service = service_class.__new__(service_class)
+        service.__dict__.update(recorded_service["State"])
+        service.provider = self
+        service.session = None
+        service.audit_config = self._audit_config
+        service.fixer_config = self._fixer_config
+        service.client = ReplayClient(service.service, service.region)
+        if recorded_service["Regions"] is not None:
+            service.regional_clients = {
+                region: ReplayClient(service.service, region)
+                for region in recorded_service["Regions"]
+            }
+        service.thread_pool = get_provider_thread_pool(self)
+
+        client_name = module_name.split(".")[-1]
+        module = types.ModuleType(module_name)
+        setattr(module, client_name, service)
+        sys.modules[module_name] = module
+        service_name = module_name[len(SERVICES_MODULE_PREFIX) :].split(".")[0]
+        self.replayed_services.add(service_name)
+        return service
+
+    def get_replayed_checks(self, checks_to_execute: set) -> set:
+        """get_replayed_checks returns the checks of the services recorded in the snapshot"""
+        checks = set()
+        for check in checks_to_execute:
+            if check.split("_")[0] in self.replayed_services:
+                checks.add(check)
+            else:
+                logger.warning(
+                    f"{check} cannot be replayed since its service is not in the snapshot"
+                )
+        return checks
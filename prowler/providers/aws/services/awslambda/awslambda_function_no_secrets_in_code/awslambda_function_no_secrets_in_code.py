@@ -1,65 +1,72 @@
-import os
-import tempfile
-
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
+from prowler.providers.aws.services.awslambda.lib.code_secrets import (
+    LambdaCodeSecretsCache,
+    scan_code_secrets,
+)
 
 
 class awslambda_function_no_secrets_in_code(Check):
     def execute(self):
         findings = []
         if awslambda_client.functions:
-            secrets_ignore_patterns = awslambda_client.audit_config.get(
-                "secrets_ignore_patterns", []
+            secrets_scanner = SecretsScanner(
+                detect_secrets_plugins=awslambda_client.audit_config.get(
+                    "detect_secrets_plugins",
+                ),
+                excluded_secrets=awslambda_client.audit_config.get(
+                    "secrets_ignore_patterns", []
+                ),
             )
-            for function, function_code in awslambda_client._get_function_code():
-                if function_code:
-                    report = Check_Report_AWS(
-                        metadata=self.metadata(), resource=function
-                    )
-
-                    report.status = "PASS"
-                    report.status_extended = (
-                        f"No secrets found in Lambda function {function.name} code."
-                    )
-                    with tempfile.TemporaryDirectory() as tmp_dir_name:
-                        function_code.code_zip.extractall(tmp_dir_name)
-                        # List all files
-                        files_in_zip = next(os.walk(tmp_dir_name))[2]
-                        secrets_findings = []
-                        for file in files_in_zip:
-                            detect_secrets_output = detect_secrets_scan(
-                                file=f"{tmp_dir_name}/{file}",
-                                excluded_secrets=secrets_ignore_patterns,
-                                detect_secrets_plugins=awslambda_client.audit_config.get(
-                                    "detect_secrets_plugins",
-                                ),
-                            )
-                            if detect_secrets_output:
-                                for (
-                                    secret
-                                ) in (
-                                    detect_secrets_output
-                                ):  # Appears that only 1 file is being scanned at a time, so could rework this
-                                    output_file_name = secret["filename"].replace(
-                                        f"{tmp_dir_name}/", ""
-                                    )
-                                    secrets_string = ", ".join(
-                                        [
-                                            f"{secret['type']} on line {secret['line_number']}"
-                                            for secret in detect_secrets_output
-                                        ]
-                                    )
-                                    secrets_findings.append(
-                                        f"{output_file_name}: {secrets_string}"
-                                    )
+            code_secrets_cache = None
+            if awslambda_client.audit_config.get("lambda_code_secrets_cache", True):
+                code_secrets_cache = LambdaCodeSecretsCache(secrets_scanner.settings)
 
-                        if secrets_findings:
-                            final_output_string = "; ".join(secrets_findings)
-                            report.status = "FAIL"
-                            report.status_extended = f"Potential {'secrets' if len(secrets_findings) > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
+            # The functions whose code was already scanned are not downloaded again
+            functions_to_scan = []
+            for function in awslambda_client.functions.values():
+                code_secrets = None
+                if code_secrets_cache and function.code_sha256:
+                    code_secrets = code_secrets_cache.get(function.code_sha256)
+                if code_secrets is None:
+                    functions_to_scan.append(function)
+                else:
+                    findings.append(self._get_report(function, code_secrets))
 
-                    findings.append(report)
+            for function, function_code in awslambda_client._get_function_code(
+                functions_to_scan
+            ):
+                if function_code:
+                    code_secrets = scan_code_secrets(
+                        function_code.code_zip, secrets_scanner
+                    )
+                    if code_secrets_cache and function.code_sha256:
+                        code_secrets_cache.put(function.code_sha256, code_secrets)
+                    findings.append(self._get_report(function, code_secrets))
 
         return findings
+
+    def _get_report(self, function, code_secrets: dict) -> Check_Report_AWS:
+        report = Check_Report_AWS(metadata=self.metadata(), resource=function)
+        report.status = "PASS"
+        report.status_extended = (
+            f"No secrets found in Lambda function {function.name} code."
+        )
+        if code_secrets:
+            secrets_count = sum(len(secrets) for secrets in code_secrets.values())
+            final_output_string = "; ".join(
+                [
+                    f"{filename}: "
+                    + ", ".join(
+                        [
+                            f"{secret['type']} on line {secret['line_number']}"
+                            for secret in secrets
+                        ]
+                    )
+                    for filename, secrets in code_secrets.items()
+                ]
+            )
+            report.status = "FAIL"
+            report.status_extended = f"Potential {'secrets' if secrets_count > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
+        return report
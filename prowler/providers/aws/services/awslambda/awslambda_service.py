@@ -1,7 +1,8 @@
 import io
 import json
+import tempfile
 import zipfile
-from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED, wait
 from enum import Enum
 from typing import Any, Optional
 
@@ -13,6 +14,13 @@ from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
 
+# Maximum number of deployment packages being downloaded or waiting to be scanned at the same time
+LAMBDA_CODE_MAX_FETCHES_IN_FLIGHT = 16
+LAMBDA_CODE_DEFAULT_MAX_SIZE_MB = 250
+# The deployment packages are kept in memory up to this size, and in a temporary file beyond it
+LAMBDA_CODE_SPOOL_SIZE = 10 * 1024 * 1024
+LAMBDA_CODE_CHUNK_SIZE = 1024 * 1024
+
 
 class Lambda(AWSService):
     def __init__(self, provider):
@@ -46,6 +54,8 @@ class Lambda(AWSService):
                             vpc_id=vpc_config.get("VpcId"),
                             subnet_ids=set(vpc_config.get("SubnetIds", [])),
                             region=regional_client.region,
+                            code_sha256=function.get("CodeSha256"),
+                            code_size=function.get("CodeSize"),
                         )
                         if "Runtime" in function:
                             self.functions[lambda_arn].runtime = function["Runtime"]
@@ -62,28 +72,73 @@ class Lambda(AWSService):
                 f" {error}"
             )
 
-    def _get_function_code(self):
+    def _get_function_code(self, functions: list = None):
+        """
+        _get_function_code yields every function along with its code as soon as it is downloaded.
+
+        Args:
+            functions (list): The functions to get the code from, all of them by default.
+
+        Yields:
+            tuple: The function and its LambdaCode.
+        """
         logger.info("Lambda - Getting Function Code...")
-        # Use a thread pool handle the queueing and execution of the _fetch_function_code tasks, up to max_workers tasks concurrently.
-        lambda_functions_to_fetch = {
-            self.thread_pool.submit(
-                self._fetch_function_code, function.name, function.region
-            ): function
-            for function in self.functions.values()
-        }
-
-        for fetched_lambda_code in as_completed(lambda_functions_to_fetch):
-            function = lambda_functions_to_fetch[fetched_lambda_code]
-            try:
-                function_code = fetched_lambda_code.result()
-                if function_code:
-                    yield function, function_code
-            except Exception as error:
-                logger.error(
-                    f"{function.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        if functions is None:
+            functions = self.functions.values()
+        max_code_size = (
+            self.audit_config.get(
+                "lambda_code_max_size_mb", LAMBDA_CODE_DEFAULT_MAX_SIZE_MB
+            )
+            * 1024
+            * 1024
+        )
+        functions_to_fetch = iter(functions)
+        lambda_functions_to_fetch = {}
+        while True:
+            # Use the thread pool to download the code, keeping a bounded number of packages in flight
+            # so the downloaded ones are yielded and released while the rest are being fetched
+            for function in functions_to_fetch:
+                if function.code_size and function.code_size > max_code_size:
+                    logger.warning(
+                        f"{function.region} -- Skipping the code of the Lambda function {function.name}, its size of {function.code_size} bytes is over {max_code_size} bytes."
+                    )
+                    continue
+                lambda_functions_to_fetch[
+                    self.thread_pool.submit_to_region(
+                        self.service,
+                        function.region,
+                        "LAMBDA - Fetch Function Code",
+                        self._fetch_function_code,
+                        function.name,
+                        function.region,
+                        max_code_size,
+                    )
+                ] = function
+                if len(lambda_functions_to_fetch) >= LAMBDA_CODE_MAX_FETCHES_IN_FLIGHT:
+                    break
+            if not lambda_functions_to_fetch:
+                break
 
-    def _fetch_function_code(self, function_name, function_region):
+            fetched_lambda_codes, _ = wait(
+                lambda_functions_to_fetch, return_when=FIRST_COMPLETED
+            )
+            for fetched_lambda_code in fetched_lambda_codes:
+                function = lambda_functions_to_fetch.pop(fetched_lambda_code)
+                try:
+                    function_code = fetched_lambda_code.result()
+                    if function_code:
+                        yield function, function_code
+                except Exception as error:
+                    logger.error(
+                        f"{function.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+
+    def _fetch_function_code(
+        self,
+        function_name,
+        function_region,
+        max_code_size: int = LAMBDA_CODE_DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+    ):
         try:
             regional_client = self.regional_clients[function_region]
             function_information = regional_client.get_function(
@@ -91,10 +146,38 @@ class Lambda(AWSService):
             )
             if "Location" in function_information["Code"]:
                 code_location_uri = function_information["Code"]["Location"]
-                raw_code_zip = requests.get(code_location_uri).content
+                # Stream the deployment package, so only the small ones are kept in memory.
+                # SpooledTemporaryFile is not seekable for ZipFile before Python 3.11.
+                code_file = io.BytesIO()
+                code_size = 0
+                response = requests.get(code_location_uri, stream=True)
+                try:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(
+                        chunk_size=LAMBDA_CODE_CHUNK_SIZE
+                    ):
+                        code_size += len(chunk)
+                        if code_size > max_code_size:
+                            logger.warning(
+                                f"{function_region} -- Skipping the code of the Lambda function {function_name}, its size is over {max_code_size} bytes."
+                            )
+                            code_file.close()
+                            return None
+                        if (
+                            isinstance(code_file, io.BytesIO)
+                            and code_size > LAMBDA_CODE_SPOOL_SIZE
+                        ):
+                            spooled_code = code_file
+                            code_file = tempfile.TemporaryFile()
+                            code_file.write(spooled_code.getbuffer())
+                            spooled_code.close()
+                        code_file.write(chunk)
+                finally:
+                    response.close()
+                code_file.seek(0)
                 return LambdaCode(
                     location=code_location_uri,
-                    code_zip=zipfile.ZipFile(io.BytesIO(raw_code_zip)),
+                    code_zip=zipfile.ZipFile(code_file),
                 )
         except Exception as error:
             logger.error(
@@ -201,6 +284,8 @@ class Function(BaseModel):
     region: str
     policy: dict = {}
     code: LambdaCode = None
+    code_sha256: Optional[str] = None
+    code_size: Optional[int] = None
     url_config: URLConfig = None
     vpc_id: Optional[str] = None
     subnet_ids: Optional[set] = None
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+from typing import Optional
+from zipfile import ZipFile
+
+from prowler.config.config import default_cache_directory, prowler_version
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import SecretsScanner
+
+# Bump it every time the format of the cached results changes
+LAMBDA_CODE_SECRETS_CACHE_VERSION = 1
+DEFAULT_LAMBDA_CODE_SECRETS_CACHE_DIRECTORY = (
+    f"{default_cache_directory}/lambda_code_secrets"
+)
+# The files of a deployment package are read and scanned in batches of up to this size
+LAMBDA_CODE_SCAN_BATCH_SIZE = 8 * 1024 * 1024
+
+
+def scan_code_secrets(code_zip: ZipFile, secrets_scanner: SecretsScanner) -> dict:
+    """
+    scan_code_secrets scans the files at the root of the deployment package of a Lambda function for secrets.
+
+    The files are read straight from the zip, without extracting it, and scanned in batches of up to
+    LAMBDA_CODE_SCAN_BATCH_SIZE bytes, so only the files of a batch are kept in memory.
+
+    Args:
+        code_zip (ZipFile): The deployment package of the function.
+        secrets_scanner (SecretsScanner): The scanner to use.
+
+    Returns:
+        dict: The type and line number of the secrets found, by filename.
+    """
+    code_secrets = {}
+    files = {}
+    files_size = 0
+    for member in code_zip.infolist():
+        if member.is_dir() or "/" in member.filename:
+            continue
+        files[member.filename] = code_zip.read(member)
+        files_size += member.file_size
+        if files_size >= LAMBDA_CODE_SCAN_BATCH_SIZE:
+            code_secrets.update(secrets_scanner.scan_files(files))
+            files = {}
+            files_size = 0
+    if files:
+        code_secrets.update(secrets_scanner.scan_files(files))
+    return {
+        filename: [
+            {"type": secret["type"], "line_number": secret["line_number"]}
+            for secret in secrets
+        ]
+        for filename, secrets in code_secrets.items()
+    }
+
+
+class LambdaCodeSecretsCache:
+    """
+    On-disk cache of the secrets found in the code of the Lambda functions.
+
+    The results are stored in a JSON file per deployment package, keyed by its SHA256 along with the settings
+    of the scan and the Prowler version, so the functions whose code has not changed are neither downloaded
+    nor scanned again. Only the type and line number of the secrets are stored, never their values.
+
+    Attributes:
+        cache_dir (str): Directory where the results are stored.
+    """
+
+    def __init__(self, settings: dict, cache_dir: str = None):
+        self.cache_dir = cache_dir or DEFAULT_LAMBDA_CODE_SECRETS_CACHE_DIRECTORY
+        self._settings_hash = hashlib.sha256(
+            json.dumps(settings, sort_keys=True).encode()
+        ).hexdigest()
+
+    def _get_path(self, code_sha256: str) -> str:
+        key = hashlib.sha256(
+            f"{LAMBDA_CODE_SECRETS_CACHE_VERSION}:{prowler_version}:{self._settings_hash}:{code_sha256}".encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, code_sha256: str) -> Optional[dict]:
+        """get returns the secrets found in the code with the given SHA256, or None if it was not scanned yet"""
+        path = self._get_path(code_sha256)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)["Secrets"]
+        except Exception as error:
+            logger.debug(
+                f"Unable to read the Lambda code secrets cache {path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+    def put(self, code_sha256: str, secrets: dict) -> None:
+        """put stores the secrets found in the code with the given SHA256, atomically so concurrent processes never read a partial file"""
+        path = self._get_path(code_sha256)
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w") as f:
+                json.dump({"Secrets": secrets}, f, separators=(",", ":"))
+            os.replace(temporary_path, path)
+        except Exception as error:
+            # The cache is just an optimisation, the check works without it
+            logger.debug(
+                f"Unable to save the Lambda code secrets cache {path} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
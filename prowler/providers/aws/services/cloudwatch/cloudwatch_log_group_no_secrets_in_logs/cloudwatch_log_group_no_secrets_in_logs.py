@@ -1,7 +1,7 @@
 from json import dumps, loads
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     convert_to_cloudwatch_timestamp_format,
 )
@@ -15,6 +15,17 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
             secrets_ignore_patterns = logs_client.audit_config.get(
                 "secrets_ignore_patterns", []
             )
+            secrets_scanner = SecretsScanner(
+                detect_secrets_plugins=logs_client.audit_config.get(
+                    "detect_secrets_plugins",
+                ),
+                excluded_secrets=secrets_ignore_patterns,
+            )
+            events_secrets_scanner = SecretsScanner(
+                detect_secrets_plugins=logs_client.audit_config.get(
+                    "detect_secrets_plugins"
+                ),
+            )
             for log_group in logs_client.log_groups.values():
                 report = Check_Report_AWS(metadata=self.metadata(), resource=log_group)
                 report.status = "PASS"
@@ -23,68 +34,77 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
                 )
                 log_group_secrets = []
                 if log_group.log_streams:
-                    for log_stream_name in log_group.log_streams:
-                        log_stream_secrets = {}
-                        log_stream_data = "\n".join(
-                            [
-                                dumps(event["message"])
-                                for event in log_group.log_streams[log_stream_name]
-                            ]
-                        )
-                        log_stream_secrets_output = detect_secrets_scan(
-                            data=log_stream_data,
-                            excluded_secrets=secrets_ignore_patterns,
-                            detect_secrets_plugins=logs_client.audit_config.get(
-                                "detect_secrets_plugins",
-                            ),
+                    # All the log streams of the log group are scanned at once
+                    log_streams_secrets_output = secrets_scanner.scan_batch(
+                        {
+                            log_stream_name: "\n".join(
+                                [dumps(event["message"]) for event in log_stream]
+                            )
+                            for log_stream_name, log_stream in log_group.log_streams.items()
+                        }
+                    )
+                    log_streams_secrets = {}
+                    # Events to rescan by log stream and line number
+                    flagged_events_data = {}
+                    for (
+                        log_stream_name,
+                        log_stream_secrets_output,
+                    ) in log_streams_secrets_output.items():
+                        log_stream_secrets = log_streams_secrets.setdefault(
+                            log_stream_name, {}
                         )
+                        for secret in log_stream_secrets_output:
+                            flagged_event = log_group.log_streams[log_stream_name][
+                                secret["line_number"] - 1
+                            ]
+                            cloudwatch_timestamp = (
+                                convert_to_cloudwatch_timestamp_format(
+                                    flagged_event["timestamp"]
+                                )
+                            )
+                            if cloudwatch_timestamp not in log_stream_secrets.keys():
+                                log_stream_secrets[cloudwatch_timestamp] = SecretsDict()
 
-                        if log_stream_secrets_output:
-                            for secret in log_stream_secrets_output:
-                                flagged_event = log_group.log_streams[log_stream_name][
-                                    secret["line_number"] - 1
-                                ]
-                                cloudwatch_timestamp = (
-                                    convert_to_cloudwatch_timestamp_format(
-                                        flagged_event["timestamp"]
-                                    )
+                            try:
+                                log_event_data = dumps(
+                                    loads(flagged_event["message"]), indent=2
+                                )
+                            except Exception:
+                                log_event_data = dumps(
+                                    flagged_event["message"], indent=2
                                 )
-                                if (
-                                    cloudwatch_timestamp
-                                    not in log_stream_secrets.keys()
-                                ):
-                                    log_stream_secrets[cloudwatch_timestamp] = (
-                                        SecretsDict()
+                            if len(log_event_data.split("\n")) > 1:
+                                # Can get more informative output if there is more than 1 line.
+                                # Will rescan just this event to get the type of secret and the line number
+                                flagged_events_data[
+                                    (
+                                        log_stream_name,
+                                        secret["line_number"],
+                                        cloudwatch_timestamp,
                                     )
+                                ] = log_event_data
+                            else:
+                                log_stream_secrets[cloudwatch_timestamp].add_secret(
+                                    1, secret["type"]
+                                )
 
-                                try:
-                                    log_event_data = dumps(
-                                        loads(flagged_event["message"]), indent=2
-                                    )
-                                except Exception:
-                                    log_event_data = dumps(
-                                        flagged_event["message"], indent=2
-                                    )
-                                if len(log_event_data.split("\n")) > 1:
-                                    # Can get more informative output if there is more than 1 line.
-                                    # Will rescan just this event to get the type of secret and the line number
-                                    event_detect_secrets_output = detect_secrets_scan(
-                                        data=log_event_data,
-                                        detect_secrets_plugins=logs_client.audit_config.get(
-                                            "detect_secrets_plugins"
-                                        ),
-                                    )
-                                    if event_detect_secrets_output:
-                                        for secret in event_detect_secrets_output:
-                                            log_stream_secrets[
-                                                cloudwatch_timestamp
-                                            ].add_secret(
-                                                secret["line_number"], secret["type"]
-                                            )
-                                else:
-                                    log_stream_secrets[cloudwatch_timestamp].add_secret(
-                                        1, secret["type"]
-                                    )
+                    # All the flagged events of the log group are rescanned at once
+                    for (
+                        log_stream_name,
+                        _,
+                        cloudwatch_timestamp,
+                    ), event_detect_secrets_output in events_secrets_scanner.scan_batch(
+                        flagged_events_data
+                    ).items():
+                        for secret in event_detect_secrets_output:
+                            log_streams_secrets[log_stream_name][
+                                cloudwatch_timestamp
+                            ].add_secret(secret["line_number"], secret["type"])
+
+                    for (
+                        log_stream_name,
+                        log_stream_secrets,
+                    ) in log_streams_secrets.items():
                         if log_stream_secrets:
                             secrets_string = "; ".join(
                                 [
@@ -14,9 +14,14 @@ class Codebuild(AWSService):
         super().__init__(__class__.__name__, provider)
         self.projects = {}
         self.__threading_call__(self._list_projects)
-        self.__threading_call__(self._list_builds_for_project, self.projects.values())
-        self.__threading_call__(self._batch_get_builds, self.projects.values())
-        self.__threading_call__(self._batch_get_projects, self.projects.values())
+        self.__threading_call_chain__(
+            [
+                self._list_builds_for_project,
+                self._batch_get_builds,
+                self._batch_get_projects,
+            ],
+            self.projects.values(),
+        )
         self.report_groups = {}
         self.__threading_call__(self._list_report_groups)
         self.__threading_call__(
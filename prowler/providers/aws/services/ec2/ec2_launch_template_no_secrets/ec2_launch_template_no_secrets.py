@@ -4,7 +4,7 @@ from base64 import b64decode
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import SecretsScanner
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
@@ -14,10 +14,17 @@ class ec2_launch_template_no_secrets(Check):
         secrets_ignore_patterns = ec2_client.audit_config.get(
             "secrets_ignore_patterns", []
         )
+        secrets_scanner = SecretsScanner(
+            detect_secrets_plugins=ec2_client.audit_config.get(
+                "detect_secrets_plugins"
+            ),
+            excluded_secrets=secrets_ignore_patterns,
+        )
         for template in ec2_client.launch_templates:
             report = Check_Report_AWS(metadata=self.metadata(), resource=template)
 
             versions_with_secrets = []
+            versions_user_data = {}
 
             for version in template.versions:
                 if not version.template_data.user_data:
@@ -42,24 +49,20 @@ class ec2_launch_template_no_secrets(Check):
                     )
                     continue
 
-                version_secrets = detect_secrets_scan(
-                    data=user_data,
-                    excluded_secrets=secrets_ignore_patterns,
-                    detect_secrets_plugins=ec2_client.audit_config.get(
-                        "detect_secrets_plugins"
-                    ),
-                )
+                versions_user_data[version.version_number] = user_data
 
-                if version_secrets:
-                    secrets_string = ", ".join(
-                        [
-                            f"{secret['type']} on line {secret['line_number']}"
-                            for secret in version_secrets
-                        ]
-                    )
-                    versions_with_secrets.append(
-                        f"Version {version.version_number}: {secrets_string}"
-                    )
+            # All the versions of the template are scanned at once
+            versions_secrets = secrets_scanner.scan_batch(versions_user_data)
+            for version_number, version_secrets in versions_secrets.items():
+                secrets_string = ", ".join(
+                    [
+                        f"{secret['type']} on line {secret['line_number']}"
+                        for secret in version_secrets
+                    ]
+                )
+                versions_with_secrets.append(
+                    f"Version {version_number}: {secrets_string}"
+                )
 
             if len(versions_with_secrets) > 0:
                 report.status = "FAIL"
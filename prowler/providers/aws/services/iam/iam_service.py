@@ -46,36 +46,65 @@ class IAM(AWSService):
         self.mfa_arn_template = (
             f"arn:{self.audited_partition}:iam::{self.audited_account}:mfa"
         )
-        self.users = self._get_users()
-        self.roles = self._get_roles()
-        self.account_summary = self._get_account_summary()
-        self.virtual_mfa_devices = self._list_virtual_mfa_devices()
-        self.credential_report = self._get_credential_report()
-        self.groups = self._get_groups()
-        self._get_group_users()
-        self._list_attached_group_policies()
-        self._list_attached_user_policies()
-        self._list_attached_role_policies()
-        self._list_mfa_devices()
-        self.password_policy = self._get_password_policy()
+        # The resources are discovered the first time a check reads them
+        # Users, roles, groups and policies are discovered together since the inline policies are stored in all of them
+        self.__lazy_load__(
+            self._discover_identities, "users", "roles", "groups", "policies"
+        )
+        self.__lazy_attribute__("account_summary", self._get_account_summary)
+        self.__lazy_attribute__("virtual_mfa_devices", self._list_virtual_mfa_devices)
+        self.__lazy_attribute__("credential_report", self._get_credential_report)
+        self.__lazy_attribute__("password_policy", self._get_password_policy)
         support_policy_arn = (
             f"arn:{self.audited_partition}:iam::aws:policy/AWSSupportAccess"
         )
-        self.entities_role_attached_to_support_policy = (
-            self._list_entities_role_for_policy(support_policy_arn)
+        self.__lazy_attribute__(
+            "entities_role_attached_to_support_policy",
+            self._list_entities_role_for_policy,
+            support_policy_arn,
         )
         securityaudit_policy_arn = (
             f"arn:{self.audited_partition}:iam::aws:policy/SecurityAudit"
         )
-        self.entities_role_attached_to_securityaudit_policy = (
-            self._list_entities_role_for_policy(securityaudit_policy_arn)
+        self.__lazy_attribute__(
+            "entities_role_attached_to_securityaudit_policy",
+            self._list_entities_role_for_policy,
+            securityaudit_policy_arn,
         )
         cloudshell_admin_policy_arn = (
             f"arn:{self.audited_partition}:iam::aws:policy/AWSCloudShellFullAccess"
         )
-        self.entities_attached_to_cloudshell_policy = self._list_entities_for_policy(
-            cloudshell_admin_policy_arn
+        self.__lazy_attribute__(
+            "entities_attached_to_cloudshell_policy",
+            self._list_entities_for_policy,
+            cloudshell_admin_policy_arn,
+        )
+        self.__lazy_load__(
+            self._discover_service_specific_credentials, "service_specific_credentials"
+        )
+        self.__lazy_load__(self._discover_saml_providers, "saml_providers")
+        self.__lazy_load__(self._discover_server_certificates, "server_certificates")
+        self.__lazy_load__(self._discover_access_keys_metadata, "access_keys_metadata")
+        self.__lazy_load__(
+            self._discover_last_accessed_services, "last_accessed_services"
         )
+        self.__lazy_load__(
+            self._discover_user_temporary_credentials_usage,
+            "user_temporary_credentials_usage",
+        )
+        self.__lazy_load__(
+            self._discover_organization_features, "organization_features"
+        )
+
+    def _discover_identities(self):
+        self.users = self._get_users()
+        self.roles = self._get_roles()
+        self.groups = self._get_groups()
+        self._get_group_users()
+        self._list_attached_group_policies()
+        self._list_attached_user_policies()
+        self._list_attached_role_policies()
+        self._list_mfa_devices()
         # List both Customer (attached and unattached) and AWS Managed (only attached) policies
         self.policies = {}
         self.policies.update(self._list_policies("AWS"))
@@ -84,28 +113,48 @@ class IAM(AWSService):
         self._list_inline_user_policies()
         self._list_inline_group_policies()
         self._list_inline_role_policies()
+        # List missing tags of the users, roles and custom policies at once
+        self.__threading_call__(
+            self._list_tags,
+            [
+                *(self.users or []),
+                *(self.roles or []),
+                *(
+                    policy
+                    for policy in self.policies.values()
+                    if policy.type == "Custom"
+                ),
+            ],
+        )
+
+    def _discover_service_specific_credentials(self):
         self.service_specific_credentials = []
         self._list_service_specific_credentials()
+
+    def _discover_saml_providers(self):
         self.saml_providers = self._list_saml_providers()
+        if self.saml_providers is not None:
+            self.__threading_call__(self._list_tags, self.saml_providers.values())
+
+    def _discover_server_certificates(self):
         self.server_certificates = self._list_server_certificates()
+        self.__threading_call__(self._list_tags, self.server_certificates)
+
+    def _discover_access_keys_metadata(self):
         self.access_keys_metadata = {}
         self._get_access_keys_metadata()
+
+    def _discover_last_accessed_services(self):
         self.last_accessed_services = {}
         self._get_last_accessed_services()
+
+    def _discover_user_temporary_credentials_usage(self):
         self.user_temporary_credentials_usage = {}
         self._get_user_temporary_credentials_usage()
+
+    def _discover_organization_features(self):
         self.organization_features = []
         self._list_organizations_features()
-        # List missing tags
-        self.__threading_call__(self._list_tags, self.users)
-        self.__threading_call__(self._list_tags, self.roles)
-        self.__threading_call__(
-            self._list_tags,
-            [policy for policy in self.policies.values() if policy.type == "Custom"],
-        )
-        self.__threading_call__(self._list_tags, self.server_certificates)
-        if self.saml_providers is not None:
-            self.__threading_call__(self._list_tags, self.saml_providers.values())
 
     def _get_client(self):
         return self.client
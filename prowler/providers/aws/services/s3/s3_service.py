@@ -17,23 +17,23 @@ class S3(AWSService):
         self.regions_with_buckets = []
         self.buckets = {}
         self._list_buckets(provider)
-        self.__threading_call__(self._get_bucket_versioning, self.buckets.values())
-        self.__threading_call__(self._get_bucket_logging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_policy, self.buckets.values())
-        self.__threading_call__(self._get_bucket_acl, self.buckets.values())
-        self.__threading_call__(self._get_public_access_block, self.buckets.values())
-        self.__threading_call__(self._get_bucket_encryption, self.buckets.values())
-        self.__threading_call__(
-            self._get_bucket_ownership_controls, self.buckets.values()
-        )
-        self.__threading_call__(
-            self._get_object_lock_configuration, self.buckets.values()
-        )
-        self.__threading_call__(self._get_bucket_tagging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_replication, self.buckets.values())
-        self.__threading_call__(self._get_bucket_lifecycle, self.buckets.values())
-        self.__threading_call__(
-            self._get_bucket_notification_configuration, self.buckets.values()
+        # Every bucket runs all its calls in a row, without waiting for the rest of buckets between calls
+        self.__threading_call_chain__(
+            [
+                self._get_bucket_versioning,
+                self._get_bucket_logging,
+                self._get_bucket_policy,
+                self._get_bucket_acl,
+                self._get_public_access_block,
+                self._get_bucket_encryption,
+                self._get_bucket_ownership_controls,
+                self._get_object_lock_configuration,
+                self._get_bucket_tagging,
+                self._get_bucket_replication,
+                self._get_bucket_lifecycle,
+                self._get_bucket_notification_configuration,
+            ],
+            self.buckets.values(),
         )
 
     def _list_buckets(self, provider):
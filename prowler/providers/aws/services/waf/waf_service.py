@@ -25,9 +25,9 @@ class WAF(AWSService):
                 self._list_activated_rules_in_rule_group, self.rule_groups.values()
             )
             self._list_web_acls()
-            self.__threading_call__(self._get_web_acl, self.web_acls.values())
-            self.__threading_call__(
-                self._get_logging_configuration, self.web_acls.values()
+            self.__threading_call_chain__(
+                [self._get_web_acl, self._get_logging_configuration],
+                self.web_acls.values(),
             )
 
     def _list_rules(self):
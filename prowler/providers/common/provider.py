@@ -159,7 +159,20 @@ class Provider(ABC):
             )
 
             if not isinstance(Provider._global, provider_class):
-                if "aws" in provider_class_name.lower():
+                if "aws" in provider_class_name.lower() and getattr(
+                    arguments, "replay", None
+                ):
+                    from prowler.providers.aws.lib.snapshot.snapshot import (
+                        AwsReplayProvider,
+                    )
+
+                    AwsReplayProvider(
+                        snapshot_path=arguments.replay,
+                        config_path=arguments.config_file,
+                        mutelist_path=arguments.mutelist_file,
+                        fixer_config=fixer_config,
+                    )
+                elif "aws" in provider_class_name.lower():
                     provider_class(
                         retries_max_attempts=arguments.aws_retries_max_attempts,
                         role_arn=arguments.role,
@@ -176,6 +189,8 @@ class Provider(ABC):
                         config_path=arguments.config_file,
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
+                        response_cache_dir=arguments.cache_dir,
+                        response_cache_ttl=arguments.cache_ttl,
                     )
                 elif "azure" in provider_class_name.lower():
                     provider_class(
@@ -123,6 +123,8 @@ config_aws = {
         "ruby2.7",
     ],
     "lambda_min_azs": 2,
+    "lambda_code_max_size_mb": 250,
+    "lambda_code_secrets_cache": True,
     "organizations_enabled_regions": [],
     "organizations_trusted_delegated_administrators": [],
     "ecr_repository_vulnerability_minimum_severity": "MEDIUM",
@@ -1,6 +1,7 @@
 import json
 import os
 import pathlib
+import threading
 from importlib.machinery import FileFinder
 from logging import ERROR
 from pkgutil import ModuleInfo
@@ -21,6 +22,7 @@ from prowler.lib.check.check import (
     parse_checks_from_file,
     parse_checks_from_folder,
     remove_custom_checks_module,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
@@ -973,3 +975,69 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_run_checks_serial(self):
+        checks = ["s3_bucket_public", "ec2_instance_public_ip"]
+
+        results = list(run_checks(checks, lambda check_name: check_name.upper()))
+
+        assert results == [
+            ("s3_bucket_public", "S3_BUCKET_PUBLIC", None),
+            ("ec2_instance_public_ip", "EC2_INSTANCE_PUBLIC_IP", None),
+        ]
+
+    def test_run_checks_concurrent_ordered(self):
+        checks = [
+            "ec2_instance_public_ip",
+            "ec2_securitygroup_default_restrict_traffic",
+            "iam_root_mfa_enabled",
+            "s3_bucket_public",
+        ]
+        release_ec2 = threading.Event()
+
+        def check_runner(check_name):
+            # EC2 checks are blocked until any other service has finished
+            if check_name.startswith("ec2"):
+                release_ec2.wait(timeout=5)
+            else:
+                release_ec2.set()
+            return check_name
+
+        results = list(run_checks(checks, check_runner, max_workers=3))
+
+        assert [check_name for check_name, _, _ in results] == checks
+        assert all(error is None for _, _, error in results)
+
+    def test_run_checks_concurrent_unordered(self):
+        checks = ["ec2_instance_public_ip", "s3_bucket_public"]
+        s3_completed = threading.Event()
+
+        def check_runner(check_name):
+            if check_name.startswith("ec2"):
+                s3_completed.wait(timeout=5)
+            else:
+                s3_completed.set()
+            return check_name
+
+        results = list(run_checks(checks, check_runner, max_workers=2, ordered=False))
+
+        assert [check_name for check_name, _, _ in results] == [
+            "s3_bucket_public",
+            "ec2_instance_public_ip",
+        ]
+
+    def test_run_checks_concurrent_error(self):
+        checks = ["ec2_instance_public_ip", "s3_bucket_public"]
+        error = ModuleNotFoundError()
+
+        def check_runner(check_name):
+            if check_name == "s3_bucket_public":
+                raise error
+            return check_name
+
+        results = list(run_checks(checks, check_runner, max_workers=2))
+
+        assert results == [
+            ("ec2_instance_public_ip", "ec2_instance_public_ip", None),
+            ("s3_bucket_public", None, error),
+        ]
@@ -514,6 +514,24 @@ class TestCompliance:
 
         assert compliance_requirement is None
 
+    def test_get_requirements(self):
+        compliance = custom_compliance_metadata["framework1_aws"]
+
+        # Returned in the framework order
+        assert [
+            requirement.Id
+            for requirement in compliance.get_requirements(["1.1.2", "1.1.1"])
+        ] == ["1.1.1", "1.1.2"]
+        assert [
+            requirement.Id for requirement in compliance.get_requirements("1.1.2")
+        ] == ["1.1.2"]
+        assert compliance.get_requirements(["1.1.3"]) == []
+        assert compliance.get_requirements([]) == []
+
+    @mock.patch(
+        "prowler.lib.check.compliance_models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.compliance_models.load_compliance_framework")
     @mock.patch("os.stat")
     @mock.patch("os.path.isfile")
@@ -0,0 +1,176 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.metadata_index import (
+    METADATA_INDEX_VERSION,
+    build_metadata_index,
+    clear_metadata_index_cache,
+    get_indexed_check_metadata,
+    get_metadata_index,
+    get_metadata_index_fingerprint,
+    get_metadata_index_path,
+)
+from prowler.lib.check.models import CheckMetadata
+from tests.providers.github.github_fixtures import set_mocked_github_provider
+
+PROVIDER = "github"
+
+
+@pytest.fixture
+def metadata_index_enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROWLER_METADATA_INDEX", "true")
+    monkeypatch.setenv("PROWLER_CACHE_DIR", str(tmp_path))
+    clear_metadata_index_cache()
+    yield tmp_path
+    clear_metadata_index_cache()
+
+
+class TestMetadataIndex:
+    def test_get_metadata_index_disabled(self, monkeypatch):
+        monkeypatch.setenv("PROWLER_METADATA_INDEX", "false")
+        clear_metadata_index_cache()
+
+        assert get_metadata_index(PROVIDER) is None
+
+    def test_get_metadata_index_iac(self, metadata_index_enabled):
+        assert get_metadata_index("iac") is None
+
+    def test_get_metadata_index_path(self, metadata_index_enabled):
+        assert get_metadata_index_path(PROVIDER) == os.path.join(
+            metadata_index_enabled, f"metadata_index_{PROVIDER}.json"
+        )
+
+    def test_get_metadata_index_builds_and_saves(self, metadata_index_enabled):
+        index = get_metadata_index(PROVIDER)
+
+        assert index["Version"] == METADATA_INDEX_VERSION
+        assert index["Provider"] == PROVIDER
+        assert index["Fingerprint"] == get_metadata_index_fingerprint(PROVIDER)
+        assert "repository_public_has_securitymd_file" in index["Checks"]
+        assert "cis_1.0_github" in index["Compliance"]
+
+        with open(get_metadata_index_path(PROVIDER)) as f:
+            assert json.load(f) == index
+
+    def test_get_metadata_index_loads_from_disk(self, metadata_index_enabled):
+        index = get_metadata_index(PROVIDER)
+        clear_metadata_index_cache()
+
+        with mock.patch(
+            "prowler.lib.check.metadata_index.build_metadata_index"
+        ) as mock_build:
+            assert get_metadata_index(PROVIDER) == index
+            mock_build.assert_not_called()
+
+    def test_get_metadata_index_loaded_once(self, metadata_index_enabled):
+        index = get_metadata_index(PROVIDER)
+
+        with mock.patch(
+            "prowler.lib.check.metadata_index.load_metadata_index"
+        ) as mock_load:
+            assert get_metadata_index(PROVIDER) is index
+            mock_load.assert_not_called()
+
+    def test_get_metadata_index_stale(self, metadata_index_enabled):
+        stale_index = build_metadata_index(PROVIDER, "stale-fingerprint")
+        stale_index["Checks"] = {}
+        with open(get_metadata_index_path(PROVIDER), "w") as f:
+            json.dump(stale_index, f)
+
+        index = get_metadata_index(PROVIDER)
+
+        assert index["Fingerprint"] == get_metadata_index_fingerprint(PROVIDER)
+        assert index["Checks"]
+
+    def test_get_metadata_index_corrupted(self, metadata_index_enabled):
+        with open(get_metadata_index_path(PROVIDER), "w") as f:
+            f.write("{not json")
+
+        index = get_metadata_index(PROVIDER)
+
+        assert index["Checks"]
+
+    def test_get_bulk_from_index(self, metadata_index_enabled, monkeypatch):
+        bulk_checks_metadata = CheckMetadata.get_bulk(PROVIDER)
+        bulk_compliance_frameworks = Compliance.get_bulk(PROVIDER)
+
+        monkeypatch.setenv("PROWLER_METADATA_INDEX", "false")
+        assert bulk_checks_metadata == CheckMetadata.get_bulk(PROVIDER)
+        assert bulk_compliance_frameworks == Compliance.get_bulk(PROVIDER)
+
+    def test_compliance_get_bulk_from_index_keeps_models(
+        self, metadata_index_enabled, monkeypatch
+    ):
+        # AWS includes every kind of requirement and attribute model
+        bulk_compliance_frameworks = Compliance.get_bulk("aws")
+
+        monkeypatch.setenv("PROWLER_METADATA_INDEX", "false")
+        expected_compliance_frameworks = Compliance.get_bulk("aws")
+
+        assert bulk_compliance_frameworks == expected_compliance_frameworks
+        for name, framework in bulk_compliance_frameworks.items():
+            expected_framework = expected_compliance_frameworks[name]
+            for requirement, expected_requirement in zip(
+                framework.Requirements, expected_framework.Requirements
+            ):
+                assert type(requirement) is type(expected_requirement)
+                assert [type(attribute) for attribute in requirement.Attributes] == [
+                    type(attribute) for attribute in expected_requirement.Attributes
+                ]
+
+    def test_get_indexed_check_metadata(self, metadata_index_enabled):
+        index = get_metadata_index(PROVIDER)
+        check_id = "repository_public_has_securitymd_file"
+        metadata_file = index["Checks"][check_id]["File"]
+
+        assert (
+            get_indexed_check_metadata(PROVIDER, check_id, metadata_file)
+            == index["Checks"][check_id]["Metadata"]
+        )
+        assert (
+            get_indexed_check_metadata(PROVIDER, "not_a_check", metadata_file) is None
+        )
+        assert get_indexed_check_metadata("aws", check_id, metadata_file) is None
+
+    def test_get_indexed_check_metadata_changed_file(self, metadata_index_enabled):
+        index = get_metadata_index(PROVIDER)
+        check_id = "repository_public_has_securitymd_file"
+        index["Checks"][check_id]["ModifiedTime"] -= 1
+
+        assert (
+            get_indexed_check_metadata(
+                PROVIDER, check_id, index["Checks"][check_id]["File"]
+            )
+            is None
+        )
+
+    def test_check_init_from_index(self, metadata_index_enabled):
+        get_metadata_index(PROVIDER)
+        repository_client = mock.MagicMock
+
+        with (
+            mock.patch(
+                "prowler.providers.common.provider.Provider.get_global_provider",
+                return_value=set_mocked_github_provider(),
+            ),
+            mock.patch(
+                "prowler.providers.github.services.repository.repository_public_has_securitymd_file.repository_public_has_securitymd_file.repository_client",
+                new=repository_client,
+            ),
+            mock.patch(
+                "prowler.lib.check.models.CheckMetadata.parse_file"
+            ) as mock_parse_file,
+        ):
+            from prowler.providers.github.services.repository.repository_public_has_securitymd_file.repository_public_has_securitymd_file import (
+                repository_public_has_securitymd_file,
+            )
+
+            check = repository_public_has_securitymd_file()
+            mock_parse_file.assert_not_called()
+
+        assert check.CheckID == "repository_public_has_securitymd_file"
+        assert check.ServiceName == "repository"
@@ -1,6 +1,11 @@
 from unittest import mock
 
-from prowler.lib.check.models import CheckMetadata
+from prowler.lib.check.models import (
+    Check_Report_AWS,
+    CheckMetadata,
+    Severity,
+    parse_check_metadata,
+)
 from tests.lib.check.compliance_check_test import custom_compliance_metadata
 
 mock_metadata = CheckMetadata(
@@ -64,6 +69,10 @@ mock_metadata_lambda = CheckMetadata(
 
 class TestCheckMetada:
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_get_bulk(self, mock_recover_checks, mock_load_metadata):
@@ -85,6 +94,10 @@ class TestCheckMetada:
             "/path/to/accessanalyzer_enabled/accessanalyzer_enabled.metadata.json"
         )
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list(self, mock_recover_checks, mock_load_metadata):
@@ -103,6 +116,10 @@ class TestCheckMetada:
         # Assertions
         assert result == {"accessanalyzer_enabled"}
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_get(self, mock_recover_checks, mock_load_metadata):
@@ -121,6 +138,10 @@ class TestCheckMetada:
         # Assertions
         assert result == {"accessanalyzer_enabled"}
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_severity(self, mock_recover_checks, mock_load_metadata):
@@ -139,6 +160,10 @@ class TestCheckMetada:
         # Assertions
         assert result == {"accessanalyzer_enabled"}
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_severity_not_values(self, mock_recover_checks, mock_load_metadata):
@@ -157,6 +182,10 @@ class TestCheckMetada:
         # Assertions
         assert result == set()
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_category(self, mock_recover_checks, mock_load_metadata):
@@ -177,6 +206,10 @@ class TestCheckMetada:
         # Assertions
         assert result == {"accessanalyzer_enabled"}
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_category_not_valid(self, mock_recover_checks, mock_load_metadata):
@@ -197,6 +230,10 @@ class TestCheckMetada:
         # Assertions
         assert result == set()
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_service(self, mock_recover_checks, mock_load_metadata):
@@ -217,6 +254,10 @@ class TestCheckMetada:
         # Assertions
         assert result == {"accessanalyzer_enabled"}
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_service_lambda(self, mock_recover_checks, mock_load_metadata):
@@ -237,6 +278,10 @@ class TestCheckMetada:
         # Assertions
         assert result == {"awslambda_function_url_public"}
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_service_awslambda(self, mock_recover_checks, mock_load_metadata):
@@ -257,6 +302,10 @@ class TestCheckMetada:
         # Assertions
         assert result == {"awslambda_function_url_public"}
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_service_invalid(self, mock_recover_checks, mock_load_metadata):
@@ -277,6 +326,10 @@ class TestCheckMetada:
         # Assertions
         assert result == set()
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_by_compliance(self, mock_recover_checks, mock_load_metadata):
@@ -315,6 +368,10 @@ class TestCheckMetada:
         # Assertions
         assert result == set()
 
+    @mock.patch(
+        "prowler.lib.check.models.get_metadata_index",
+        new=mock.MagicMock(return_value=None),
+    )
     @mock.patch("prowler.lib.check.models.load_check_metadata")
     @mock.patch("prowler.lib.check.models.recover_checks_from_provider")
     def test_list_only_check_metadata(self, mock_recover_checks, mock_load_metadata):
@@ -325,3 +382,47 @@ class TestCheckMetada:
 
         result = CheckMetadata.list(bulk_checks_metadata=bulk_metadata)
         assert result == set()
+
+
+class TestCheckReport:
+    def test_check_report_parses_metadata_once(self):
+        parse_check_metadata.cache_clear()
+        resource = {"id": "resource-1"}
+
+        with mock.patch(
+            "prowler.lib.check.models.CheckMetadata.parse_raw",
+            wraps=CheckMetadata.parse_raw,
+        ) as mock_parse_raw:
+            reports = [
+                Check_Report_AWS(metadata=mock_metadata.json(), resource=resource)
+                for _ in range(3)
+            ]
+
+        mock_parse_raw.assert_called_once()
+        assert all(report.check_metadata == mock_metadata for report in reports)
+
+    def test_check_report_metadata_changes_do_not_leak(self):
+        parse_check_metadata.cache_clear()
+        resource = {"id": "resource-1"}
+
+        report = Check_Report_AWS(metadata=mock_metadata.json(), resource=resource)
+        report.check_metadata.Severity = Severity.low
+        other_report = Check_Report_AWS(
+            metadata=mock_metadata.json(), resource=resource
+        )
+
+        assert report.check_metadata.Severity == Severity.low
+        assert other_report.check_metadata.Severity == Severity.high
+
+    def test_check_report_custom_metadata(self):
+        parse_check_metadata.cache_clear()
+        resource = {"id": "resource-1"}
+        custom_metadata = mock_metadata.copy(update={"Severity": Severity.critical})
+
+        report = Check_Report_AWS(metadata=mock_metadata.json(), resource=resource)
+        custom_report = Check_Report_AWS(
+            metadata=custom_metadata.json(), resource=resource
+        )
+
+        assert report.check_metadata.Severity == Severity.high
+        assert custom_report.check_metadata.Severity == Severity.critical
@@ -1081,6 +1081,43 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_response_cache(self):
+        command = [prowler_command, "--cache-dir", "/tmp/cache", "--cache-ttl", "60"]
+        parsed = self.parser.parse(command)
+        assert parsed.cache_dir == "/tmp/cache"
+        assert parsed.cache_ttl == 60
+
+    def test_aws_parser_response_cache_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.cache_dir is None
+        assert parsed.cache_ttl is None
+
+    def test_aws_parser_snapshot(self):
+        command = [prowler_command, "--snapshot", "/tmp/snapshot.pkl.gz"]
+        parsed = self.parser.parse(command)
+        assert parsed.snapshot == "/tmp/snapshot.pkl.gz"
+        assert parsed.replay is None
+
+    def test_aws_parser_replay(self):
+        command = [prowler_command, "--replay", "/tmp/snapshot.pkl.gz"]
+        parsed = self.parser.parse(command)
+        assert parsed.replay == "/tmp/snapshot.pkl.gz"
+        assert parsed.snapshot is None
+
+    def test_aws_parser_snapshot_and_replay(self):
+        command = [
+            prowler_command,
+            "--snapshot",
+            "/tmp/snapshot.pkl.gz",
+            "--replay",
+            "/tmp/snapshot.pkl.gz",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_aws_parser_scan_unused_services(self):
         argument = "--scan-unused-services"
         command = [prowler_command, argument]
@@ -1100,6 +1137,17 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.config_file == config_file
 
+    def test_aws_parser_max_workers(self):
+        argument = "--max-workers"
+        command = [prowler_command, argument, "8"]
+        parsed = self.parser.parse(command)
+        assert parsed.max_workers == 8
+
+    def test_aws_parser_max_workers_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.max_workers == 1
+
     def test_aws_parser_role_session_name(self):
         argument = "--role-session-name"
         role_session_name = ROLE_SESSION_NAME
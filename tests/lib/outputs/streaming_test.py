@@ -0,0 +1,200 @@
+import csv
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.outputs import FindingsStatistics, extract_findings_statistics
+from prowler.lib.outputs.streaming import (
+    FindingResults,
+    StreamingOutputs,
+    get_compliance_output_class,
+)
+from tests.lib.outputs.compliance.fixtures import CIS_1_4_AWS, CIS_1_4_AWS_NAME
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
+
+
+def generate_check_report(
+    check_id: str, status: str, muted: bool = False, severity: str = "high"
+):
+    return SimpleNamespace(
+        check_metadata=SimpleNamespace(
+            CheckID=check_id, ServiceName=check_id.split("_")[0], Severity=severity
+        ),
+        status=status,
+        muted=muted,
+        finding_output=generate_finding_output(
+            status=status,
+            muted=muted,
+            check_id=check_id,
+            service_name=check_id.split("_")[0],
+            resource_uid=f"{check_id}-{status}",
+            compliance={"CIS-1.4": ["2.1.3"]},
+        ),
+    )
+
+
+def generate_output(provider, check_output, output_options):
+    return check_output.finding_output
+
+
+class TestFindingsStatistics:
+    def test_update_in_batches(self):
+        findings = [
+            generate_finding_output(status="PASS", resource_uid="resource_1"),
+            generate_finding_output(
+                status="FAIL", resource_uid="resource_2", severity="critical"
+            ),
+            generate_finding_output(
+                status="FAIL", resource_uid="resource_1", muted=True
+            ),
+            generate_finding_output(status="MANUAL", resource_uid="resource_3"),
+        ]
+
+        statistics = FindingsStatistics()
+        statistics.update(findings[:2])
+        statistics.update(findings[2:])
+
+        assert statistics.stats == extract_findings_statistics(findings)
+
+
+class TestFindingResults:
+    def test_iterate_results(self):
+        results = FindingResults()
+        results.update(
+            [
+                generate_check_report("s3_check", "PASS"),
+                generate_check_report("s3_check", "FAIL"),
+                generate_check_report("s3_check", "PASS"),
+            ]
+        )
+        results.update([generate_check_report("ec2_check", "FAIL", muted=True)])
+
+        assert len(results) == 4
+        assert [
+            (result.check_metadata.CheckID, result.status, result.muted)
+            for result in results
+        ] == [
+            ("s3_check", "PASS", False),
+            ("s3_check", "PASS", False),
+            ("s3_check", "FAIL", False),
+            ("ec2_check", "FAIL", True),
+        ]
+
+    def test_iterate_results_with_overridden_severity(self):
+        results = FindingResults()
+        results.update(
+            [
+                generate_check_report("s3_check", "FAIL", severity="critical"),
+                generate_check_report("s3_check", "FAIL"),
+                generate_check_report("s3_check", "FAIL", severity="critical"),
+            ]
+        )
+
+        assert len(results) == 3
+        assert [
+            (result.check_metadata.CheckID, result.check_metadata.Severity)
+            for result in results
+        ] == [
+            ("s3_check", "critical"),
+            ("s3_check", "critical"),
+            ("s3_check", "high"),
+        ]
+
+    def test_no_results(self):
+        results = FindingResults()
+
+        assert len(results) == 0
+        assert not results
+        assert list(results) == []
+
+
+class TestStreamingOutputs:
+    def test_get_compliance_output_class(self):
+        assert get_compliance_output_class("aws", "cis_1.4_aws") is AWSCIS
+        assert get_compliance_output_class("aws", "soc2_aws") is GenericCompliance
+        assert get_compliance_output_class("iac", "cis_1.4_aws") is GenericCompliance
+
+    @mock.patch(
+        "prowler.lib.outputs.streaming.Finding.generate_output",
+        side_effect=generate_output,
+    )
+    def test_write_checks(self, _, tmp_path):
+        (tmp_path / "compliance").mkdir()
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        output_options = SimpleNamespace(
+            output_directory=str(tmp_path), output_filename="prowler-output"
+        )
+        streaming_outputs = StreamingOutputs(
+            provider=provider,
+            output_options=output_options,
+            output_formats=["csv", "json-ocsf", "json-asff", "html"],
+            compliance_frameworks={CIS_1_4_AWS_NAME: CIS_1_4_AWS},
+        )
+
+        streaming_outputs.add(
+            [
+                generate_check_report("s3_check", "PASS"),
+                generate_check_report("s3_check", "FAIL"),
+            ]
+        )
+        streaming_outputs.add([])
+        streaming_outputs.add([generate_check_report("ec2_check", "FAIL", muted=True)])
+        # Only the findings of the last check are kept by the writers
+        assert len(streaming_outputs.generated_outputs["regular"][0].data) == 1
+        streaming_outputs.close()
+
+        assert streaming_outputs.statistics.stats["findings_count"] == 3
+        assert streaming_outputs.statistics.stats["total_fail"] == 2
+        assert streaming_outputs.statistics.stats["total_muted_fail"] == 1
+        assert len(streaming_outputs.results) == 3
+        assert len(streaming_outputs.asff_output.data) == 3
+
+        with open(tmp_path / "prowler-output.csv") as csv_file:
+            rows = list(csv.DictReader(csv_file, delimiter=";"))
+        assert [row["CHECK_ID"] for row in rows] == [
+            "s3_check",
+            "s3_check",
+            "ec2_check",
+        ]
+        with open(tmp_path / "prowler-output.ocsf.json") as ocsf_file:
+            assert len(json.load(ocsf_file)) == 3
+        with open(tmp_path / "prowler-output.asff.json") as asff_file:
+            assert len(json.load(asff_file)) == 3
+        with open(tmp_path / "prowler-output.html") as html_file:
+            html = html_file.read()
+        assert html.startswith("<!DOCTYPE html>")
+        assert "<b>Total Findings:</b> 3" in html
+        assert html.count('<tr class="') == 3
+        assert html.rstrip().endswith("</html>")
+        with open(
+            tmp_path / "compliance" / f"prowler-output_{CIS_1_4_AWS_NAME}.csv"
+        ) as compliance_file:
+            rows = list(csv.DictReader(compliance_file, delimiter=";"))
+        # The manual requirements are written once, after the findings
+        assert [row["RESOURCEID"] for row in rows] == [
+            "s3_check-PASS",
+            "s3_check-FAIL",
+            "ec2_check-FAIL",
+            "manual_check",
+        ]
+
+    def test_no_findings(self, tmp_path):
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        output_options = SimpleNamespace(
+            output_directory=str(tmp_path), output_filename="prowler-output"
+        )
+        streaming_outputs = StreamingOutputs(
+            provider=provider,
+            output_options=output_options,
+            output_formats=["csv", "html"],
+            compliance_frameworks={},
+        )
+
+        streaming_outputs.add([])
+        streaming_outputs.close()
+
+        assert streaming_outputs.statistics.stats["findings_count"] == 0
+        assert list(tmp_path.iterdir()) == []
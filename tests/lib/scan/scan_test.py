@@ -98,16 +98,18 @@ def mock_list_modules():
 
 @pytest.fixture
 def mock_recover_checks_from_provider():
-    with mock.patch(
-        "prowler.lib.check.models.recover_checks_from_provider", autospec=True
-    ) as mock_recover:
-        mock_recover.return_value = [
-            (
-                "accessanalyzer_enabled",
-                "/prowler/providers/aws/services/accessanalyzer/accessanalyzer_enabled",
-            )
-        ]
-        yield mock_recover
+    # The checks are discovered from the metadata files instead of the metadata index
+    with mock.patch("prowler.lib.check.models.get_metadata_index", return_value=None):
+        with mock.patch(
+            "prowler.lib.check.models.recover_checks_from_provider", autospec=True
+        ) as mock_recover:
+            mock_recover.return_value = [
+                (
+                    "accessanalyzer_enabled",
+                    "/prowler/providers/aws/services/accessanalyzer/accessanalyzer_enabled",
+                )
+            ]
+            yield mock_recover
 
 
 @pytest.fixture
@@ -304,6 +306,47 @@ class TestScan:
         }
         mock_logger.error.assert_not_called()
 
+    @patch("importlib.import_module")
+    def test_scan_concurrent(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_logger,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.CheckTitle = "Check if IAM Access Analyzer is enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        mock_global_provider.type = "aws"
+
+        scan = Scan(mock_global_provider, checks=checks_to_execute)
+        results = list(scan.scan({}, max_workers=4))
+
+        assert mock_execute.call_count == 1
+        assert len(results) == 1
+        assert results[0][0] == 100.0
+        assert results[0][1] == mock_execute.side_effect()
+        assert scan.progress == 100.0
+        assert scan._number_of_checks_completed == 1
+        assert scan.service_checks_to_execute == {}
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+        }
+        assert mock_global_provider.audit_metadata.completed_checks == 1
+        assert mock_global_provider.audit_metadata.audit_progress == 100
+        mock_logger.error.assert_not_called()
+
     def test_init_invalid_severity(
         mock_provider,
     ):
@@ -1,12 +1,16 @@
 import os
 import tempfile
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from time import mktime
 
 import pytest
-from mock import patch
+from detect_secrets import SecretsCollection
+from detect_secrets.settings import transient_settings
+from mock import MagicMock, patch
 
 from prowler.lib.utils.utils import (
+    SecretsScanner,
     detect_secrets_scan,
     file_exists,
     get_file_permissions,
@@ -179,6 +183,120 @@ class Test_detect_secrets_scan:
         assert secrets_detected[0]["type"] == "Secret Keyword"
 
 
+class Test_SecretsScanner:
+    def test_scan_batch(self):
+        secrets_scanner = SecretsScanner(excluded_secrets=[".*ignored.*"])
+        secrets_detected = secrets_scanner.scan_batch(
+            {
+                "secret": "password=password",
+                "no_secret": "echo hello",
+                "ignored": "password=ignored",
+                3: "#!/bin/bash\nexport password=password",
+            }
+        )
+        assert list(secrets_detected.keys()) == ["secret", 3]
+        assert secrets_detected["secret"][0]["line_number"] == 1
+        assert secrets_detected["secret"][0]["type"] == "Secret Keyword"
+        assert secrets_detected[3][0]["line_number"] == 2
+
+    def test_scan_batch_same_as_scan_file(self):
+        secrets_scanner = SecretsScanner()
+        data = {
+            "crlf": 'echo hello\r\ndb_password = "test-password"',
+            "escaped": 'db_password = "test-\\u00e9password"',
+            "unicode": 'db_password = "test-\u00e9password"',
+            "no_secret": "echo hello",
+            "empty": "",
+        }
+        expected_secrets = {}
+        for data_id, item_data in data.items():
+            # Scan the data written to a file as detect-secrets does
+            temp_data_file = tempfile.NamedTemporaryFile(delete=False)
+            temp_data_file.write(bytes(item_data, encoding="raw_unicode_escape"))
+            temp_data_file.close()
+            secrets = SecretsCollection()
+            with transient_settings(secrets_scanner.settings):
+                secrets.scan_file(temp_data_file.name)
+            os.remove(temp_data_file.name)
+            if file_secrets := secrets.json().get(temp_data_file.name):
+                expected_secrets[data_id] = [
+                    {**secret, "filename": "data"} for secret in file_secrets
+                ]
+        assert expected_secrets.keys() == {"crlf", "escaped"}
+        assert secrets_scanner.scan_batch(data) == expected_secrets
+
+    def test_scan_batch_error(self):
+        secrets_scanner = SecretsScanner()
+        secrets = [{"type": "Secret Keyword", "line_number": 1}]
+        with patch(
+            "prowler.lib.utils.utils._scan_secrets_data",
+            side_effect=[Exception("error"), secrets],
+        ):
+            assert secrets_scanner.scan_batch({"error": "data", "ok": "data"}) == {
+                "ok": secrets
+            }
+
+    def test_scan_batch_process_pool_error(self):
+        secrets_scanner = SecretsScanner()
+        data = {index: "password=password" for index in range(4)}
+        data[4] = "echo hello"
+        with patch("prowler.lib.utils.utils.SECRETS_SCAN_PROCESS_POOL_MIN_BATCH", 2):
+            with patch(
+                "prowler.lib.utils.utils.ProcessPoolExecutor",
+                side_effect=AssertionError(
+                    "daemonic processes are not allowed to have children"
+                ),
+            ):
+                secrets_detected = secrets_scanner.scan_batch(data, max_workers=2)
+
+        # The batch is scanned in the current process
+        assert list(secrets_detected.keys()) == [0, 1, 2, 3]
+
+    def test_scan_batch_process_pool_chunk_error(self):
+        secrets_scanner = SecretsScanner()
+        data = {index: "password=password" for index in range(4)}
+        failed_future = MagicMock()
+        failed_future.result.side_effect = BrokenProcessPool("error")
+        executor = MagicMock()
+        executor.__enter__.return_value.submit.return_value = failed_future
+        with patch("prowler.lib.utils.utils.SECRETS_SCAN_PROCESS_POOL_MIN_BATCH", 2):
+            with patch(
+                "prowler.lib.utils.utils.ProcessPoolExecutor", return_value=executor
+            ):
+                secrets_detected = secrets_scanner.scan_batch(data, max_workers=2)
+
+        # The failed chunks are scanned in the current process
+        assert list(secrets_detected.keys()) == [0, 1, 2, 3]
+
+    def test_scan_batch_process_pool(self):
+        secrets_scanner = SecretsScanner()
+        data = {index: f"password=password{index}" for index in range(4)}
+        data[4] = "echo hello"
+        with patch("prowler.lib.utils.utils.SECRETS_SCAN_PROCESS_POOL_MIN_BATCH", 2):
+            secrets_detected = secrets_scanner.scan_batch(data, max_workers=2)
+        assert list(secrets_detected.keys()) == [0, 1, 2, 3]
+        assert all(
+            secrets[0]["type"] == "Secret Keyword"
+            for secrets in secrets_detected.values()
+        )
+
+    def test_scan_files(self):
+        secrets_detected = SecretsScanner().scan_files(
+            {
+                "lambda_function.py": b'db_password = "test-password"',
+                "binary.bin": b"\xff\xfepassword=password",
+                "README.md": b"echo hello",
+            }
+        )
+        assert list(secrets_detected.keys()) == ["lambda_function.py"]
+        assert secrets_detected["lambda_function.py"][0]["filename"] == (
+            "lambda_function.py"
+        )
+
+    def test_scan_batch_empty(self):
+        assert SecretsScanner().scan_batch({}) == {}
+
+
 class Test_hash_sha512:
     def test_hash_sha512(self):
         assert hash_sha512("test") == "ee26b0dd4"
@@ -279,6 +279,24 @@ class TestAWSProvider:
         assert aws_provider.audit_config
         assert aws_provider.session.current_session.region_name == AWS_REGION_US_EAST_1
 
+        assert aws_provider.response_cache is None
+
+    @mock_aws
+    def test_aws_provider_response_cache(self, tmp_path):
+        aws_provider = AwsProvider(
+            response_cache_dir=str(tmp_path),
+            response_cache_ttl=60,
+        )
+
+        assert aws_provider.response_cache.cache_dir == str(tmp_path)
+        assert aws_provider.response_cache.ttl == 60
+        assert aws_provider.response_cache.account == AWS_ACCOUNT_NUMBER
+
+        s3_client = aws_provider.session.current_session.client("s3")
+        s3_client.list_buckets()
+        s3_client.list_buckets()
+        assert aws_provider.response_cache.hits == 1
+
     @mock_aws
     def test_aws_provider_with_static_credentials(self):
         # Create a mock IAM user
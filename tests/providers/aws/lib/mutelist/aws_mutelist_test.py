@@ -1955,3 +1955,76 @@ class TestAWSMutelist:
             "prowler",
             "",
         )
+
+    def test_is_muted_decision_cached(self):
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["prowler"],
+                        }
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+
+        with patch.object(mutelist, "is_muted_in_check") as mock_is_muted_in_check:
+            assert mutelist.is_muted(
+                AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+            )
+            mock_is_muted_in_check.assert_not_called()
+
+    def test_is_muted_cache_reset_with_new_mutelist(self):
+        mutelist_content = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": ["*"],
+                            "Resources": ["prowler"],
+                        }
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+
+        mutelist._mutelist = {"Accounts": {}}
+
+        assert not mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+
+    def test_get_matching_muted_checks(self):
+        muted_checks = {
+            "lambda_*": {"Regions": ["*"], "Resources": ["lambda"]},
+            "ec2_*": {"Regions": ["*"], "Resources": ["ec2"]},
+            "*": {"Regions": ["*"], "Resources": ["all"]},
+            "awslambda_function_url_public": {
+                "Regions": ["*"],
+                "Resources": ["url"],
+            },
+        }
+        mutelist = AWSMutelist(mutelist_content={})
+
+        assert mutelist._get_matching_muted_checks(
+            muted_checks, "awslambda_function_url_public"
+        ) == [
+            muted_checks["lambda_*"],
+            muted_checks["*"],
+            muted_checks["awslambda_function_url_public"],
+        ]
+        assert mutelist._get_matching_muted_checks(
+            muted_checks, "ec2_instance_public_ip"
+        ) == [muted_checks["ec2_*"], muted_checks["*"]]
@@ -0,0 +1,166 @@
+import os
+from datetime import datetime, timezone
+
+from boto3 import session
+from mock import patch
+from moto import mock_aws
+
+from prowler.providers.aws.lib.response_cache.response_cache import AWSResponseCache
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_EU_WEST_1
+
+
+def cached_session(response_cache):
+    aws_session = session.Session(region_name=AWS_REGION_EU_WEST_1)
+    response_cache.register(aws_session)
+    return aws_session
+
+
+class TestAWSResponseCache:
+    @mock_aws
+    def test_cached_response(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        s3_client = cached_session(response_cache).client("s3")
+        s3_client.create_bucket(
+            Bucket="bucket",
+            CreateBucketConfiguration={"LocationConstraint": AWS_REGION_EU_WEST_1},
+        )
+
+        buckets = s3_client.list_buckets()["Buckets"]
+        assert response_cache.misses == 1
+        assert response_cache.hits == 0
+
+        # The new bucket is not listed since the response is cached
+        s3_client.create_bucket(
+            Bucket="bucket-2",
+            CreateBucketConfiguration={"LocationConstraint": AWS_REGION_EU_WEST_1},
+        )
+        assert s3_client.list_buckets()["Buckets"] == buckets
+        assert isinstance(buckets[0]["CreationDate"], datetime)
+        assert response_cache.hits == 1
+        # Only the read-only call is cached
+        assert len(os.listdir(tmp_path)) == 1
+
+    @mock_aws
+    def test_cached_response_other_session(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        cached_session(response_cache).client("s3").list_buckets()
+
+        other_response_cache = AWSResponseCache(
+            AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path)
+        )
+        cached_session(other_response_cache).client("s3").list_buckets()
+
+        assert other_response_cache.hits == 1
+        assert other_response_cache.misses == 0
+
+    @mock_aws
+    def test_cached_response_per_parameters_and_region(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        aws_session = cached_session(response_cache)
+        ec2_client = aws_session.client("ec2", region_name=AWS_REGION_EU_WEST_1)
+
+        ec2_client.describe_vpcs()
+        ec2_client.describe_vpcs(Filters=[{"Name": "is-default", "Values": ["true"]}])
+        aws_session.client("ec2", region_name="us-east-1").describe_vpcs()
+
+        assert response_cache.misses == 3
+        assert response_cache.hits == 0
+
+    @mock_aws
+    def test_cached_response_expired(self, tmp_path):
+        response_cache = AWSResponseCache(
+            AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path), ttl=60
+        )
+        s3_client = cached_session(response_cache).client("s3")
+        s3_client.list_buckets()
+
+        with patch(
+            "prowler.providers.aws.lib.response_cache.response_cache.time.time",
+            return_value=datetime.now().timestamp() + 120,
+        ):
+            s3_client.list_buckets()
+
+        assert response_cache.hits == 0
+        assert response_cache.misses == 2
+
+    @mock_aws
+    def test_not_cached_operation(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        sts_client = cached_session(response_cache).client("sts")
+
+        sts_client.get_session_token()
+        sts_client.get_session_token()
+
+        assert response_cache.hits == 0
+        assert response_cache.misses == 0
+        assert os.listdir(tmp_path) == []
+
+    @mock_aws
+    def test_not_cached_secrets_operation(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        aws_session = cached_session(response_cache)
+
+        # The environment variables of the functions are scanned for secrets
+        aws_session.client("lambda").list_functions()
+        # The connections are listed with their passwords
+        aws_session.client("glue").get_connections()
+        aws_session.client("ecs").list_task_definitions()
+
+        assert response_cache.misses == 1
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_set_and_get(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        response = {
+            "Date": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "Data": b"data",
+            "Items": [{"Name": "item"}],
+        }
+
+        response_cache.set("key", response)
+
+        assert response_cache.get("key") == response
+        assert response_cache.get("missing") is None
+
+    def test_get_corrupted(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        with open(os.path.join(tmp_path, "key.json.gz"), "w") as f:
+            f.write("not gzip")
+
+        assert response_cache.get("key") is None
+        assert os.listdir(tmp_path) == []
+
+    def test_evict_least_recently_used(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        response_cache.set("first", {"Data": "first"})
+        response_cache.set("second", {"Data": "second"})
+        # The first response is used after the second one is stored
+        os.utime(os.path.join(tmp_path, "second.json.gz"), (1, 1))
+        assert response_cache.get("first")
+        response_cache.max_size = (
+            os.path.getsize(os.path.join(tmp_path, "first.json.gz")) * 2.5
+        )
+
+        response_cache.set("third", {"Data": "third"})
+
+        assert response_cache.get("second") is None
+        assert response_cache.get("first") == {"Data": "first"}
+        assert response_cache.get("third") == {"Data": "third"}
+
+    def test_get_cache_key(self, tmp_path):
+        response_cache = AWSResponseCache(AWS_ACCOUNT_NUMBER, cache_dir=str(tmp_path))
+        other_account_cache = AWSResponseCache("111111111111", cache_dir=str(tmp_path))
+
+        key = response_cache.get_cache_key(
+            AWS_REGION_EU_WEST_1, "ec2", "DescribeVpcs", {"MaxResults": 5}
+        )
+
+        assert key == response_cache.get_cache_key(
+            AWS_REGION_EU_WEST_1, "ec2", "DescribeVpcs", {"MaxResults": 5}
+        )
+        assert key != response_cache.get_cache_key(
+            AWS_REGION_EU_WEST_1, "ec2", "DescribeVpcs", {"MaxResults": 6}
+        )
+        assert key != other_account_cache.get_cache_key(
+            AWS_REGION_EU_WEST_1, "ec2", "DescribeVpcs", {"MaxResults": 5}
+        )
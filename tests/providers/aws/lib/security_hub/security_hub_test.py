@@ -5,14 +5,21 @@ import botocore
 import pytest
 from boto3 import session
 from botocore.client import ClientError
-from mock import patch
+from mock import MagicMock, patch
 
 from prowler.lib.outputs.asff.asff import ASFF
 from prowler.providers.aws.lib.security_hub.exceptions.exceptions import (
     SecurityHubInvalidRegionError,
     SecurityHubNoEnabledRegionsError,
 )
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+from prowler.providers.aws.lib.security_hub.security_hub import (
+    SECURITY_HUB_BATCH_IMPORT_BURST,
+    SECURITY_HUB_BATCH_IMPORT_MIN_RATE,
+    SECURITY_HUB_BATCH_IMPORT_RATE,
+    SECURITY_HUB_MAX_RETRIES,
+    SecurityHub,
+    SecurityHubRateLimiter,
+)
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
@@ -50,6 +57,38 @@ def mock_make_api_call(self, operation_name, kwarg):
     return make_api_call(self, operation_name, kwarg)
 
 
+# 250 previous findings in pages of 100 findings, the first 10 ones still present
+PREVIOUS_FINDINGS_IDS = [f"prowler-finding-{i}" for i in range(250)]
+archived_findings = []
+# Operations called by region, in order
+archive_calls = []
+
+
+def mock_make_api_call_archive(self, operation_name, kwarg):
+    if operation_name == "GetFindings":
+        region = kwarg["Filters"]["Region"][0]["Value"]
+        archive_calls.append((operation_name, region))
+        start = int(kwarg.get("NextToken", 0))
+        page = {
+            "Findings": [
+                {"Id": f"{region}-{finding_id}", "RecordState": "ACTIVE"}
+                for finding_id in PREVIOUS_FINDINGS_IDS[start : start + 100]
+            ]
+        }
+        if start + 100 < len(PREVIOUS_FINDINGS_IDS):
+            page["NextToken"] = str(start + 100)
+        return page
+    if operation_name == "BatchImportFindings":
+        assert len(kwarg["Findings"]) <= 100
+        archive_calls.append((operation_name, self.meta.region_name))
+        archived_findings.extend(kwarg["Findings"])
+        return {
+            "FailedCount": 0,
+            "SuccessCount": len(kwarg["Findings"]),
+        }
+    return mock_make_api_call(self, operation_name, kwarg)
+
+
 class TestSecurityHub:
 
     @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
@@ -410,6 +449,246 @@ class TestSecurityHub:
 
         assert security_hub.batch_send_to_security_hub() == 2
 
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call_archive)
+    def test_archive_previous_findings(self):
+        enabled_regions = [AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=enabled_regions,
+        )
+        # Only the ID of the current findings is used
+        security_hub._findings_per_region = {
+            region: [
+                MagicMock(Id=f"{region}-{finding_id}")
+                for finding_id in PREVIOUS_FINDINGS_IDS[:10]
+            ]
+            for region in enabled_regions
+        }
+        archived_findings.clear()
+        archive_calls.clear()
+
+        assert security_hub.archive_previous_findings() == 480
+        assert len(archived_findings) == 480
+        assert all(
+            finding["RecordState"] == "ARCHIVED" and finding["UpdatedAt"]
+            for finding in archived_findings
+        )
+        for region in enabled_regions:
+            archived_ids = {
+                finding["Id"]
+                for finding in archived_findings
+                if finding["Id"].startswith(region)
+            }
+            assert archived_ids == {
+                f"{region}-{finding_id}" for finding_id in PREVIOUS_FINDINGS_IDS[10:]
+            }
+            # The findings are archived once all the ACTIVE ones have been paginated
+            region_calls = [
+                operation_name
+                for operation_name, call_region in archive_calls
+                if call_region == region
+            ]
+            assert region_calls == ["GetFindings"] * 3 + ["BatchImportFindings"] * 3
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_send_findings_in_batches_retries_failed_findings(self):
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+        )
+        sent_findings_ids = []
+
+        def batch_import_findings(Findings):
+            sent_findings_ids.append([finding["Id"] for finding in Findings])
+            # The first finding of every batch fails once
+            if len(sent_findings_ids) in (1, 3):
+                return {
+                    "FailedCount": 1,
+                    "SuccessCount": len(Findings) - 1,
+                    "FailedFindings": [
+                        {
+                            "Id": Findings[0]["Id"],
+                            "ErrorCode": "InternalFailure",
+                            "ErrorMessage": "Internal failure",
+                        }
+                    ],
+                }
+            return {"FailedCount": 0, "SuccessCount": len(Findings)}
+
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = MagicMock(
+            batch_import_findings=batch_import_findings
+        )
+        findings = [{"Id": f"finding-{i}"} for i in range(150)]
+
+        assert (
+            security_hub._send_findings_in_batches(findings, AWS_REGION_EU_WEST_1)
+            == 150
+        )
+        assert sent_findings_ids == [
+            [f"finding-{i}" for i in range(100)],
+            ["finding-0"],
+            [f"finding-{i}" for i in range(100, 150)],
+            ["finding-100"],
+        ]
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_send_findings_in_batches_failed_findings_exhausted(self, caplog):
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+        )
+        batch_import_findings = MagicMock(
+            return_value={
+                "FailedCount": 1,
+                "SuccessCount": 0,
+                "FailedFindings": [
+                    {
+                        "Id": "finding-0",
+                        "ErrorCode": "InternalFailure",
+                        "ErrorMessage": "Internal failure",
+                    }
+                ],
+            }
+        )
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = MagicMock(
+            batch_import_findings=batch_import_findings
+        )
+
+        assert (
+            security_hub._send_findings_in_batches(
+                [{"Id": "finding-0"}], AWS_REGION_EU_WEST_1
+            )
+            == 0
+        )
+        assert batch_import_findings.call_count == SECURITY_HUB_MAX_RETRIES + 1
+        assert (
+            "Failed to send finding finding-0 to AWS Security Hub -- InternalFailure -- Internal failure"
+            in caplog.text
+        )
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_send_findings_in_batches_failed_findings_not_retried(self, caplog):
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+        )
+        batch_import_findings = MagicMock(
+            return_value={
+                "FailedCount": 1,
+                "SuccessCount": 0,
+                "FailedFindings": [
+                    {
+                        "Id": "finding-0",
+                        "ErrorCode": "InvalidInput",
+                        "ErrorMessage": "Invalid input",
+                    }
+                ],
+            }
+        )
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = MagicMock(
+            batch_import_findings=batch_import_findings
+        )
+
+        assert (
+            security_hub._send_findings_in_batches(
+                [{"Id": "finding-0"}], AWS_REGION_EU_WEST_1
+            )
+            == 0
+        )
+        assert batch_import_findings.call_count == 1
+        assert (
+            "Failed to send finding finding-0 to AWS Security Hub -- InvalidInput -- Invalid input"
+            in caplog.text
+        )
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_send_findings_in_batches_throttled(self):
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+        )
+        throttling_error = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "BatchImportFindings",
+        )
+        batch_import_findings = MagicMock(
+            side_effect=[
+                throttling_error,
+                {"FailedCount": 0, "SuccessCount": 2},
+            ]
+        )
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = MagicMock(
+            batch_import_findings=batch_import_findings
+        )
+
+        with patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.time.sleep"
+        ) as mock_sleep:
+            assert (
+                security_hub._send_findings_in_batches(
+                    [{"Id": "finding-0"}, {"Id": "finding-1"}], AWS_REGION_EU_WEST_1
+                )
+                == 2
+            )
+            # The bucket is emptied after the throttled request
+            mock_sleep.assert_called()
+        assert batch_import_findings.call_count == 2
+        assert (
+            security_hub._rate_limiters[AWS_REGION_EU_WEST_1].rate
+            < SECURITY_HUB_BATCH_IMPORT_RATE
+        )
+
+    def test_rate_limiter(self):
+        rate_limiter = SecurityHubRateLimiter()
+
+        with patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.time.sleep"
+        ) as mock_sleep:
+            for _ in range(SECURITY_HUB_BATCH_IMPORT_BURST):
+                rate_limiter.acquire()
+            mock_sleep.assert_not_called()
+
+        rate_limiter.throttled()
+        assert rate_limiter.rate == SECURITY_HUB_BATCH_IMPORT_RATE / 2
+        for _ in range(10):
+            rate_limiter.throttled()
+        assert rate_limiter.rate == SECURITY_HUB_BATCH_IMPORT_MIN_RATE
+        for _ in range(100):
+            rate_limiter.succeeded()
+        assert rate_limiter.rate == SECURITY_HUB_BATCH_IMPORT_RATE
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_archive_previous_findings_no_regions(self):
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+        )
+
+        assert security_hub.archive_previous_findings() == 0
+
     @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_security_hub_test_connection_success(self):
         session_mock = session.Session(region_name=AWS_REGION_EU_WEST_1)
@@ -1,3 +1,6 @@
+import threading
+import time
+
 from mock import patch
 
 from prowler.providers.aws.lib.service.service import AWSService
@@ -152,3 +155,163 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    def test_AWSService_shared_thread_pool(self):
+        provider = set_mocked_aws_provider()
+        s3_service = AWSService("s3", provider)
+        ec2_service = AWSService("ec2", provider)
+
+        assert s3_service.thread_pool is ec2_service.thread_pool
+
+    def test_AWSService_threading_call(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        called_regions = []
+
+        def _call(regional_client):
+            called_regions.append(regional_client.region)
+
+        service.__threading_call__(_call)
+
+        assert called_regions == [AWS_REGION_US_EAST_1]
+        metrics = service.thread_pool.get_metrics()["S3 - Call"]
+        assert metrics.calls == 1
+        assert metrics.completed == 1
+
+    def test_AWSService_threading_call_nested(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        processed_items = []
+
+        def _process_item(item):
+            processed_items.append(item)
+
+        def _call(regional_client):
+            # Runs in the current task instead of waiting for the pool
+            service.__threading_call__(_process_item, [1, 2, 3])
+
+        service.__threading_call__(_call)
+
+        assert processed_items == [1, 2, 3]
+
+    def test_AWSService_threading_call_chain(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        calls = []
+
+        def _get_first(item):
+            calls.append(("first", item))
+
+        def _get_second(item):
+            if item == 2:
+                raise ValueError("unhandled error")
+            calls.append(("second", item))
+
+        def _get_third(item):
+            # The previous calls of the chain already ran for this item
+            assert ("first", item) in calls
+            calls.append(("third", item))
+
+        service.__threading_call_chain__([_get_first, _get_second, _get_third], [1, 2])
+
+        assert sorted(calls) == [
+            ("first", 1),
+            ("first", 2),
+            ("second", 1),
+            ("third", 1),
+            ("third", 2),
+        ]
+        metrics = service.thread_pool.get_metrics()[
+            "S3 - Get First Then Get Second Then Get Third"
+        ]
+        assert metrics.calls == 2
+        assert metrics.completed == 2
+
+    def test_AWSService_lazy_load(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        calls = []
+
+        def _discover_buckets():
+            calls.append("buckets")
+            service.buckets = ["bucket"]
+            service.bucket_count = 1
+
+        service.__lazy_load__(_discover_buckets, "buckets", "bucket_count")
+
+        assert calls == []
+        assert service.bucket_count == 1
+        assert service.buckets == ["bucket"]
+        assert calls == ["buckets"]
+
+    def test_AWSService_lazy_load_published_once_done(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        discovery_started = threading.Event()
+        read_buckets = []
+
+        def _add_bucket(bucket):
+            # The tasks of the discovery read the attribute before it is published
+            service.buckets.append(bucket)
+
+        def _discover_buckets():
+            service.buckets = []
+            discovery_started.set()
+            time.sleep(0.1)
+            service.__threading_call__(_add_bucket, ["bucket-1", "bucket-2"])
+
+        def read():
+            discovery_started.wait()
+            read_buckets.append(list(service.buckets))
+
+        service.__lazy_load__(_discover_buckets, "buckets")
+        reader = threading.Thread(target=read)
+        reader.start()
+        assert sorted(service.buckets) == ["bucket-1", "bucket-2"]
+        reader.join()
+
+        # The other threads wait until the discovery finishes
+        assert [sorted(buckets) for buckets in read_buckets] == [
+            ["bucket-1", "bucket-2"]
+        ]
+
+    def test_AWSService_lazy_attribute(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        calls = []
+
+        def _get_account_setting(setting):
+            calls.append(setting)
+            return f"{setting}-value"
+
+        service.__lazy_attribute__(
+            "account_setting", _get_account_setting, "public-access"
+        )
+
+        assert calls == []
+        assert service.account_setting == "public-access-value"
+        assert service.account_setting == "public-access-value"
+        assert calls == ["public-access"]
+
+    def test_AWSService_lazy_load_error(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+
+        def _discover_buckets():
+            raise Exception("error")
+
+        service.__lazy_load__(_discover_buckets, "buckets")
+
+        assert not hasattr(service, "buckets")
+        assert not hasattr(service, "not_lazy")
+
+    def test_AWSService_load_lazy_attributes(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        service.__lazy_attribute__("buckets", lambda: ["bucket"])
+        service.__lazy_attribute__("account_setting", lambda: "value")
+
+        service.__load_lazy_attributes__()
+
+        assert service.__dict__["buckets"] == ["bucket"]
+        assert service.__dict__["account_setting"] == "value"
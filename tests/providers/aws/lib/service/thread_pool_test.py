@@ -0,0 +1,195 @@
+import threading
+import time
+
+import pytest
+from mock import MagicMock
+
+from prowler.providers.aws.lib.service.thread_pool import (
+    BACKOFF_BASE_SECONDS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_WORKERS_PER_REGION,
+    AWSThreadPool,
+    get_provider_thread_pool,
+    register_throttling_handler,
+)
+from tests.providers.aws.utils import (
+    AWS_REGION_EU_WEST_1,
+    AWS_REGION_US_EAST_1,
+    set_mocked_aws_provider,
+)
+
+
+class TestAWSThreadPool:
+    def test_submit(self):
+        thread_pool = AWSThreadPool()
+
+        def add(a, b):
+            return a + b
+
+        assert thread_pool.submit(add, 1, b=2).result() == 3
+        metrics = thread_pool.get_metrics()["add"]
+        assert metrics.calls == 1
+        assert metrics.completed == 1
+        assert metrics.queue_depth == 0
+
+    def test_submit_to_region_limit(self):
+        thread_pool = AWSThreadPool(max_workers=8, max_workers_per_region=2)
+        running = {AWS_REGION_US_EAST_1: 0, AWS_REGION_EU_WEST_1: 0}
+        max_running = dict(running)
+        lock = threading.Lock()
+
+        def call(region):
+            with lock:
+                running[region] += 1
+                max_running[region] = max(max_running[region], running[region])
+            time.sleep(0.05)
+            with lock:
+                running[region] -= 1
+
+        futures = [
+            thread_pool.submit_to_region("ec2", region, "EC2 - Call", call, region)
+            for region in (AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1)
+            for _ in range(6)
+        ]
+        for future in futures:
+            future.result()
+
+        assert max_running == {AWS_REGION_US_EAST_1: 2, AWS_REGION_EU_WEST_1: 2}
+        metrics = thread_pool.get_metrics()["EC2 - Call"]
+        assert metrics.calls == 12
+        assert metrics.completed == 12
+        assert metrics.queue_depth == 0
+        assert metrics.max_queue_depth >= 1
+        assert metrics.average_run_time >= 0.05
+
+    def test_in_worker(self):
+        thread_pool = AWSThreadPool()
+
+        assert not thread_pool.in_worker()
+        assert thread_pool.submit(thread_pool.in_worker).result()
+
+    def test_submit_to_region_does_not_block_other_regions(self):
+        thread_pool = AWSThreadPool(max_workers=2, max_workers_per_region=1)
+        finished = []
+
+        def call(region):
+            time.sleep(0.1 if region == AWS_REGION_US_EAST_1 else 0)
+            finished.append(region)
+
+        futures = [
+            thread_pool.submit_to_region(
+                "ec2", AWS_REGION_US_EAST_1, "EC2 - Call", call, AWS_REGION_US_EAST_1
+            )
+            for _ in range(3)
+        ]
+        futures.append(
+            thread_pool.submit_to_region(
+                "ec2", AWS_REGION_EU_WEST_1, "EC2 - Call", call, AWS_REGION_EU_WEST_1
+            )
+        )
+        for future in futures:
+            future.result()
+
+        # The queued tasks of the busy region do not hold the second thread
+        assert finished[0] == AWS_REGION_EU_WEST_1
+
+    def test_submit_to_region_exception(self):
+        thread_pool = AWSThreadPool(max_workers_per_region=1)
+
+        def fail():
+            raise ValueError("error")
+
+        future = thread_pool.submit_to_region(
+            "ec2", AWS_REGION_US_EAST_1, "EC2 - Call", fail
+        )
+
+        with pytest.raises(ValueError):
+            future.result()
+        # The slot of the failed task is released
+        assert (
+            thread_pool.submit_to_region(
+                "ec2", AWS_REGION_US_EAST_1, "EC2 - Call", lambda: 1
+            ).result()
+            == 1
+        )
+
+    def test_throttled_backoff(self):
+        thread_pool = AWSThreadPool(max_workers=1)
+        thread_pool.throttled("ec2", AWS_REGION_US_EAST_1)
+        thread_pool.throttled("ec2", AWS_REGION_US_EAST_1)
+        finished = []
+
+        assert thread_pool.get_throttles() == {("ec2", AWS_REGION_US_EAST_1): 2}
+        submitted_at = time.monotonic()
+        throttled_future = thread_pool.submit_to_region(
+            "ec2", AWS_REGION_US_EAST_1, "EC2 - Call", time.monotonic
+        )
+        thread_pool.submit_to_region(
+            "ec2",
+            AWS_REGION_EU_WEST_1,
+            "EC2 - Call",
+            finished.append,
+            AWS_REGION_EU_WEST_1,
+        ).result()
+
+        # Only the throttled region waits, without holding the only thread of the pool
+        assert finished == [AWS_REGION_EU_WEST_1]
+        assert not throttled_future.done()
+        assert (
+            throttled_future.result() - submitted_at >= BACKOFF_BASE_SECONDS * 4 - 0.05
+        )
+
+    def test_get_provider_thread_pool(self):
+        provider = set_mocked_aws_provider()
+
+        thread_pool = get_provider_thread_pool(provider)
+
+        assert get_provider_thread_pool(provider) is thread_pool
+        assert get_provider_thread_pool(set_mocked_aws_provider()) is not thread_pool
+        assert thread_pool.max_workers == DEFAULT_MAX_WORKERS
+        assert thread_pool.max_workers_per_region == DEFAULT_MAX_WORKERS_PER_REGION
+
+    def test_get_provider_thread_pool_audit_config(self):
+        provider = set_mocked_aws_provider(
+            audit_config={
+                "max_service_threads": 4,
+                "max_service_threads_per_region": 2,
+            }
+        )
+
+        thread_pool = get_provider_thread_pool(provider)
+
+        assert thread_pool.max_workers == 4
+        assert thread_pool.max_workers_per_region == 2
+
+    def test_register_throttling_handler(self):
+        provider = set_mocked_aws_provider()
+        client = provider.session.current_session.client(
+            "ec2", region_name=AWS_REGION_EU_WEST_1
+        )
+        thread_pool = AWSThreadPool()
+        register_throttling_handler(client, thread_pool, "ec2")
+
+        # Emitted by botocore after every attempt
+        client.meta.events.emit(
+            "needs-retry.ec2.DescribeInstances",
+            response=(
+                MagicMock(status_code=400),
+                {"Error": {"Code": "RequestLimitExceeded"}},
+            ),
+            attempts=1,
+            caught_exception=None,
+            request_dict={"context": {}},
+        )
+        client.meta.events.emit(
+            "needs-retry.ec2.DescribeInstances",
+            response=(
+                MagicMock(status_code=400),
+                {"Error": {"Code": "InvalidInstanceID.NotFound"}},
+            ),
+            attempts=1,
+            caught_exception=None,
+            request_dict={"context": {}},
+        )
+
+        assert thread_pool.get_throttles() == {("ec2", AWS_REGION_EU_WEST_1): 1}
@@ -0,0 +1,187 @@
+import gzip
+import io
+import json
+import os
+import pickle
+import sys
+import types
+from unittest import mock
+
+import pytest
+from boto3 import client
+from moto import mock_aws
+
+from prowler.config.config import prowler_version
+from prowler.providers.aws.lib.snapshot.snapshot import (
+    SNAPSHOT_VERSION,
+    AwsReplayProvider,
+    ReplayClient,
+    SnapshotUnpickler,
+    get_recorded_services,
+    load_snapshot,
+    save_snapshot,
+)
+from prowler.providers.aws.services.sqs.sqs_service import SQS
+from tests.providers.aws.utils import (
+    AWS_ACCOUNT_NUMBER,
+    AWS_REGION_EU_WEST_1,
+    set_mocked_aws_provider,
+)
+
+SQS_CLIENT_MODULE = "prowler.providers.aws.services.sqs.sqs_client"
+SQS_CHECK_MODULE = "prowler.providers.aws.services.sqs.sqs_queues_not_publicly_accessible.sqs_queues_not_publicly_accessible"
+
+PUBLIC_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": "*",
+            "Action": "sqs:ReceiveMessage",
+            "Resource": "*",
+        }
+    ],
+}
+
+
+@pytest.fixture
+def sqs_snapshot(tmp_path):
+    """Record a snapshot with a public SQS queue"""
+    snapshot_path = str(tmp_path / "snapshot.pkl.gz")
+    with mock_aws():
+        sqs = client("sqs", region_name=AWS_REGION_EU_WEST_1)
+        queue_url = sqs.create_queue(QueueName="replayed")["QueueUrl"]
+        sqs.set_queue_attributes(
+            QueueUrl=queue_url, Attributes={"Policy": json.dumps(PUBLIC_POLICY)}
+        )
+        aws_provider = set_mocked_aws_provider([AWS_REGION_EU_WEST_1])
+        sqs_client = SQS(aws_provider)
+        sqs_client_module = types.ModuleType(SQS_CLIENT_MODULE)
+        sqs_client_module.sqs_client = sqs_client
+
+        with mock.patch.dict(sys.modules, {SQS_CLIENT_MODULE: sqs_client_module}):
+            assert save_snapshot(aws_provider, snapshot_path) >= 1
+
+    yield snapshot_path
+
+
+class Test_Snapshot:
+    def test_get_recorded_services(self):
+        with mock_aws():
+            aws_provider = set_mocked_aws_provider([AWS_REGION_EU_WEST_1])
+            sqs_client = SQS(aws_provider)
+            sqs_client_module = types.ModuleType(SQS_CLIENT_MODULE)
+            sqs_client_module.sqs_client = sqs_client
+
+            with mock.patch.dict(sys.modules, {SQS_CLIENT_MODULE: sqs_client_module}):
+                assert get_recorded_services()[SQS_CLIENT_MODULE] is sqs_client
+
+    def test_load_snapshot(self, sqs_snapshot):
+        snapshot = load_snapshot(sqs_snapshot)
+
+        assert snapshot["Header"]["Version"] == SNAPSHOT_VERSION
+        assert snapshot["Header"]["ProwlerVersion"] == prowler_version
+        assert snapshot["Header"]["Account"] == AWS_ACCOUNT_NUMBER
+        assert snapshot["Identity"].account == AWS_ACCOUNT_NUMBER
+        recorded_sqs = snapshot["Services"][SQS_CLIENT_MODULE]
+        assert recorded_sqs["Class"] == (SQS.__module__, "SQS")
+        assert recorded_sqs["Regions"] == [AWS_REGION_EU_WEST_1]
+        assert len(recorded_sqs["State"]["queues"]) == 1
+        for attribute in ("provider", "session", "client", "thread_pool"):
+            assert attribute not in recorded_sqs["State"]
+
+    def test_load_snapshot_other_version(self, tmp_path):
+        snapshot_path = str(tmp_path / "snapshot.pkl.gz")
+        with gzip.open(snapshot_path, "wb") as f:
+            pickle.dump({"Version": SNAPSHOT_VERSION + 1, "Provider": "aws"}, f)
+            pickle.dump({}, f)
+
+        with pytest.raises(ValueError):
+            load_snapshot(snapshot_path)
+
+    def test_load_snapshot_not_allowed_class(self, tmp_path):
+        class Malicious:
+            def __reduce__(self):
+                return (os.system, ("exit 1",))
+
+        snapshot_path = str(tmp_path / "snapshot.pkl.gz")
+        with gzip.open(snapshot_path, "wb") as f:
+            pickle.dump({"Version": SNAPSHOT_VERSION, "Provider": "aws"}, f)
+            pickle.dump({"Services": Malicious()}, f)
+
+        with mock.patch("os.system") as system, pytest.raises(pickle.UnpicklingError):
+            load_snapshot(snapshot_path)
+        system.assert_not_called()
+
+    def test_snapshot_unpickler_only_loads_prowler_classes(self):
+        assert SnapshotUnpickler(io.BytesIO()).find_class(SQS.__module__, "SQS") is SQS
+        # Module attributes of the Prowler modules that are not their own classes
+        for module, name in (
+            ("prowler.providers.aws.lib.snapshot.snapshot", "os"),
+            ("prowler.providers.aws.lib.snapshot.snapshot", "os.system"),
+            ("prowler.providers.aws.lib.snapshot.snapshot", "load_snapshot"),
+            ("prowler.providers.aws.lib.snapshot.snapshot", "AWSService"),
+            ("builtins", "eval"),
+        ):
+            with pytest.raises(pickle.UnpicklingError):
+                SnapshotUnpickler(io.BytesIO()).find_class(module, name)
+
+    def test_replay_service_not_allowed(self, sqs_snapshot):
+        with mock.patch.dict(sys.modules):
+            replay_provider = AwsReplayProvider(sqs_snapshot)
+            recorded_sqs = load_snapshot(sqs_snapshot)["Services"][SQS_CLIENT_MODULE]
+
+            with pytest.raises(ValueError):
+                replay_provider.replay_service("os", recorded_sqs)
+            with pytest.raises(ValueError):
+                replay_provider.replay_service(
+                    SQS_CLIENT_MODULE,
+                    {**recorded_sqs, "Class": (SQS.__module__, "Queue")},
+                )
+
+    def test_replay_snapshot(self, sqs_snapshot):
+        with mock.patch.dict(sys.modules):
+            sys.modules.pop(SQS_CLIENT_MODULE, None)
+            sys.modules.pop(SQS_CHECK_MODULE, None)
+
+            # Any AWS call would fail since there are no credentials nor mocks
+            replay_provider = AwsReplayProvider(snapshot_path=sqs_snapshot)
+
+            assert replay_provider.identity.account == AWS_ACCOUNT_NUMBER
+            assert replay_provider.replayed_services == {"sqs"}
+
+            from prowler.providers.aws.services.sqs.sqs_client import sqs_client
+
+            assert isinstance(sqs_client, SQS)
+            assert sqs_client.provider is replay_provider
+            assert len(sqs_client.queues) == 1
+            assert isinstance(
+                sqs_client.regional_clients[AWS_REGION_EU_WEST_1], ReplayClient
+            )
+            assert (
+                sqs_client.regional_clients[AWS_REGION_EU_WEST_1].region
+                == AWS_REGION_EU_WEST_1
+            )
+            with pytest.raises(RuntimeError):
+                sqs_client.client.list_queues()
+
+            from prowler.providers.aws.services.sqs.sqs_queues_not_publicly_accessible.sqs_queues_not_publicly_accessible import (
+                sqs_queues_not_publicly_accessible,
+            )
+
+            result = sqs_queues_not_publicly_accessible().execute()
+
+            assert len(result) == 1
+            assert result[0].status == "FAIL"
+            assert result[0].region == AWS_REGION_EU_WEST_1
+
+    def test_get_replayed_checks(self, sqs_snapshot):
+        with mock.patch.dict(sys.modules):
+            replay_provider = AwsReplayProvider(snapshot_path=sqs_snapshot)
+
+            assert replay_provider.get_replayed_checks(
+                {
+                    "sqs_queues_not_publicly_accessible",
+                    "ec2_instance_public_ip",
+                }
+            ) == {"sqs_queues_not_publicly_accessible"}
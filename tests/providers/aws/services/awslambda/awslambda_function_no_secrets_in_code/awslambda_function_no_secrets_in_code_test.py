@@ -53,19 +53,19 @@ def get_lambda_code_with_secrets(code):
     )
 
 
-def mock_get_function_codewith_secrets():
+def mock_get_function_codewith_secrets(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITH_SECRETS
     )
 
 
-def mock_get_function_codewithout_secrets():
+def mock_get_function_codewithout_secrets(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITHOUT_SECRETS
     )
 
 
-def mock_get_function_codewith_metadata_api():
+def mock_get_function_codewith_metadata_api(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITH_METADATA_API
     )
@@ -201,3 +201,54 @@ class Test_awslambda_function_no_secrets_in_code:
                 == f"No secrets found in Lambda function {LAMBDA_FUNCTION_NAME} code."
             )
             assert result[0].resource_tags == []
+
+    def test_function_code_cached(self, tmp_path):
+        lambda_function = create_lambda_function()
+        lambda_function.code_sha256 = "code-sha256"
+        lambda_client = mock.MagicMock
+        lambda_client.functions = {LAMBDA_FUNCTION_ARN: lambda_function}
+        lambda_client.audit_config = {"secrets_ignore_patterns": []}
+        fetched_functions = []
+
+        def mock_get_function_code(functions=None):
+            fetched_functions.extend(functions)
+            for function in functions:
+                yield function, get_lambda_code_with_secrets(
+                    LAMBDA_FUNCTION_CODE_WITH_SECRETS
+                )
+
+        lambda_client._get_function_code = mock_get_function_code
+
+        with (
+            mock.patch(
+                "prowler.providers.common.provider.Provider.get_global_provider",
+                return_value=set_mocked_aws_provider(),
+            ),
+            mock.patch(
+                "prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code.awslambda_client",
+                new=lambda_client,
+            ),
+            mock.patch(
+                "prowler.providers.aws.services.awslambda.lib.code_secrets.DEFAULT_LAMBDA_CODE_SECRETS_CACHE_DIRECTORY",
+                new=str(tmp_path),
+            ),
+        ):
+            # Test Check
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code,
+            )
+
+            check = awslambda_function_no_secrets_in_code()
+            first_result = check.execute()
+            # The unchanged function is neither downloaded nor scanned again
+            second_result = check.execute()
+
+            assert fetched_functions == [lambda_function]
+            assert len(list(tmp_path.iterdir())) == 1
+            assert len(second_result) == 1
+            assert second_result[0].status == "FAIL"
+            assert (
+                second_result[0].status_extended
+                == first_result[0].status_extended
+                == f"Potential secret found in Lambda function {LAMBDA_FUNCTION_NAME} code -> lambda_function.py: Secret Keyword on line 3."
+            )
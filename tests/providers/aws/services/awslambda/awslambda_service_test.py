@@ -38,11 +38,11 @@ def create_zip_file(code: str = "") -> io.BytesIO:
     return zip_output
 
 
-def mock_request_get(_):
+def mock_request_get(_, **kwargs):
     """Mock requests.get() to get the Lambda Code in Zip Format"""
-    mock_resp = mock.MagicMock
+    mock_resp = mock.MagicMock()
     mock_resp.status_code = 200
-    mock_resp.content = create_zip_file().read()
+    mock_resp.iter_content.return_value = [create_zip_file().read()]
     return mock_resp
 
 
@@ -253,3 +253,84 @@ class Test_Lambda_Service:
                             f"{tmp_dir_name}/{files_in_zip[0]}", "r"
                         ) as lambda_code_file:
                             assert lambda_code_file.read() == LAMBDA_FUNCTION_CODE
+
+    @mock_aws
+    def test_get_function_code_over_max_size(self):
+        iam_client = client("iam", region_name=AWS_REGION_EU_WEST_1)
+        iam_role = iam_client.create_role(
+            RoleName="test-lambda-role",
+            AssumeRolePolicyDocument="test-policy",
+            Path="/",
+        )["Role"]["Arn"]
+        lambda_client = client("lambda", region_name=AWS_REGION_EU_WEST_1)
+        lambda_arn = lambda_client.create_function(
+            FunctionName="test-lambda",
+            Runtime="python3.7",
+            Role=iam_role,
+            Handler="lambda_function.lambda_handler",
+            Code={"ZipFile": create_zip_file().read()},
+            PackageType="ZIP",
+        )["FunctionArn"]
+
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.get",
+            new=mock_request_get,
+        ):
+            awslambda = Lambda(
+                set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+            )
+            function = awslambda.functions[lambda_arn]
+            assert function.code_sha256
+            assert function.code_size
+
+            # The listed size is over the limit, so the code is not downloaded
+            awslambda.audit_config = {"lambda_code_max_size_mb": 0}
+            assert list(awslambda._get_function_code()) == []
+
+            # The downloaded size is over the limit
+            function.code_size = None
+            assert list(awslambda._get_function_code()) == []
+
+            awslambda.audit_config = {}
+            assert [
+                function.arn for function, _ in awslambda._get_function_code([function])
+            ] == [lambda_arn]
+
+    @mock_aws
+    def test_get_function_code_over_spool_size(self):
+        iam_client = client("iam", region_name=AWS_REGION_EU_WEST_1)
+        iam_role = iam_client.create_role(
+            RoleName="test-lambda-role",
+            AssumeRolePolicyDocument="test-policy",
+            Path="/",
+        )["Role"]["Arn"]
+        lambda_client = client("lambda", region_name=AWS_REGION_EU_WEST_1)
+        lambda_client.create_function(
+            FunctionName="test-lambda",
+            Runtime="python3.7",
+            Role=iam_role,
+            Handler="lambda_function.lambda_handler",
+            Code={"ZipFile": create_zip_file().read()},
+            PackageType="ZIP",
+        )
+
+        with (
+            mock.patch(
+                "prowler.providers.aws.services.awslambda.awslambda_service.requests.get",
+                new=mock_request_get,
+            ),
+            mock.patch(
+                "prowler.providers.aws.services.awslambda.awslambda_service.LAMBDA_CODE_SPOOL_SIZE",
+                1,
+            ),
+        ):
+            awslambda = Lambda(
+                set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+            )
+            function_codes = list(awslambda._get_function_code())
+
+        # The code is written to a temporary file and read from it
+        assert len(function_codes) == 1
+        code_zip = function_codes[0][1].code_zip
+        assert not isinstance(code_zip.fp, io.BytesIO)
+        assert code_zip.read("lambda_function.py").decode() == LAMBDA_FUNCTION_CODE
@@ -0,0 +1,110 @@
+import io
+import zipfile
+
+from mock import patch
+
+from prowler.lib.utils.utils import SecretsScanner
+from prowler.providers.aws.services.awslambda.lib.code_secrets import (
+    LambdaCodeSecretsCache,
+    scan_code_secrets,
+)
+
+
+def create_code_zip(files: dict) -> zipfile.ZipFile:
+    zip_output = io.BytesIO()
+    with zipfile.ZipFile(zip_output, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for filename, content in files.items():
+            zip_file.writestr(filename, content)
+    zip_output.seek(0)
+    return zipfile.ZipFile(zip_output)
+
+
+class Test_scan_code_secrets:
+    def test_scan_root_files(self):
+        code_zip = create_code_zip(
+            {
+                "lambda_function.py": 'db_password = "test-password"\n',
+                "config.py": 'print("hello")\n',
+                "package/module.py": 'db_password = "test-password"\n',
+                "binary.bin": b"\xff\xfe\x00password=password",
+            }
+        )
+
+        assert scan_code_secrets(code_zip, SecretsScanner()) == {
+            "lambda_function.py": [{"type": "Secret Keyword", "line_number": 1}]
+        }
+
+    def test_scan_in_batches(self):
+        code_zip = create_code_zip(
+            {
+                "lambda_function.py": 'db_password = "test-password"\n',
+                "config.py": 'print("hello")\n',
+                "settings.py": 'db_password = "test-password"\n',
+            }
+        )
+        secrets_scanner = SecretsScanner()
+
+        with (
+            patch(
+                "prowler.providers.aws.services.awslambda.lib.code_secrets.LAMBDA_CODE_SCAN_BATCH_SIZE",
+                1,
+            ),
+            patch.object(
+                secrets_scanner, "scan_files", wraps=secrets_scanner.scan_files
+            ) as scan_files,
+        ):
+            code_secrets = scan_code_secrets(code_zip, secrets_scanner)
+
+        # Every file is scanned on its own
+        assert scan_files.call_count == 3
+        assert code_secrets == {
+            "lambda_function.py": [{"type": "Secret Keyword", "line_number": 1}],
+            "settings.py": [{"type": "Secret Keyword", "line_number": 1}],
+        }
+
+    def test_scan_no_secrets(self):
+        code_zip = create_code_zip({"lambda_function.py": 'print("hello")\n'})
+
+        assert scan_code_secrets(code_zip, SecretsScanner()) == {}
+
+
+class Test_LambdaCodeSecretsCache:
+    def test_put_and_get(self, tmp_path):
+        settings = SecretsScanner().settings
+        code_secrets = {
+            "lambda_function.py": [{"type": "Secret Keyword", "line_number": 1}]
+        }
+        cache = LambdaCodeSecretsCache(settings, cache_dir=str(tmp_path))
+
+        assert cache.get("code-sha256") is None
+        cache.put("code-sha256", code_secrets)
+        cache.put("other-code-sha256", {})
+
+        assert cache.get("code-sha256") == code_secrets
+        assert cache.get("other-code-sha256") == {}
+        assert (
+            LambdaCodeSecretsCache(settings, cache_dir=str(tmp_path)).get("code-sha256")
+            == code_secrets
+        )
+
+    def test_different_settings(self, tmp_path):
+        cache = LambdaCodeSecretsCache(
+            SecretsScanner().settings, cache_dir=str(tmp_path)
+        )
+        cache.put("code-sha256", {})
+
+        other_settings_cache = LambdaCodeSecretsCache(
+            SecretsScanner(excluded_secrets=["password"]).settings,
+            cache_dir=str(tmp_path),
+        )
+        assert other_settings_cache.get("code-sha256") is None
+
+    def test_corrupted_file(self, tmp_path):
+        cache = LambdaCodeSecretsCache(
+            SecretsScanner().settings, cache_dir=str(tmp_path)
+        )
+        cache.put("code-sha256", {})
+        for path in tmp_path.iterdir():
+            path.write_text("{")
+
+        assert cache.get("code-sha256") is None
@@ -93,6 +93,31 @@ class Test_IAM_Service:
         iam = IAM(aws_provider)
         assert iam.session.__class__.__name__ == "Session"
 
+    # Test IAM Lazy Discovery
+    @mock_aws
+    def test_lazy_discovery(self):
+        iam_client = client("iam")
+        iam_client.create_user(UserName="user1")
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        with (
+            patch.object(IAM, "_get_users", wraps=IAM._get_users, autospec=True) as (
+                mock_get_users
+            ),
+            patch.object(
+                IAM, "_get_account_summary", return_value={}, autospec=True
+            ) as mock_get_account_summary,
+        ):
+            iam = IAM(aws_provider)
+            mock_get_users.assert_not_called()
+
+            assert iam.account_summary == {}
+            mock_get_account_summary.assert_called_once()
+            mock_get_users.assert_not_called()
+
+            assert [user.name for user in iam.users] == ["user1"]
+            assert iam.users is iam.users
+            mock_get_users.assert_called_once()
+
     # Test IAM Get Credential Report
     @freeze_time(TEST_DATETIME)
     @mock_aws